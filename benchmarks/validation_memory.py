@@ -0,0 +1,87 @@
+"""
+Measures memory used per resource when a list response with many users is normalized
+and validated. Run with `python benchmarks/validation_memory.py [number of resources]`.
+"""
+
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+from scimpler.config import ServiceProviderConfig
+from scimpler.data import ScimData
+from scimpler.schemas import EnterpriseUserSchemaExtension, UserSchema
+from scimpler.validator import ResourcesQuery
+
+
+def _user(i: int) -> dict[str, Any]:
+    return {
+        "schemas": [
+            "urn:ietf:params:scim:schemas:core:2.0:User",
+            "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User",
+        ],
+        "id": f"2819c223-7f76-453a-919d-{i:012}",
+        "externalId": str(i),
+        "userName": f"user{i}@example.com",
+        "name": {"formatted": f"User {i}", "familyName": "Jensen", "givenName": f"User{i}"},
+        "displayName": f"User {i}",
+        "emails": [
+            {"value": f"user{i}@example.com", "type": "work", "primary": True},
+            {"value": f"user{i}@home.org", "type": "home"},
+        ],
+        "phoneNumbers": [{"value": "555-555-5555", "type": "work"}],
+        "groups": [
+            {
+                "value": "e9e30dba-f08f-4109-8486-d5c6a331660a",
+                "$ref": "../Groups/e9e30dba-f08f-4109-8486-d5c6a331660a",
+                "display": "Employees",
+            }
+        ],
+        "active": True,
+        "meta": {
+            "resourceType": "User",
+            "created": "2010-01-23T04:56:22+00:00",
+            "lastModified": "2011-05-13T04:42:34+00:00",
+            "version": f'W/"{i}"',
+            "location": f"https://example.com/v2/Users/2819c223-7f76-453a-919d-{i:012}",
+        },
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {
+            "employeeNumber": str(i),
+            "manager": {"value": "26118915-6090-4610-87e4-49d8ca9f808d"},
+        },
+    }
+
+
+def _list_response(n: int) -> dict[str, Any]:
+    return {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:ListResponse"],
+        "totalResults": n,
+        "Resources": [_user(i) for i in range(n)],
+    }
+
+
+def _measure(func: Callable[[], Any]) -> tuple[int, int]:
+    tracemalloc.start()
+    try:
+        result = func()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained, peak
+
+
+def main(n: int = 10_000) -> None:
+    user_schema = UserSchema()
+    user_schema.extend(EnterpriseUserSchemaExtension(), required=True)
+    validator = ResourcesQuery(ServiceProviderConfig.create(), resource_schema=user_schema)
+    body = _list_response(n)
+    validator.validate_response(status_code=200, body=_list_response(10))  # warm up caches
+
+    retained, _ = _measure(lambda: ScimData(body))
+    print(f"ScimData:   {retained / n:10.1f} B retained per resource")
+    _, peak = _measure(lambda: validator.validate_response(status_code=200, body=body))
+    print(f"validation: {peak / n:10.1f} B peak per resource")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
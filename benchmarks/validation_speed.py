@@ -0,0 +1,100 @@
+"""
+Measures time of validating a clean user resource, with and without presence checks.
+Run with `python benchmarks/validation_speed.py [number of validations]`.
+"""
+
+import sys
+import timeit
+from typing import Any, Callable
+
+from scimpler.data import AttrValuePresenceConfig
+from scimpler.schemas import EnterpriseUserSchemaExtension, UserSchema
+
+USER: dict[str, Any] = {
+    "schemas": [
+        "urn:ietf:params:scim:schemas:core:2.0:User",
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User",
+    ],
+    "id": "2819c223-7f76-453a-919d-413861904646",
+    "externalId": "701984",
+    "userName": "bjensen@example.com",
+    "name": {
+        "formatted": "Ms. Barbara J Jensen, III",
+        "familyName": "Jensen",
+        "givenName": "Barbara",
+        "middleName": "Jane",
+        "honorificPrefix": "Ms.",
+        "honorificSuffix": "III",
+    },
+    "displayName": "Babs Jensen",
+    "nickName": "Babs",
+    "profileUrl": "https://login.example.com/bjensen",
+    "emails": [
+        {"value": "bjensen@example.com", "type": "work", "primary": True},
+        {"value": "babs@jensen.org", "type": "home"},
+    ],
+    "addresses": [
+        {
+            "type": "work",
+            "streetAddress": "100 Universal City Plaza",
+            "locality": "Hollywood",
+            "region": "CA",
+            "postalCode": "91608",
+            "country": "US",
+            "formatted": "100 Universal City Plaza\nHollywood, CA 91608 USA",
+            "primary": True,
+        }
+    ],
+    "phoneNumbers": [
+        {"value": "555-555-5555", "type": "work"},
+        {"value": "555-555-4444", "type": "mobile"},
+    ],
+    "groups": [
+        {
+            "value": "e9e30dba-f08f-4109-8486-d5c6a331660a",
+            "$ref": "../Groups/e9e30dba-f08f-4109-8486-d5c6a331660a",
+            "display": "Tour Guides",
+        }
+    ],
+    "userType": "Employee",
+    "title": "Tour Guide",
+    "preferredLanguage": "en-US",
+    "locale": "en-US",
+    "timezone": "America/Los_Angeles",
+    "active": True,
+    "meta": {
+        "resourceType": "User",
+        "created": "2010-01-23T04:56:22+00:00",
+        "lastModified": "2011-05-13T04:42:34+00:00",
+        "version": 'W/"3694e05e9dff591"',
+        "location": "https://example.com/v2/Users/2819c223-7f76-453a-919d-413861904646",
+    },
+    "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {
+        "employeeNumber": "701984",
+        "costCenter": "4130",
+        "organization": "Universal Studios",
+        "division": "Theme Park",
+        "department": "Tour Operations",
+        "manager": {"value": "26118915-6090-4610-87e4-49d8ca9f808d", "displayName": "John Smith"},
+    },
+}
+
+
+def _measure(func: Callable[[], Any], n: int) -> float:
+    return min(timeit.repeat(func, number=n, repeat=5)) / n
+
+
+def main(n: int = 1_000) -> None:
+    schema = UserSchema()
+    schema.extend(EnterpriseUserSchemaExtension(), required=True)
+    presence_config = AttrValuePresenceConfig("RESPONSE")
+    assert not schema.validate(USER, presence_config).to_dict()
+
+    elapsed = _measure(lambda: schema.validate(USER), n)
+    print(f"validation:               {elapsed * 1e6:8.1f} us per resource")
+    elapsed = _measure(lambda: schema.validate(USER, presence_config), n)
+    print(f"validation with presence: {elapsed * 1e6:8.1f} us per resource")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
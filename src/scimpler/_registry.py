@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from scimpler.data.identifiers import SchemaUri
@@ -8,6 +8,20 @@ if TYPE_CHECKING:
 
 resources: dict[str, str] = {}
 schemas: dict[str, bool] = {}
+_change_listeners: list[Callable[[], None]] = []
+
+
+def on_change(listener: Callable[[], None]):
+    """
+    Registers a callable that is called every time a schema or an operator is registered
+    or redefined. Used to invalidate caches that depend on the registry content.
+    """
+    _change_listeners.append(listener)
+
+
+def _notify_change():
+    for listener in _change_listeners:
+        listener()
 
 
 def register_resource_schema(resource_schema: "ResourceSchema"):
@@ -22,7 +36,10 @@ def register_resource_schema(resource_schema: "ResourceSchema"):
 def register_schema(schema: "SchemaUri", extension: bool = False):
     if schema.lower().startswith("urn:ietf:params:scim:api:messages:2.0:") and schema in schemas:
         raise RuntimeError("schemas for SCIM API messages can not be overridden")
+    changed = schemas.get(schema) != extension
     schemas[schema] = extension
+    if changed:
+        _notify_change()
 
 
 unary_operators: dict[str, type["UnaryAttributeOperator"]] = {}
@@ -35,6 +52,8 @@ def register_unary_operator(operator: type["UnaryAttributeOperator"]):
     if existing_operator is not None and existing_operator != operator:
         raise RuntimeError(f"different implementation for unary operator {op!r} already provided")
     unary_operators[op] = operator
+    if existing_operator is None:
+        _notify_change()
 
 
 def register_binary_operator(operator: type["BinaryAttributeOperator"]):
@@ -43,3 +62,5 @@ def register_binary_operator(operator: type["BinaryAttributeOperator"]):
     if existing_operator is not None and existing_operator != operator:
         raise RuntimeError(f"different implementation for binary operator {op!r} already provided")
     binary_operators[op] = operator
+    if existing_operator is None:
+        _notify_change()
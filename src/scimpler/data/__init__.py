@@ -23,10 +23,11 @@ from scimpler.data.identifiers import (
     BoundedAttrRep,
     SchemaUri,
 )
+from scimpler.data.index import ResourceIndex
 from scimpler.data.patch_path import PatchPath
 from scimpler.data.schemas import ResourceSchema, SchemaExtension
 from scimpler.data.scim_data import Missing, ScimData
-from scimpler.data.sorter import Sorter
+from scimpler.data.sorter import CompositeSorter, Sorter
 
 __all__ = [
     "AttrName",
@@ -52,8 +53,10 @@ __all__ = [
     "ResourceSchema",
     "SchemaExtension",
     "Filter",
+    "ResourceIndex",
     "PatchPath",
     "Sorter",
+    "CompositeSorter",
     "ScimData",
     "Missing",
 ]
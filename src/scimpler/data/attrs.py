@@ -24,6 +24,7 @@ import precis_i18n.profile
 from precis_i18n import get_profile
 
 from scimpler._registry import resources
+from scimpler.data.cache import LRUCache
 from scimpler.data.constants import SCIMType
 from scimpler.data.identifiers import (
     AttrName,
@@ -32,7 +33,7 @@ from scimpler.data.identifiers import (
     BoundedAttrRep,
     SchemaUri,
 )
-from scimpler.data.scim_data import Invalid, Missing, ScimData
+from scimpler.data.scim_data import Invalid, Missing, ScimData, mask_invalid
 from scimpler.error import ValidationError, ValidationIssues, ValidationWarning
 
 if TYPE_CHECKING:
@@ -335,7 +336,7 @@ class Attribute(abc.ABC):
             return True
         return value in self._canonical_values
 
-    def _validate_type(self, value: Any) -> ValidationIssues:
+    def _validate_type(self, value: Any, max_errors: Optional[int] = None) -> ValidationIssues:
         issues = ValidationIssues()
         if self.multi_valued:
             if not isinstance(value, list):
@@ -351,7 +352,9 @@ class Attribute(abc.ABC):
                     location=[i],
                 )
                 if not issues_.can_proceed():
-                    value[i] = Invalid
+                    issues.mark_invalid([i])
+                if issues.limit_reached(max_errors):
+                    break
             return issues
         issues.merge(self._validate_value_type(value))
         return issues
@@ -365,12 +368,18 @@ class Attribute(abc.ABC):
             )
         return issues
 
-    def validate(self, value: Any) -> ValidationIssues:
+    def validate(self, value: Any, max_errors: Optional[int] = None) -> ValidationIssues:
         """
         Validates the provided value according to attribute's specification.
         It validates the type and canonicality (if specified). If no validation issues,
         custom validators (passed as `validators` constructor parameter) are run.
 
+        Args:
+            value: The value to be validated.
+            max_errors: If specified, items of multi-valued attribute are not validated
+                any further, and custom validators are not run, once `max_errors` errors
+                are found.
+
         Returns:
             Validation issues
         """
@@ -378,24 +387,26 @@ class Attribute(abc.ABC):
         if value in [None, Missing]:
             return issues
 
-        issues.merge(self._validate_type(value))
-        if not issues.can_proceed():
+        issues.merge(self._validate_type(value, max_errors))
+        if not issues.can_proceed() or issues.limit_reached(max_errors):
             return issues
 
         if self._multi_valued:
             for i, item in enumerate(value):
-                if item is Invalid:
+                if issues.is_invalid([i]):
                     continue
                 issues_ = self._validate(item)
                 issues.merge(issues=issues_, location=[i])
                 if not issues_.can_proceed():
-                    value[i] = Invalid
+                    issues.mark_invalid([i])
+                if issues.limit_reached(max_errors):
+                    return issues
         else:
             issues.merge(self._validate(value))
         for validator in self._validators:
-            if not issues.can_proceed():
+            if not issues.can_proceed() or issues.limit_reached(max_errors):
                 break
-            issues.merge(validator(value))
+            issues.merge(validator(mask_invalid(value, issues)))
         return issues
 
     def _validate(self, value: Any) -> ValidationIssues:
@@ -645,6 +656,7 @@ class String(AttributeWithCaseExact, AttributeWithUniqueness):
         """
         super().__init__(name=name, **kwargs)
         self._precis: precis_i18n.profile.Profile = get_profile(precis)
+        self.get_precis_cache(self._precis.name)
 
     @property
     def precis(self) -> precis_i18n.profile.Profile:
@@ -653,6 +665,71 @@ class String(AttributeWithCaseExact, AttributeWithUniqueness):
         """
         return self._precis
 
+    def __getstate__(self) -> dict[str, Any]:
+        # PRECIS profiles can not be pickled, so they are restored by name
+        state = self.__dict__.copy()
+        state["_precis"] = self._precis.name
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._precis = get_profile(state["_precis"])
+
+    @staticmethod
+    def get_precis_cache(profile: str) -> LRUCache[str, Union[str, UnicodeEncodeError]]:
+        """
+        Returns the cache of values enforced with the provided PRECIS `profile`. The cache is
+        shared by all string attributes that use the profile, and can be resized and inspected.
+        Values not allowed by the profile are cached too, together with the enforcement error.
+
+        Args:
+            profile: Name of the PRECIS profile.
+
+        Returns:
+            The cache of enforced values.
+
+        Examples:
+            >>> String.get_precis_cache("UsernameCaseMapped").maxsize = 100_000
+            >>> String.get_precis_cache("UsernameCaseMapped").info()
+            CacheInfo(hits=0, misses=0, maxsize=100000, currsize=0)
+        """
+        name = get_profile(profile).name
+        cache = _precis_caches.get(name)
+        if cache is None:
+            cache = _precis_caches.setdefault(name, LRUCache(maxsize=4096))
+        return cache
+
+    def enforce_precis(self, value: str) -> str:
+        """
+        Enforces the attribute's PRECIS profile on the provided `value`. Enforcement is
+        expensive, so the results are cached, see `String.get_precis_cache`.
+
+        Args:
+            value: The value to enforce the profile on.
+
+        Returns:
+            The enforced value.
+
+        Raises:
+            UnicodeEncodeError: If the value is not allowed by the profile.
+        """
+        profile = self._precis
+
+        def enforce() -> Union[str, UnicodeEncodeError]:
+            try:
+                return profile.enforce(value)
+            except UnicodeEncodeError as error:
+                return error
+
+        enforced = _precis_caches[profile.name].get_or_set(value, enforce)
+        if isinstance(enforced, UnicodeEncodeError):
+            # new error is raised, so tracebacks do not pile up on the cached one
+            raise UnicodeEncodeError(*enforced.args)
+        return enforced
+
+
+_precis_caches: dict[str, LRUCache[str, Union[str, UnicodeEncodeError]]] = {}
+
 
 @final
 class Binary(AttributeWithCaseExact):
@@ -998,14 +1075,14 @@ class Complex(Attribute):
 
     def _validate(self, value: MutableMapping[str, Any]) -> ValidationIssues:
         issues = ValidationIssues()
-        value = ScimData(value)
+        value = ScimData.view(value)
         for name, sub_attr in self._sub_attributes:
             sub_attr_value = value.get(name)
             if sub_attr_value is Missing:
                 continue
             issues_ = sub_attr.validate(sub_attr_value)
             if not issues_.can_proceed():
-                value.set(name, Invalid)
+                issues_.mark_invalid()
             issues.merge(
                 location=[name],
                 issues=issues_,
@@ -1228,6 +1305,10 @@ class BoundedAttrs:
         Returns:
             Bounded attribute representation for the given (sub-)attribute name
         """
+        if name.startswith("_"):
+            # attribute names start with a letter, so e.g. special methods looked up when
+            # unpickling are not confused with them
+            raise AttributeError(name)
         parts = name.split("__", 1)
         n_parts = len(parts)
         attr_name = parts[0].lower()
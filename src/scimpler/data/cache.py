@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, NamedTuple, Optional, TypeVar
+
+TKey = TypeVar("TKey", bound=Hashable)
+TValue = TypeVar("TValue")
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of `LRUCache`.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of lookups served from the cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache(Generic[TKey, TValue]):
+    """
+    Bounded, thread-safe cache that evicts the least recently used entries once `maxsize`
+    is reached. Used to share the results of parsing the same expressions (filters, patch paths,
+    attribute representations) over and over again.
+
+    Cached values are shared between callers, so they must not be modified, unless `copy`
+    routine is provided.
+
+    Examples:
+        >>> from scimpler.data import Filter
+        >>>
+        >>> Filter.deserialize_cache.maxsize = 1024
+        >>> username_filter = Filter.deserialize("userName eq 'Pagerous'")
+        >>> Filter.deserialize_cache.info()
+        CacheInfo(hits=0, misses=1, maxsize=1024, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 128, copy: Optional[Callable[[TValue], TValue]] = None):
+        """
+        Args:
+            maxsize: Maximum number of cached entries. Caching is disabled if set to `0`.
+            copy: Routine applied to every value returned from the cache. Should be provided
+                if callers are allowed to modify the returned values.
+        """
+        self._maxsize = self._validate_maxsize(maxsize)
+        self._copy = copy
+        self._data: OrderedDict[TKey, TValue] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def _validate_maxsize(maxsize: int) -> int:
+        if maxsize < 0:
+            raise ValueError("'maxsize' must be greater or equal to 0")
+        return maxsize
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Maximum number of cached entries. If lowered, the least recently used entries are evicted.
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = self._validate_maxsize(maxsize)
+            self._evict()
+
+    def get_or_set(self, key: TKey, factory: Callable[[], TValue]) -> TValue:
+        """
+        Returns the value cached under the `key`. If there is no such value, it is produced
+        by the `factory`, cached, and returned. Exceptions raised by the `factory` are propagated
+        and nothing is cached.
+        """
+        with self._lock:
+            if key in self._data:
+                self._hits += 1
+                self._data.move_to_end(key)
+                value = self._data[key]
+                return value if self._copy is None else self._copy(value)
+            self._misses += 1
+
+        value = factory()
+        with self._lock:
+            if self._maxsize > 0:
+                self._data[key] = value
+                self._data.move_to_end(key)
+                self._evict()
+        return value if self._copy is None else self._copy(value)
+
+    def _evict(self) -> None:
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all cached entries. Statistics are preserved.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def info(self) -> CacheInfo:
+        """
+        Returns cache statistics.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._maxsize,
+                currsize=len(self._data),
+            )
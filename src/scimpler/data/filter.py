@@ -2,9 +2,12 @@ import re
 from dataclasses import dataclass
 from typing import (
     Any,
+    Callable,
     Generic,
+    Hashable,
     Iterable,
     MutableMapping,
+    NamedTuple,
     Optional,
     Type,
     TypeVar,
@@ -14,11 +17,17 @@ from typing import (
 
 from typing_extensions import TypeAlias
 
-from scimpler._registry import binary_operators, unary_operators
+from scimpler._registry import binary_operators, on_change, unary_operators
 from scimpler.data import operator as op
-from scimpler.data.attrs import Complex
+from scimpler.data.attrs import (
+    AttributeUniqueness,
+    AttributeWithUniqueness,
+    Complex,
+    String,
+)
+from scimpler.data.cache import LRUCache
 from scimpler.data.identifiers import AttrRep, AttrRepFactory, BoundedAttrRep
-from scimpler.data.schemas import BaseSchema
+from scimpler.data.schemas import BaseSchema, ResourceSchema
 from scimpler.data.scim_data import ScimData
 from scimpler.data.utils import (
     OP_REGEX,
@@ -36,6 +45,12 @@ NOT_LOGICAL_OPERATOR_REGEX = re.compile(r"\s*\bnot\b\s*(.*)", flags=re.DOTALL)
 COMPLEX_OPERATOR_REGEX = re.compile(r"([\w:.]+)\[(.*?)]", flags=re.DOTALL)
 GROUP_OPERATOR_REGEX = re.compile(r"\((?:[^()]|\([^()]*\))*\)", flags=re.DOTALL)
 
+_TOKEN_REGEX = re.compile(r"(\s*)(?:([()\[\]])|(\"[^\"]*\"|'[^']*')|([^\s()\[\]\"']+))")
+_WHITESPACE_REGEX = re.compile(r"\s*")
+_EMBEDDED_KEYWORD_REGEX = re.compile(r"\b(?:and|or)\b|^not\b")
+_COMPLEX_ATTR_REP_REGEX = re.compile(r"[\w:.]+")
+_KEYWORDS = frozenset(["and", "or", "not"])
+
 _AllowedOperandValues: TypeAlias = Union[str, bool, int, float, None]
 
 
@@ -56,6 +71,562 @@ class _ValidatedGroupOperator:
     placeholder: str
 
 
+class _UnsupportedSyntax(Exception):
+    pass
+
+
+class _Token(NamedTuple):
+    kind: str  # one of "(", ")", "[", "]", "string", "word"
+    value: str
+    glued: bool  # whether the token directly follows the previous one, without whitespace
+
+
+class _Parser:
+    """
+    Single-pass recursive-descent parser of filter expressions. Tokenizes the expression once,
+    then validates it and builds the operator tree at the same time, in linear time.
+
+    It accepts only well-formed expressions which are unambiguous under the rules implemented
+    by `Filter` validation and gives up (by raising `_UnsupportedSyntax`) on anything else, so
+    the issues can still be reported by the validation routines with the same codes
+    and contexts.
+    """
+
+    def __init__(self, filter_exp: str, check_schemas: bool):
+        self._tokens = self._tokenize(filter_exp)
+        self._pos = 0
+        self._check_schemas = check_schemas
+
+    @staticmethod
+    def _tokenize(filter_exp: str) -> list[_Token]:
+        tokens: list[_Token] = []
+        pos = 0
+        while match := _TOKEN_REGEX.match(filter_exp, pos):
+            whitespace, bracket, string, word = match.groups()
+            glued = bool(tokens) and not whitespace
+            if bracket is not None:
+                tokens.append(_Token(kind=bracket, value=bracket, glued=glued))
+            else:
+                if glued and tokens[-1].kind in ("string", "word"):
+                    # string values glued to other values, like '"a""b"' or 'eq"a"'
+                    raise _UnsupportedSyntax
+                if string is not None:
+                    tokens.append(_Token(kind="string", value=string, glued=glued))
+                else:
+                    if word not in _KEYWORDS and _EMBEDDED_KEYWORD_REGEX.search(word):
+                        raise _UnsupportedSyntax
+                    tokens.append(_Token(kind="word", value=word, glued=glued))
+            pos = match.end()
+        if _WHITESPACE_REGEX.fullmatch(filter_exp, pos) is None:
+            # unterminated string value
+            raise _UnsupportedSyntax
+        return tokens
+
+    def parse(self) -> op.Operator:
+        operator = self._parse_or(in_complex=False)
+        if self._peek() is not None:
+            raise _UnsupportedSyntax
+        return operator
+
+    def _peek(self) -> Optional[_Token]:
+        if self._pos < len(self._tokens):
+            return self._tokens[self._pos]
+        return None
+
+    def _next(self) -> _Token:
+        token = self._peek()
+        if token is None:
+            raise _UnsupportedSyntax
+        self._pos += 1
+        return token
+
+    def _accept_keyword(self, keyword: str) -> bool:
+        token = self._peek()
+        if token is not None and token.kind == "word" and token.value == keyword:
+            self._pos += 1
+            return True
+        return False
+
+    def _expect(self, kind: str) -> None:
+        if self._next().kind != kind:
+            raise _UnsupportedSyntax
+
+    def _parse_or(self, in_complex: bool) -> op.Operator:
+        operands = [self._parse_and(in_complex)]
+        while self._accept_keyword("or"):
+            operands.append(self._parse_and(in_complex))
+        if len(operands) == 1:
+            return operands[0]
+        return op.Or(*operands)
+
+    def _parse_and(self, in_complex: bool) -> op.Operator:
+        operands = [self._parse_not(in_complex)]
+        while self._accept_keyword("and"):
+            operands.append(self._parse_not(in_complex))
+        if len(operands) == 1:
+            return operands[0]
+        return op.And(*operands)
+
+    def _parse_not(self, in_complex: bool) -> op.Operator:
+        if self._accept_keyword("not"):
+            return op.Not(self._parse_operand(in_complex))
+        return self._parse_operand(in_complex)
+
+    def _parse_operand(self, in_complex: bool) -> op.Operator:
+        token = self._next()
+        if token.kind == "(":
+            operator = self._parse_or(in_complex)
+            self._expect(")")
+            return operator
+        if token.kind != "word" or token.value in _KEYWORDS:
+            raise _UnsupportedSyntax
+        following = self._peek()
+        if following is not None and following.kind == "[" and following.glued:
+            if in_complex:
+                raise _UnsupportedSyntax
+            self._pos += 1
+            return self._parse_complex_operator(token.value)
+        return self._parse_attribute_operator(token.value, in_complex)
+
+    def _parse_complex_operator(self, attr_rep_exp: str) -> op.ComplexAttributeOperator:
+        if not _COMPLEX_ATTR_REP_REGEX.fullmatch(attr_rep_exp):
+            raise _UnsupportedSyntax
+        attr_rep = AttrRepFactory.deserialize(attr_rep_exp)
+        if isinstance(attr_rep, AttrRep) and attr_rep.is_sub_attr:
+            raise _UnsupportedSyntax
+        sub_operator = self._parse_or(in_complex=True)
+        self._expect("]")
+        return op.ComplexAttributeOperator(
+            attr_rep=attr_rep,
+            sub_operator=cast(Union[op.AttributeOperator, op.LogicalOperator], sub_operator),
+        )
+
+    def _parse_attribute_operator(
+        self, attr_rep_exp: str, in_complex: bool
+    ) -> op.AttributeOperator:
+        op_token = self._next()
+        if op_token.kind != "word" or op_token.value in _KEYWORDS:
+            raise _UnsupportedSyntax
+        op_exp = op_token.value.lower()
+        attr_rep = self._parse_attr_rep(attr_rep_exp, in_complex)
+
+        value_token = self._peek()
+        if (
+            value_token is None
+            or value_token.kind in (")", "]")
+            or value_token.kind == "word"
+            and value_token.value in ("and", "or")
+        ):
+            unary_op = unary_operators.get(op_exp)
+            if unary_op is None:
+                raise _UnsupportedSyntax
+            return unary_op(attr_rep)
+
+        self._pos += 1
+        binary_op = binary_operators.get(op_exp)
+        if (
+            binary_op is None
+            or value_token.kind not in ("string", "word")
+            or value_token.value in _KEYWORDS
+        ):
+            raise _UnsupportedSyntax
+        try:
+            value = deserialize_comparison_value(value_token.value)
+        except (ValueError, OverflowError):
+            raise _UnsupportedSyntax
+        if type(value) not in binary_op.supported_types:
+            raise _UnsupportedSyntax
+        return binary_op(attr_rep, value)
+
+    def _parse_attr_rep(self, attr_rep_exp: str, in_complex: bool) -> AttrRep:
+        if self._check_schemas and AttrRepFactory.validate(attr_rep_exp).has_errors():
+            raise _UnsupportedSyntax
+        attr_rep = AttrRepFactory.deserialize(attr_rep_exp)
+        if in_complex and isinstance(attr_rep, AttrRep):
+            attr_rep = AttrRep(attr=attr_rep.sub_attr if attr_rep.is_sub_attr else attr_rep.attr)
+        return attr_rep
+
+    @classmethod
+    def try_parse(cls, filter_exp: str, check_schemas: bool) -> Optional[op.Operator]:
+        """
+        Returns the operator tree, or `None` if the expression is not supported by the parser.
+        If `check_schemas` is set, bounded attributes must belong to registered schemas.
+        """
+        try:
+            return cls(filter_exp, check_schemas).parse()
+        except (_UnsupportedSyntax, ValueError, TypeError, RecursionError):
+            return None
+
+
+def _operator_key(operator: op.Operator, value_types: bool = True) -> Hashable:
+    """
+    Returns the structural key of the operator. If `value_types` is set, operators with equal
+    keys match the same data. Otherwise, values of different types that are equal (e.g. 'True'
+    and '1') give equal keys, as in `Filter` equality.
+    """
+    if isinstance(operator, op.BinaryAttributeOperator):
+        return (
+            type(operator),
+            type(operator.attr_rep),
+            operator.attr_rep,
+            type(operator.value) if value_types else None,
+            operator.value,
+        )
+    if isinstance(operator, op.AttributeOperator):
+        return type(operator), type(operator.attr_rep), operator.attr_rep
+    if isinstance(operator, op.ComplexAttributeOperator):
+        return (
+            type(operator),
+            type(operator.attr_rep),
+            operator.attr_rep,
+            _operator_key(operator.sub_operator, value_types),
+        )
+    if isinstance(operator, op.LogicalOperator):
+        return type(operator), tuple(
+            _operator_key(item, value_types) for item in operator.sub_operators
+        )
+    return id(operator)
+
+
+class _Estimate(NamedTuple):
+    cost: float
+    selectivity: float  # expected fraction of matching data items
+
+
+class _Optimizer:
+    """
+    Rewrites the operator tree into an equivalent one that is cheaper to evaluate. Nested
+    logical operators of the same type are flattened, duplicated operands are dropped, double
+    negations are removed, and operands of `and` and `or` operators are ordered, so the ones
+    that are cheap and likely to short-circuit the evaluation go first. Since operators have no
+    side effects, the order of operands does not change the result.
+    """
+
+    operator_costs = {
+        "pr": 1.0,
+        "eq": 2.0,
+        "ne": 2.0,
+        "gt": 3.0,
+        "ge": 3.0,
+        "lt": 3.0,
+        "le": 3.0,
+        "sw": 4.0,
+        "ew": 4.0,
+        "co": 5.0,
+    }
+    operator_selectivities = {
+        "pr": 0.5,
+        "eq": 0.1,
+        "ne": 0.9,
+        "gt": 0.5,
+        "ge": 0.5,
+        "lt": 0.5,
+        "le": 0.5,
+        "sw": 0.2,
+        "ew": 0.2,
+        "co": 0.3,
+    }
+    default_cost = 5.0
+    default_selectivity = 0.5
+    unique_selectivity = 0.001
+    never_matching = _Estimate(cost=0.5, selectivity=0.0)
+
+    def __init__(self, schema_or_complex: Optional[Union[BaseSchema, Complex]]):
+        self._schema_or_complex = schema_or_complex
+        self._estimates: dict[int, _Estimate] = {}
+
+    def optimize(self, operator: op.Operator) -> op.Operator:
+        return self._optimize(operator, self._schema_or_complex)
+
+    def _optimize(
+        self, operator: op.Operator, schema_or_complex: Optional[Union[BaseSchema, Complex]]
+    ) -> op.Operator:
+        if isinstance(operator, (op.And, op.Or)):
+            optimized = self._optimize_logical(operator, schema_or_complex)
+        elif isinstance(operator, op.Not):
+            optimized = self._optimize_not(operator, schema_or_complex)
+        elif isinstance(operator, op.ComplexAttributeOperator):
+            optimized = self._optimize_complex(operator, schema_or_complex)
+        else:
+            optimized = operator
+            self._estimates[id(operator)] = self._estimate_leaf(operator, schema_or_complex)
+        return optimized
+
+    def _optimize_logical(
+        self,
+        operator: Union[op.And, op.Or],
+        schema_or_complex: Optional[Union[BaseSchema, Complex]],
+    ) -> op.Operator:
+        operator_type = type(operator)
+        sub_operators: list[op.Operator] = []
+        keys = set()
+        for sub_operator in operator.sub_operators:
+            optimized = self._optimize(sub_operator, schema_or_complex)
+            flattened = (
+                optimized.sub_operators if isinstance(optimized, operator_type) else [optimized]
+            )
+            for item in flattened:
+                key = _operator_key(item)
+                if key not in keys:
+                    keys.add(key)
+                    sub_operators.append(item)
+
+        if len(sub_operators) == 1:
+            return sub_operators[0]
+
+        estimates = self._estimates
+        is_and = isinstance(operator, op.And)
+        if is_and:
+            # the most likely to be false and the cheapest first
+            sub_operators.sort(
+                key=lambda item: estimates[id(item)].cost
+                / max(1.0 - estimates[id(item)].selectivity, 1e-9)
+            )
+        else:
+            # the most likely to be true and the cheapest first
+            sub_operators.sort(
+                key=lambda item: estimates[id(item)].cost
+                / max(estimates[id(item)].selectivity, 1e-9)
+            )
+
+        cost, proceed_probability = 0.0, 1.0
+        for sub_operator in sub_operators:
+            estimate = estimates[id(sub_operator)]
+            cost += estimate.cost * proceed_probability
+            proceed_probability *= estimate.selectivity if is_and else 1.0 - estimate.selectivity
+        optimized = operator_type(*sub_operators)
+        estimates[id(optimized)] = _Estimate(
+            cost=cost,
+            selectivity=proceed_probability if is_and else 1.0 - proceed_probability,
+        )
+        return optimized
+
+    def _optimize_not(
+        self, operator: op.Not, schema_or_complex: Optional[Union[BaseSchema, Complex]]
+    ) -> op.Operator:
+        sub_operator = operator.sub_operators[0]
+        if isinstance(sub_operator, op.Not):
+            return self._optimize(sub_operator.sub_operators[0], schema_or_complex)
+
+        optimized_sub = self._optimize(sub_operator, schema_or_complex)
+        estimate = self._estimates[id(optimized_sub)]
+        optimized = op.Not(optimized_sub)
+        self._estimates[id(optimized)] = _Estimate(
+            cost=estimate.cost, selectivity=1.0 - estimate.selectivity
+        )
+        return optimized
+
+    def _optimize_complex(
+        self,
+        operator: op.ComplexAttributeOperator,
+        schema_or_complex: Optional[Union[BaseSchema, Complex]],
+    ) -> op.Operator:
+        attr: Optional[Complex] = None
+        if schema_or_complex is not None:
+            found = schema_or_complex.attrs.get(operator.attr_rep)
+            if not isinstance(found, Complex):
+                self._estimates[id(operator)] = self.never_matching
+                return operator
+            attr = found
+
+        optimized_sub = self._optimize(operator.sub_operator, attr)
+        estimate = self._estimates[id(optimized_sub)]
+        optimized = op.ComplexAttributeOperator(
+            attr_rep=operator.attr_rep,
+            sub_operator=cast(Union[op.AttributeOperator, op.LogicalOperator], optimized_sub),
+        )
+        cost = 2.0 + estimate.cost * (3.0 if attr is None or attr.multi_valued else 1.0)
+        self._estimates[id(optimized)] = _Estimate(cost=cost, selectivity=estimate.selectivity)
+        return optimized
+
+    def _estimate_leaf(
+        self, operator: op.Operator, schema_or_complex: Optional[Union[BaseSchema, Complex]]
+    ) -> _Estimate:
+        if not isinstance(operator, op.AttributeOperator):
+            return _Estimate(cost=self.default_cost, selectivity=self.default_selectivity)
+
+        cost = self.operator_costs.get(operator.op, self.default_cost)
+        selectivity = self.operator_selectivities.get(operator.op, self.default_selectivity)
+        if schema_or_complex is None:
+            return _Estimate(cost=cost, selectivity=selectivity)
+
+        attr = schema_or_complex.attrs.get(operator.attr_rep)
+        if attr is None or attr.scim_type not in operator.supported_scim_types:
+            return self.never_matching
+        if attr.multi_valued:
+            cost *= 3.0
+        if isinstance(attr, String) and isinstance(operator, op.BinaryAttributeOperator):
+            cost *= 2.0  # PRECIS enforcement of every compared value
+        if (
+            isinstance(operator, op.Equal)
+            and isinstance(attr, AttributeWithUniqueness)
+            and attr.uniqueness != AttributeUniqueness.NONE
+        ):
+            selectivity = self.unique_selectivity
+        return _Estimate(cost=cost, selectivity=selectivity)
+
+
+class _Normalized(NamedTuple):
+    operator: op.Operator
+    never_matches: bool
+
+
+class _Normalizer:
+    """
+    Rewrites the operator tree into the canonical form. Negations are pushed down to attribute
+    and complex attribute operators, nested logical operators of the same type are flattened,
+    duplicated operands are dropped, and operands are sorted. If the schema is known,
+    contradicting `eq` operators on the same single-valued attribute are detected, and operands
+    that can never match are folded.
+    """
+
+    def __init__(self, schema_or_complex: Optional[Union[BaseSchema, Complex]]):
+        self._schema_or_complex = schema_or_complex
+
+    def normalize(self, operator: op.Operator) -> op.Operator:
+        return self._normalize(operator, False, self._schema_or_complex).operator
+
+    def _normalize(
+        self,
+        operator: op.Operator,
+        negate: bool,
+        schema_or_complex: Optional[Union[BaseSchema, Complex]],
+    ) -> _Normalized:
+        if isinstance(operator, op.Not):
+            return self._normalize(operator.sub_operators[0], not negate, schema_or_complex)
+        if isinstance(operator, (op.And, op.Or)):
+            return self._normalize_logical(operator, negate, schema_or_complex)
+        if isinstance(operator, op.ComplexAttributeOperator):
+            return self._normalize_complex(operator, negate, schema_or_complex)
+        if negate:
+            return _Normalized(op.Not(operator), False)
+        return _Normalized(operator, False)
+
+    def _normalize_logical(
+        self,
+        operator: Union[op.And, op.Or],
+        negate: bool,
+        schema_or_complex: Optional[Union[BaseSchema, Complex]],
+    ) -> _Normalized:
+        is_and = isinstance(operator, op.And) != negate  # De Morgan's laws
+        operator_type = op.And if is_and else op.Or
+
+        normalized: dict[Hashable, _Normalized] = {}
+        for sub_operator in operator.sub_operators:
+            normalized_sub = self._normalize(sub_operator, negate, schema_or_complex)
+            if normalized_sub.never_matches and is_and:
+                normalized[_operator_key(normalized_sub.operator)] = normalized_sub
+            elif isinstance(normalized_sub.operator, operator_type):
+                for item in normalized_sub.operator.sub_operators:
+                    normalized.setdefault(_operator_key(item), _Normalized(item, False))
+            else:
+                normalized.setdefault(_operator_key(normalized_sub.operator), normalized_sub)
+
+        sub_operators = list(normalized.values())
+        if is_and:
+            never_matching = self._find_never_matching(sub_operators, schema_or_complex)
+            if never_matching is not None:
+                return never_matching
+        else:
+            matching = [item for item in sub_operators if not item.never_matches]
+            if not matching:
+                return min(sub_operators, key=lambda item: self._sort_key(item.operator))
+            sub_operators = matching
+
+        if len(sub_operators) == 1:
+            return sub_operators[0]
+
+        operators = sorted((item.operator for item in sub_operators), key=self._sort_key)
+        return _Normalized(operator_type(*operators), False)
+
+    def _normalize_complex(
+        self,
+        operator: op.ComplexAttributeOperator,
+        negate: bool,
+        schema_or_complex: Optional[Union[BaseSchema, Complex]],
+    ) -> _Normalized:
+        attr = None
+        if schema_or_complex is not None:
+            attr = schema_or_complex.attrs.get(operator.attr_rep)
+        normalized_sub = self._normalize(
+            operator.sub_operator, False, attr if isinstance(attr, Complex) else None
+        )
+        normalized: op.Operator = op.ComplexAttributeOperator(
+            attr_rep=operator.attr_rep,
+            sub_operator=cast(
+                Union[op.AttributeOperator, op.LogicalOperator], normalized_sub.operator
+            ),
+        )
+        if negate:
+            return _Normalized(op.Not(normalized), False)
+        return _Normalized(normalized, normalized_sub.never_matches)
+
+    def _find_never_matching(
+        self,
+        sub_operators: list[_Normalized],
+        schema_or_complex: Optional[Union[BaseSchema, Complex]],
+    ) -> Optional[_Normalized]:
+        never_matching = [item for item in sub_operators if item.never_matches]
+        if never_matching:
+            return min(never_matching, key=lambda item: self._sort_key(item.operator))
+        if schema_or_complex is None:
+            return None
+
+        values: dict[Hashable, tuple[op.Equal, Any]] = {}
+        for item in sub_operators:
+            if not isinstance(item.operator, op.Equal):
+                continue
+            if not self._is_single_valued(item.operator.attr_rep, schema_or_complex):
+                continue
+            test = item.operator.compile_test(
+                cast(Union[ResourceSchema, Complex], schema_or_complex)
+            )
+            if test is None:
+                continue
+            key = (type(item.operator.attr_rep), item.operator.attr_rep)
+            if key not in values:
+                values[key] = (item.operator, test.value)
+                continue
+            other, other_value = values[key]
+            if other_value != test.value:
+                # single value can not be equal to two different values
+                operators = sorted([other, item.operator], key=self._sort_key)
+                return _Normalized(op.And(*operators), True)
+        return None
+
+    @staticmethod
+    def _is_single_valued(attr_rep: AttrRep, schema_or_complex: Union[BaseSchema, Complex]) -> bool:
+        attr = schema_or_complex.attrs.get(attr_rep)
+        if attr is None or attr.multi_valued or isinstance(attr, Complex):
+            return False
+        if not attr_rep.is_sub_attr:
+            return True
+        # sub-attributes of multi-valued complex attributes have many values, one per item
+        parent_rep = (
+            BoundedAttrRep(schema=attr_rep.schema, attr=attr_rep.attr)
+            if isinstance(attr_rep, BoundedAttrRep)
+            else AttrRep(attr=attr_rep.attr)
+        )
+        parent_attr = schema_or_complex.attrs.get(parent_rep)
+        return parent_attr is not None and not parent_attr.multi_valued
+
+    @staticmethod
+    def _sort_key(operator: op.Operator) -> str:
+        if isinstance(operator, op.AttributeOperator):
+            key = f"{str(operator.attr_rep).lower()} {operator.op}"
+            if isinstance(operator, op.BinaryAttributeOperator):
+                key += f" {type(operator.value).__name__} {operator.value!r}"
+            return key
+        if isinstance(operator, op.ComplexAttributeOperator):
+            return (
+                f"{str(operator.attr_rep).lower()}[{_Normalizer._sort_key(operator.sub_operator)}]"
+            )
+        if isinstance(operator, op.LogicalOperator):
+            sub_keys = ", ".join(_Normalizer._sort_key(item) for item in operator.sub_operators)
+            return f"~{operator.op}({sub_keys})"  # logical operators go after attribute operators
+        return f"~~{type(operator).__name__} {id(operator)}"
+
+
 class Filter(Generic[TOperator]):
     """
     Data filter supporting SCIM and custom operators.
@@ -63,6 +634,10 @@ class Filter(Generic[TOperator]):
     Args:
         operator: Underlying filter operator, used for data filtering.
 
+    Results of `Filter.validate` and `Filter.deserialize` are cached in `validate_cache` and
+    `deserialize_cache`, keyed by the filter expression. Deserialized filters are shared between
+    callers, so they must not be modified.
+
     Examples:
         >>> username_filter = Filter.deserialize("userName eq 'Pagerous'")
         >>> username_filter({"userName": "Pagerous"})
@@ -71,6 +646,11 @@ class Filter(Generic[TOperator]):
         False
     """
 
+    validate_cache: LRUCache[str, ValidationIssues] = LRUCache(
+        maxsize=256, copy=ValidationIssues.copy
+    )
+    deserialize_cache: LRUCache[tuple[type, str], "Filter"] = LRUCache(maxsize=256)
+
     def __init__(self, operator: TOperator):
         self._operator = operator
 
@@ -139,6 +719,13 @@ class Filter(Generic[TOperator]):
         Returns:
             Validation issues.
         """
+        return cls.validate_cache.get_or_set(filter_exp, lambda: cls._validate(filter_exp))
+
+    @staticmethod
+    def _validate(filter_exp: str) -> ValidationIssues:
+        if _Parser.try_parse(filter_exp, check_schemas=True) is not None:
+            return ValidationIssues()
+
         filter_exp, placeholders = encode_strings(filter_exp)
         issues = Filter._validate_complex_group_operators(filter_exp, placeholders)
 
@@ -598,12 +1185,18 @@ class Filter(Generic[TOperator]):
             Deserialized filter.
         """
         try:
-            return cls._deserialize(filter_exp)
+            return cls.deserialize_cache.get_or_set(
+                (cls, filter_exp), lambda: cls._deserialize(filter_exp)
+            )
         except Exception:
             raise ValueError("invalid filter expression")
 
     @classmethod
     def _deserialize(cls, filter_exp: str) -> "Filter":
+        operator = _Parser.try_parse(filter_exp, check_schemas=False)
+        if operator is not None:
+            return cls(cast(TOperator, operator))
+
         filter_exp, placeholders = encode_strings(filter_exp)
         for match in COMPLEX_OPERATOR_REGEX.finditer(filter_exp):
             complex_attr_rep = match.group(1)
@@ -759,12 +1352,148 @@ class Filter(Generic[TOperator]):
         Returns:
             Flag indicating whether the data matches the filter.
         """
-        return self._operator.match(ScimData(data), schema_or_complex)
+        return self._operator.match(ScimData.view(data), schema_or_complex)
+
+    def compile(
+        self, schema_or_complex: Union[BaseSchema, Complex]
+    ) -> Callable[[MutableMapping[str, Any]], bool]:
+        """
+        Binds the filter to the provided schema or `Complex` attribute. Attribute lookups,
+        operator compatibility checks, and comparison value normalization (deserialization,
+        PRECIS enforcement, case folding) are performed once, instead of for every matched
+        data item.
+
+        Args:
+            schema_or_complex: Schema or `Complex` attribute, which describes the data
+                matched by the returned predicate.
+
+        Returns:
+            Predicate equivalent to calling the filter with the provided `schema_or_complex`.
+
+        Examples:
+            >>> from scimpler.schemas import UserSchema
+            >>>
+            >>> username_filter = Filter.deserialize("userName eq 'Pagerous'")
+            >>> matches = username_filter.compile(UserSchema())
+            >>> matches({"userName": "Pagerous"})
+            True
+            >>> matches({"userName": "NotPagerous"})
+            False
+        """
+        match = self._operator.compile(schema_or_complex)
+
+        def filter_(data: MutableMapping[str, Any]) -> bool:
+            return match(ScimData.view(data))
+
+        return filter_
+
+    def select(
+        self,
+        data: Iterable[MutableMapping[str, Any]],
+        schema_or_complex: Union[BaseSchema, Complex],
+    ) -> list[int]:
+        """
+        Matches many data items against the filter at once. The filter is compiled once,
+        and every attribute value is looked up and normalized once per data item, even if
+        the attribute is referenced by many operators. Items already matched or rejected
+        by one operand of a logical operator are not tested against the remaining operands.
+
+        Args:
+            data: Data items to be matched.
+            schema_or_complex: Schema or `Complex` attribute, which describes all
+                the provided data items.
+
+        Returns:
+            Indices of matching data items, in ascending order.
+
+        Examples:
+            >>> from scimpler.schemas import UserSchema
+            >>>
+            >>> username_filter = Filter.deserialize("userName sw 'Pag'")
+            >>> username_filter.select(
+            >>>     [{"userName": "Pagerous"}, {"userName": "Other"}, {"userName": "Page"}],
+            >>>     UserSchema(),
+            >>> )
+            [0, 2]
+        """
+        items = [ScimData.view(item) for item in data]
+        select = self._operator.compile_batch(schema_or_complex)
+        return select(op.Batch(items), list(range(len(items))))
+
+    def optimize(self, schema_or_complex: Optional[Union[BaseSchema, Complex]] = None) -> "Filter":
+        """
+        Returns an equivalent filter that is cheaper to evaluate. Nested `and` and `or`
+        operators are flattened, duplicated operands and double negations are removed,
+        and the operands are reordered by their estimated cost and selectivity, so cheap
+        and decisive operands are evaluated first. The estimates are more accurate if
+        `schema_or_complex` is provided, since costs of PRECIS enforcement, multi-valued
+        attributes, and attributes with uniqueness can be taken into account. Operators
+        referring to attributes not present in the schema go first in `and` operators,
+        since they never match.
+
+        The returned filter matches the same data as the original one.
+
+        Args:
+            schema_or_complex: Schema or `Complex` attribute, which describes the data
+                matched by the filter.
+
+        Returns:
+            Optimized filter. Its `operator` is the evaluation plan.
+
+        Examples:
+            >>> from scimpler.schemas import UserSchema
+            >>>
+            >>> filter_ = Filter.deserialize(
+            >>>     "(emails co 'example' and (title pr and id eq '42')) and title pr"
+            >>> )
+            >>> filter_.optimize(UserSchema()).serialize()
+            "title pr and id eq '42' and emails co 'example'"
+        """
+        return Filter(_Optimizer(schema_or_complex).optimize(self._operator))
+
+    def normalize(self, schema_or_complex: Optional[Union[BaseSchema, Complex]] = None) -> "Filter":
+        """
+        Returns the equivalent filter in the canonical form. Negations are pushed down to
+        attribute and complex attribute operators (according to De Morgan's laws), nested
+        `and` and `or` operators are flattened, duplicated operands are removed, and operands
+        are sorted. Equivalent filters that differ only in these aspects have equal
+        canonical forms, so they are equal and have the same hash.
+
+        If `schema_or_complex` is provided, `and` operators with contradicting `eq` operands
+        on the same single-valued attribute are detected. Such operators never match, so they
+        are replaced by the contradicting operands only, and dropped from `or` operators.
+
+        Negations of `eq` are not turned into `ne` (and vice versa), since both operators do
+        not match the data without the attribute value.
+
+        Args:
+            schema_or_complex: Schema or `Complex` attribute, which describes the data
+                matched by the filter.
+
+        Returns:
+            The filter in the canonical form.
+
+        Examples:
+            >>> left = Filter.deserialize("userName eq 'A' and active eq true")
+            >>> right = Filter.deserialize("active eq true and (userName eq 'A')")
+            >>> left == right
+            False
+            >>> left.normalize() == right.normalize()
+            True
+            >>> Filter.deserialize("not (title pr or userName eq 'A')").normalize().serialize()
+            "not title pr and not userName eq 'A'"
+        """
+        return Filter(_Normalizer(schema_or_complex).normalize(self._operator))
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Filter):
             return False
-        return ScimData(self.to_dict()) == ScimData(other.to_dict())
+        return _operator_key(self._operator, value_types=False) == _operator_key(
+            other._operator, value_types=False
+        )
+
+    def __hash__(self) -> int:
+        return hash(_operator_key(self._operator, value_types=False))
 
     def to_dict(self) -> dict:
         """
@@ -804,3 +1533,7 @@ class Filter(Generic[TOperator]):
                 ],
             }
         raise TypeError(f"unsupported filter type '{type(operator).__name__}'")
+
+
+on_change(Filter.validate_cache.clear)
+on_change(Filter.deserialize_cache.clear)
@@ -1,7 +1,8 @@
 import re
 from typing import Any, Optional, Union, cast
 
-from scimpler._registry import schemas
+from scimpler._registry import on_change, schemas
+from scimpler.data.cache import LRUCache
 from scimpler.error import ValidationError, ValidationIssues
 
 _ATTR_NAME = re.compile(r"([a-zA-Z][\w$-]*|\$ref)")
@@ -18,25 +19,44 @@ class AttrName(str):
 
     Attribute names are case-insensitive.
 
+    Attribute names are interned, so creating the same name many times returns the same
+    object, kept in `intern_cache`.
+
     Raises:
         ValueError: If the provided value is not valid attribute name.
     """
 
+    intern_cache: LRUCache[str, "AttrName"] = LRUCache(maxsize=4096)
+    _lower: str
+
     def __repr__(self):
         return f"AttrName({self})"
 
     def __new__(cls, value: str) -> "AttrName":
+        if value.__class__ is cls:
+            return cast(AttrName, value)
+        if cls is AttrName and value.__class__ is str:
+            return cls.intern_cache.get_or_set(value, lambda: cls._create(value))
+        return cls._create(value)
+
+    @classmethod
+    def _create(cls, value: str) -> "AttrName":
         if not isinstance(value, AttrName) and not _ATTR_NAME.fullmatch(value):
             raise ValueError(f"{value!r} is not valid attr name")
-        return cast(AttrName, str.__new__(cls, value))
+        name = cast(AttrName, str.__new__(cls, value))
+        name._lower = name.lower()
+        return name
+
+    def __getnewargs__(self) -> tuple[str]:
+        return (str(self),)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, AttrName):
-            return self.lower() == other.lower()
+            return self._lower == other._lower
         return str(self) == other
 
     def __hash__(self):
-        return hash(self.lower())
+        return hash(self._lower)
 
 
 class SchemaUri(str):
@@ -45,22 +65,41 @@ class SchemaUri(str):
 
     Schema URIs are case-insensitive.
 
+    Schema URIs are interned, so creating the same URI many times returns the same
+    object, kept in `intern_cache`.
+
     Raises:
         ValueError: If the provided value is not valid schema URI.
     """
 
+    intern_cache: LRUCache[str, "SchemaUri"] = LRUCache(maxsize=1024)
+    _lower: str
+
     def __new__(cls, value: str) -> "SchemaUri":
+        if value.__class__ is cls:
+            return cast(SchemaUri, value)
+        if cls is SchemaUri and value.__class__ is str:
+            return cls.intern_cache.get_or_set(value, lambda: cls._create(value))
+        return cls._create(value)
+
+    @classmethod
+    def _create(cls, value: str) -> "SchemaUri":
         if not isinstance(value, SchemaUri) and not _URI_PREFIX.fullmatch(value + ":"):
             raise ValueError(f"{value!r} is not a valid schema URI")
-        return cast(SchemaUri, str.__new__(cls, value))
+        uri = cast(SchemaUri, str.__new__(cls, value))
+        uri._lower = uri.lower()
+        return uri
+
+    def __getnewargs__(self) -> tuple[str]:
+        return (str(self),)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, SchemaUri):
-            return self.lower() == other.lower()
+            return self._lower == other._lower
         return str(self) == other
 
     def __hash__(self):
-        return hash(self.lower())
+        return hash(self._lower)
 
 
 class AttrRep:
@@ -68,6 +107,8 @@ class AttrRep:
     Representation of an unbounded attribute or sub-attribute (no schema association).
     """
 
+    __slots__ = ("_attr", "_sub_attr", "_str")
+
     def __init__(self, attr: str, sub_attr: Optional[str] = None):
         """
         Args:
@@ -138,8 +179,26 @@ class AttrRep:
 class BoundedAttrRep(AttrRep):
     """
     Representation of a bounded attribute or sub-attribute (with schema association).
+
+    Bounded attribute representations are interned, so creating the same representation many
+    times returns the same object, kept in `intern_cache`. The cache is cleared every time
+    a new schema is registered.
     """
 
+    __slots__ = ("_schema", "_extension")
+    intern_cache: LRUCache[tuple[type, str, str, Optional[str]], "BoundedAttrRep"] = LRUCache(
+        maxsize=4096
+    )
+
+    def __new__(cls, schema: str, attr: str, sub_attr: Optional[str] = None) -> "BoundedAttrRep":
+        def create() -> BoundedAttrRep:
+            attr_rep = super(BoundedAttrRep, cls).__new__(cls)
+            attr_rep._init(schema, attr, sub_attr)
+            return attr_rep
+
+        key = (cls, str(schema), str(attr), None if sub_attr is None else str(sub_attr))
+        return cls.intern_cache.get_or_set(key, create)
+
     def __init__(
         self,
         schema: str,
@@ -155,6 +214,9 @@ class BoundedAttrRep(AttrRep):
         Raises:
             ValueError: If the provided `schema` is not recognized in the system registry.
         """
+        # instances are initialized once, when created in `__new__`, since they are interned
+
+    def _init(self, schema: str, attr: str, sub_attr: Optional[str]) -> None:
         super().__init__(attr, sub_attr)
         schema = SchemaUri(schema)
         is_extension = schemas.get(schema)
@@ -165,6 +227,9 @@ class BoundedAttrRep(AttrRep):
         self._schema = schema
         self._extension = is_extension
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (self._schema, self._attr, self._sub_attr)
+
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, str):
             other = AttrRepFactory.deserialize(other)
@@ -202,8 +267,12 @@ class AttrRepFactory:
     """
     Attribute representation factory. Able to validate string-based representations and
     deserialize them to `AttrRep` or `BoundedAttrRep`.
+
+    Deserialized representations are cached in `deserialize_cache`, keyed by the provided value.
     """
 
+    deserialize_cache: LRUCache[str, Union[AttrRep, BoundedAttrRep]] = LRUCache(maxsize=1024)
+
     @classmethod
     def validate(cls, value: str) -> ValidationIssues:
         """
@@ -250,7 +319,9 @@ class AttrRepFactory:
             )"
         """
         try:
-            return cls._deserialize(value)
+            if not isinstance(value, str):
+                return cls._deserialize(value)
+            return cls.deserialize_cache.get_or_set(str(value), lambda: cls._deserialize(value))
         except Exception:
             raise ValueError(f"{value!r} is not valid attribute representation")
 
@@ -276,3 +347,7 @@ class AttrRepFactory:
                 sub_attr=sub_attr,
             )
         return AttrRep(attr=attr, sub_attr=sub_attr)
+
+
+on_change(AttrRepFactory.deserialize_cache.clear)
+on_change(BoundedAttrRep.intern_cache.clear)
@@ -0,0 +1,364 @@
+import bisect
+import math
+from operator import itemgetter
+from typing import Any, Iterable, Mapping, Optional, Union, cast
+
+from scimpler.data import operator as op
+from scimpler.data.attrs import Complex
+from scimpler.data.filter import Filter
+from scimpler.data.identifiers import AttrRep, BoundedAttrRep
+from scimpler.data.schemas import ResourceSchema
+from scimpler.data.scim_data import ScimData
+
+_Plan = tuple[Optional[set[int]], bool]
+_RangeOperator = Union[
+    op.GreaterThan, op.GreaterThanOrEqual, op.LesserThan, op.LesserThanOrEqual, op.StartsWith
+]
+_INDEXED_OPERATORS = (
+    op.Present,
+    op.Equal,
+    op.GreaterThan,
+    op.GreaterThanOrEqual,
+    op.LesserThan,
+    op.LesserThanOrEqual,
+    op.StartsWith,
+)
+
+
+class _SortedColumn:
+    def __init__(self) -> None:
+        self._entries: list[tuple[Any, int]] = []
+        self._keys: list[Any] = []
+        self._indices: list[int] = []
+        self._sorted = True
+
+    def add(self, key: Any, index: int) -> None:
+        # entries are sorted once, on the next lookup, so adding many of them is linear
+        self._entries.append((key, index))
+        self._sorted = False
+
+    def _sort(self) -> None:
+        if self._sorted:
+            return
+        self._entries.sort(key=itemgetter(0))
+        self._keys = [key for key, _ in self._entries]
+        self._indices = [index for _, index in self._entries]
+        self._sorted = True
+
+    def lookup(self, operator_: _RangeOperator, value: Any) -> set[int]:
+        self._sort()
+        keys = self._keys
+        if isinstance(operator_, op.GreaterThan):
+            return set(self._indices[bisect.bisect_right(keys, value) :])
+        if isinstance(operator_, op.GreaterThanOrEqual):
+            return set(self._indices[bisect.bisect_left(keys, value) :])
+        if isinstance(operator_, op.LesserThan):
+            return set(self._indices[: bisect.bisect_left(keys, value)])
+        if isinstance(operator_, op.LesserThanOrEqual):
+            return set(self._indices[: bisect.bisect_right(keys, value)])
+
+        matching = set()
+        for position in range(bisect.bisect_left(keys, value), len(keys)):
+            if not keys[position].startswith(value):
+                break
+            matching.add(self._indices[position])
+        return matching
+
+
+class _AttrIndex:
+    def __init__(self, attr_rep: BoundedAttrRep, schema: ResourceSchema):
+        self._attr_rep = attr_rep
+        self._present_test = op.Present(attr_rep).compile_test(schema)
+        value_test = op.Equal(attr_rep, None).compile_test(schema)
+        self._normalize = value_test.normalize if value_test is not None else None
+        self._present: set[int] = set()
+        self._failed: set[int] = set()
+        self._values: dict[Any, set[int]] = {}
+        self._strings = _SortedColumn()
+        self._numbers = _SortedColumn()
+
+    def add(self, item: ScimData, index: int) -> None:
+        attr_value = item.get(self._attr_rep)
+        if self._present_test is not None and item and self._present_test(attr_value):
+            self._present.add(index)
+
+        if self._normalize is None:
+            return
+
+        if not isinstance(attr_value, list):
+            values = self._normalize(attr_value) or []
+        else:
+            # items of multi-valued attributes are normalized one by one, since complex
+            # attribute operators test them separately, so the item that fails normalization
+            # (e.g. PRECIS enforcement) does not exclude the others
+            values = []
+            for item_value in attr_value:
+                values.extend(self._normalize([item_value]) or [])
+            if values and self._normalize(attr_value) is None:
+                self._failed.add(index)
+
+        for value in values:
+            if isinstance(value, float) and math.isnan(value):
+                continue  # 'NaN' is not equal nor comparable to anything
+            try:
+                self._values.setdefault(value, set()).add(index)
+            except TypeError:
+                continue  # unhashable values are never equal to filter values
+            if isinstance(value, str):
+                self._strings.add(value, index)
+            elif isinstance(value, (int, float)):
+                self._numbers.add(value, index)
+
+    def lookup_present(self) -> set[int]:
+        return set(self._present)
+
+    def lookup(
+        self, operator_: Union[op.Equal, _RangeOperator], value: Any, whole_value: bool
+    ) -> Optional[set[int]]:
+        """
+        Returns positions of resources with values matching the operator. If `whole_value` is
+        set, the value of multi-valued attribute is tested as a whole, so it never matches
+        if any of its items fails normalization. Otherwise, the items are tested separately.
+        """
+        if isinstance(value, float) and math.isnan(value):
+            return set()
+
+        if isinstance(operator_, op.Equal):
+            matching = set(self._values.get(value, set()))
+        elif isinstance(value, str):
+            matching = self._strings.lookup(operator_, value)
+        elif isinstance(value, (int, float)) and not isinstance(operator_, op.StartsWith):
+            matching = self._numbers.lookup(operator_, value)
+        else:
+            return None
+        if whole_value:
+            matching -= self._failed
+        return matching
+
+
+class ResourceIndex:
+    """
+    In-memory index over a collection of resources described by the same schema. Every indexed
+    attribute keeps:
+
+    - a hash index, used by `eq` operator,
+    - sorted indexes of string and number values, used by `gt`, `ge`, `lt`, `le`, and `sw`
+        operators,
+    - a set of resources with the attribute value present, used by `pr` operator.
+
+    Indexed values are normalized the same way the operators normalize them, so `caseExact`
+    and PRECIS profiles of the attributes are honoured.
+
+    Filters are evaluated by the planner, which walks the operator tree and answers every
+    indexed leaf from the indexes. Operators or attributes that can not be answered from
+    the indexes (e.g. `co`, `ne`, or not indexed attributes) are evaluated by scanning only
+    resources that remain after applying the indexed parts of the filter. Results are always
+    the same as the ones returned by `Filter.select`.
+    """
+
+    def __init__(
+        self,
+        schema: ResourceSchema,
+        attr_reps: Iterable[BoundedAttrRep],
+        resources: Iterable[Mapping[str, Any]] = (),
+    ):
+        """
+        Args:
+            schema: Schema that describes all indexed resources.
+            attr_reps: Representations of attributes and sub-attributes to index.
+            resources: Initial resources to index.
+
+        Raises:
+            ValueError: If any of the provided `attr_reps` does not belong to the `schema`.
+
+        Examples:
+            >>> from scimpler.schemas import UserSchema
+            >>>
+            >>> schema = UserSchema()
+            >>> index = ResourceIndex(
+            >>>     schema=schema,
+            >>>     attr_reps=[schema.attrs.userName, schema.attrs.emails__type],
+            >>>     resources=[
+            >>>         {"userName": "Pagerous", "emails": [{"type": "work", "value": "..."}]},
+            >>>         {"userName": "bjensen", "emails": [{"type": "home", "value": "..."}]},
+            >>>     ],
+            >>> )
+            >>> index.select(Filter.deserialize("userName ge 'b' and emails[type eq 'work']"))
+            [0]
+        """
+        self._schema = schema
+        self._items: list[ScimData] = []
+        self._indexes: dict[BoundedAttrRep, _AttrIndex] = {}
+        for attr_rep in attr_reps:
+            if schema.attrs.get(attr_rep) is None:
+                raise ValueError(f"attribute {str(attr_rep)!r} does not belong to the schema")
+            self._indexes[attr_rep] = _AttrIndex(attr_rep, schema)
+        for resource in resources:
+            self.add(resource)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def schema(self) -> ResourceSchema:
+        """
+        Schema that describes all indexed resources.
+        """
+        return self._schema
+
+    def add(self, resource: Mapping[str, Any]) -> int:
+        """
+        Adds the resource to the index.
+
+        Args:
+            resource: The resource to add.
+
+        Returns:
+            Position of the resource in the index, used in results of `select`.
+        """
+        item = ScimData(resource)
+        index = len(self._items)
+        self._items.append(item)
+        for attr_index in self._indexes.values():
+            attr_index.add(item, index)
+        return index
+
+    def select(self, filter_: Filter) -> list[int]:
+        """
+        Returns positions of indexed resources that match the provided filter.
+
+        Args:
+            filter_: Filter to match the resources against.
+
+        Returns:
+            Positions of matching resources, in ascending order.
+        """
+        matching, exact = self._plan(filter_.operator, self._schema, None)
+        if matching is not None and exact:
+            return sorted(matching)
+
+        candidates = sorted(matching) if matching is not None else list(range(len(self._items)))
+        select = filter_.operator.compile_batch(self._schema)
+        return select(op.Batch(self._items), candidates)
+
+    def _plan(
+        self,
+        operator_: op.Operator,
+        schema_or_complex: Union[ResourceSchema, Complex],
+        parent_rep: Optional[BoundedAttrRep],
+    ) -> _Plan:
+        """
+        Returns positions of resources that may match the operator, and the flag telling if
+        all of them match for sure. Inside complex attribute operators only a superset of
+        matching resources is known, since the sub-operators must match the same item of
+        a multi-valued attribute. `None` means all resources.
+        """
+        if isinstance(operator_, op.And):
+            return self._plan_and(operator_, schema_or_complex, parent_rep)
+        if isinstance(operator_, op.Or):
+            return self._plan_or(operator_, schema_or_complex, parent_rep)
+        if isinstance(operator_, op.Not):
+            return self._plan_not(operator_, schema_or_complex, parent_rep)
+        if isinstance(operator_, op.ComplexAttributeOperator):
+            return self._plan_complex(operator_, schema_or_complex, parent_rep)
+        if isinstance(operator_, _INDEXED_OPERATORS):
+            return self._plan_attribute_operator(operator_, schema_or_complex, parent_rep)
+        return None, False
+
+    def _plan_and(
+        self,
+        operator_: op.And,
+        schema_or_complex: Union[ResourceSchema, Complex],
+        parent_rep: Optional[BoundedAttrRep],
+    ) -> _Plan:
+        matching: Optional[set[int]] = None
+        exact = True
+        for sub_operator in operator_.sub_operators:
+            sub_matching, sub_exact = self._plan(sub_operator, schema_or_complex, parent_rep)
+            exact = exact and sub_exact
+            if sub_matching is not None:
+                matching = sub_matching if matching is None else matching & sub_matching
+        return matching, exact and matching is not None
+
+    def _plan_or(
+        self,
+        operator_: op.Or,
+        schema_or_complex: Union[ResourceSchema, Complex],
+        parent_rep: Optional[BoundedAttrRep],
+    ) -> _Plan:
+        matching: set[int] = set()
+        exact = True
+        for sub_operator in operator_.sub_operators:
+            sub_matching, sub_exact = self._plan(sub_operator, schema_or_complex, parent_rep)
+            if sub_matching is None:
+                return None, False
+            exact = exact and sub_exact
+            matching |= sub_matching
+        return matching, exact
+
+    def _plan_not(
+        self,
+        operator_: op.Not,
+        schema_or_complex: Union[ResourceSchema, Complex],
+        parent_rep: Optional[BoundedAttrRep],
+    ) -> _Plan:
+        if parent_rep is not None:
+            return None, False
+
+        sub_matching, sub_exact = self._plan(operator_.sub_operators[0], schema_or_complex, None)
+        if sub_matching is None or not sub_exact:
+            return None, False
+        return set(range(len(self._items))) - sub_matching, True
+
+    def _plan_complex(
+        self,
+        operator_: op.ComplexAttributeOperator,
+        schema_or_complex: Union[ResourceSchema, Complex],
+        parent_rep: Optional[BoundedAttrRep],
+    ) -> _Plan:
+        attr = schema_or_complex.attrs.get(operator_.attr_rep)
+        if not isinstance(attr, Complex):
+            return set(), True
+
+        sub_matching, _ = self._plan(
+            operator_.sub_operator, attr, self._bound(operator_.attr_rep, None)
+        )
+        return sub_matching, False
+
+    def _plan_attribute_operator(
+        self,
+        operator_: Union[op.Present, op.Equal, _RangeOperator],
+        schema_or_complex: Union[ResourceSchema, Complex],
+        parent_rep: Optional[BoundedAttrRep],
+    ) -> _Plan:
+        test = operator_.compile_test(schema_or_complex)
+        if test is None:
+            return set(), True
+
+        attr_index = self._indexes.get(self._bound(operator_.attr_rep, parent_rep))
+        if attr_index is None:
+            return None, False
+
+        if isinstance(operator_, op.Present):
+            return attr_index.lookup_present(), True
+
+        matching = attr_index.lookup(
+            operator_, cast(op.BinaryTest, test).value, whole_value=parent_rep is None
+        )
+        return matching, matching is not None
+
+    def _bound(self, attr_rep: AttrRep, parent_rep: Optional[BoundedAttrRep]) -> BoundedAttrRep:
+        if parent_rep is not None:
+            return BoundedAttrRep(
+                schema=parent_rep.schema,
+                attr=parent_rep.attr,
+                sub_attr=attr_rep.sub_attr if attr_rep.is_sub_attr else attr_rep.attr,
+            )
+        if isinstance(attr_rep, BoundedAttrRep):
+            return attr_rep
+        # unbounded attributes are looked up in the data in the core schema only
+        return BoundedAttrRep(
+            schema=self._schema.schema,
+            attr=attr_rep.attr,
+            sub_attr=attr_rep.sub_attr if attr_rep.is_sub_attr else None,
+        )
@@ -1,18 +1,105 @@
 import abc
+import functools
 import inspect
 import operator
 from abc import ABC
-from typing import Any, Generator, Generic, Mapping, Optional, TypeVar, Union, final
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Generic,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    final,
+)
 
 from typing_extensions import override
 
 from scimpler._registry import register_binary_operator, register_unary_operator
-from scimpler.data.attrs import Attribute, AttributeWithCaseExact, Complex, String
+from scimpler.data.attrs import AttributeWithCaseExact, Complex, String
 from scimpler.data.identifiers import AttrRep
 from scimpler.data.schemas import ResourceSchema
 from scimpler.data.scim_data import Invalid, Missing, ScimData
 
 TSchemaOrComplex = TypeVar("TSchemaOrComplex", bound=Union[ResourceSchema, Complex])
+MatchPredicate = Callable[[Optional[ScimData]], bool]
+
+
+class Batch:
+    """
+    Data items tested together by batch selectors, returned from `Operator.compile_batch`.
+    Attribute values extracted by one operator are stored per attribute and reused by
+    other operators in the same batch, so every value is looked up and normalized at most once.
+    """
+
+    def __init__(self, items: Sequence[ScimData]):
+        """
+        Args:
+            items: Data items to test. Indices of items are used to refer to them.
+        """
+        self._items = items
+        self._columns: dict[Any, dict[int, Any]] = {}
+
+    @property
+    def items(self) -> Sequence[ScimData]:
+        """
+        Data items to test.
+        """
+        return self._items
+
+    def column(
+        self, key: Any, indices: Sequence[int], extract: Callable[[ScimData], Any]
+    ) -> list[Any]:
+        """
+        Returns values extracted from items at the provided `indices`. Values are extracted
+        with `extract` only for items not extracted before under the same `key`.
+
+        Args:
+            key: Identifier of the column.
+            indices: Indices of items for which the values should be returned.
+            extract: Function extracting the value from the item.
+
+        Returns:
+            Extracted values, in the order of `indices`.
+        """
+        column = self._columns.setdefault(key, {})
+        values = []
+        for i in indices:
+            if i in column:
+                value = column[i]
+            else:
+                value = column[i] = extract(self._items[i])
+            values.append(value)
+        return values
+
+
+BatchSelector = Callable[[Batch, list[int]], list[int]]
+
+
+class BinaryTest(NamedTuple):
+    """
+    Binary attribute operator bound to the schema or `Complex` attribute, returned from
+    `BinaryAttributeOperator.compile_test`. The attribute value is converted with `normalize`
+    to the list of items (with PRECIS profiles enforced and case lowered, if applicable),
+    or `None` if it can not match, and the items are tested with `test`. The operator's
+    `value` is normalized the same way as the items.
+    """
+
+    normalize: Callable[[Any], Optional[list[Any]]]
+    test: Callable[[list[Any]], bool]
+    value: Any
+
+
+def _never_match(value: Optional[ScimData]) -> bool:
+    return False
+
+
+def _select_none(batch: Batch, indices: list[int]) -> list[int]:
+    return []
 
 
 class Operator(abc.ABC, Generic[TSchemaOrComplex]):
@@ -38,6 +125,46 @@ class Operator(abc.ABC, Generic[TSchemaOrComplex]):
             Flag indicating whether the value matches the operator.
         """
 
+    def compile(self, schema_or_complex: TSchemaOrComplex) -> MatchPredicate:
+        """
+        Binds the operator to the provided schema or `Complex` attribute and returns
+        a predicate equivalent to `match`, called with the same `schema_or_complex`.
+        Work that does not depend on the tested value is performed once, during the
+        compilation, so the predicate is cheaper to call repeatedly.
+
+        The predicate reflects the operator at the moment of compilation.
+
+        Args:
+            schema_or_complex: Schema or `Complex` attribute that describes the values
+                tested by the predicate.
+
+        Returns:
+            Predicate that tests a given value against the operator.
+        """
+        return functools.partial(self.match, schema_or_complex=schema_or_complex)
+
+    def compile_batch(self, schema_or_complex: TSchemaOrComplex) -> BatchSelector:
+        """
+        Binds the operator to the provided schema or `Complex` attribute and returns
+        a selector, which tests many data items at once. The selector is called with
+        a `Batch` of data items and indices of items to test, and returns the indices
+        of items that match the operator, in the order they were provided.
+
+        Args:
+            schema_or_complex: Schema or `Complex` attribute that describes the items
+                tested by the selector.
+
+        Returns:
+            Selector that tests the batch of data items against the operator.
+        """
+        match = self.compile(schema_or_complex)
+
+        def select(batch: Batch, indices: list[int]) -> list[int]:
+            items = batch.items
+            return [i for i in indices if match(items[i])]
+
+        return select
+
 
 class LogicalOperator(Operator, abc.ABC):
     """
@@ -87,6 +214,36 @@ class And(LogicalOperator):
                 return False
         return True
 
+    @override
+    def compile(self, schema_or_complex: TSchemaOrComplex) -> MatchPredicate:
+        sub_matches = [
+            sub_operator.compile(schema_or_complex) for sub_operator in self.sub_operators
+        ]
+
+        def match(value: Optional[ScimData]) -> bool:
+            value = value or ScimData()
+            for sub_match in sub_matches:
+                if not sub_match(value):
+                    return False
+            return True
+
+        return match
+
+    @override
+    def compile_batch(self, schema_or_complex: TSchemaOrComplex) -> BatchSelector:
+        sub_selects = [
+            sub_operator.compile_batch(schema_or_complex) for sub_operator in self.sub_operators
+        ]
+
+        def select(batch: Batch, indices: list[int]) -> list[int]:
+            for sub_select in sub_selects:
+                if not indices:
+                    break
+                indices = sub_select(batch, indices)
+            return indices
+
+        return select
+
 
 @final
 class Or(LogicalOperator):
@@ -108,6 +265,40 @@ class Or(LogicalOperator):
                 return True
         return False
 
+    @override
+    def compile(self, schema_or_complex: TSchemaOrComplex) -> MatchPredicate:
+        sub_matches = [
+            sub_operator.compile(schema_or_complex) for sub_operator in self.sub_operators
+        ]
+
+        def match(value: Optional[ScimData]) -> bool:
+            value = value or ScimData()
+            for sub_match in sub_matches:
+                if sub_match(value):
+                    return True
+            return False
+
+        return match
+
+    @override
+    def compile_batch(self, schema_or_complex: TSchemaOrComplex) -> BatchSelector:
+        sub_selects = [
+            sub_operator.compile_batch(schema_or_complex) for sub_operator in self.sub_operators
+        ]
+
+        def select(batch: Batch, indices: list[int]) -> list[int]:
+            matched: set[int] = set()
+            remaining = indices
+            for sub_select in sub_selects:
+                if not remaining:
+                    break
+                sub_matched = set(sub_select(batch, remaining))
+                matched.update(sub_matched)
+                remaining = [i for i in remaining if i not in sub_matched]
+            return [i for i in indices if i in matched]
+
+        return select
+
 
 @final
 class Not(LogicalOperator):
@@ -128,6 +319,25 @@ class Not(LogicalOperator):
     ) -> bool:
         return not next(self._collect_matches(value, schema_or_complex))
 
+    @override
+    def compile(self, schema_or_complex: TSchemaOrComplex) -> MatchPredicate:
+        sub_match = self.sub_operators[0].compile(schema_or_complex)
+
+        def match(value: Optional[ScimData]) -> bool:
+            return not sub_match(value)
+
+        return match
+
+    @override
+    def compile_batch(self, schema_or_complex: TSchemaOrComplex) -> BatchSelector:
+        sub_select = self.sub_operators[0].compile_batch(schema_or_complex)
+
+        def select(batch: Batch, indices: list[int]) -> list[int]:
+            sub_matched = set(sub_select(batch, indices))
+            return [i for i in indices if i not in sub_matched]
+
+        return select
+
 
 class AttributeOperatorMeta(abc.ABCMeta):
     def __init__(cls, *args, **kwargs):
@@ -201,30 +411,69 @@ class UnaryAttributeOperator(AttributeOperator, abc.ABC):
         Returns:
             Flag indicating whether the value matches the operator.
         """
-        attr = schema_or_complex.attrs.get(self.attr_rep)
-        if attr is None:
-            return False
-
-        if attr.scim_type not in self.supported_scim_types:
-            return False
+        return self.compile(schema_or_complex)(value)
 
-        if not value:
-            return False
+    def compile(self, schema_or_complex: TSchemaOrComplex) -> MatchPredicate:
+        test = self.compile_test(schema_or_complex)
+        if test is None:
+            return _never_match
 
-        attr_value = value.get(self.attr_rep)
+        attr_rep = self.attr_rep
 
-        if attr.multi_valued:
-            if isinstance(attr_value, list):
-                match = any(
-                    [self.operator(item) for item in attr_value if self.is_type_supported(item)]
-                )
-            else:
-                match = False
-        else:
-            match = self.operator(attr_value)
+        def match(value: Optional[ScimData]) -> bool:
+            if not value:
+                return False
+            return test(value.get(attr_rep))
 
         return match
 
+    def compile_batch(self, schema_or_complex: TSchemaOrComplex) -> BatchSelector:
+        test = self.compile_test(schema_or_complex)
+        if test is None:
+            return _select_none
+
+        attr_rep = self.attr_rep
+        key = (UnaryAttributeOperator, type(attr_rep), attr_rep)
+
+        def extract(item: ScimData) -> Any:
+            return item.get(attr_rep)
+
+        def select(batch: Batch, indices: list[int]) -> list[int]:
+            items = batch.items
+            column = batch.column(key, indices, extract)
+            return [i for i, attr_value in zip(indices, column) if items[i] and test(attr_value)]
+
+        return select
+
+    def compile_test(self, schema_or_complex: TSchemaOrComplex) -> Optional[Callable[[Any], bool]]:
+        """
+        Binds the operator to the provided schema or `Complex` attribute and returns the test
+        called with the attribute value, used by `compile` and `compile_batch`.
+
+        Args:
+            schema_or_complex: Schema or `Complex` attribute that describes the attribute.
+
+        Returns:
+            The test, or `None` if the operator never matches (e.g. the attribute does not
+            belong to the schema, or its type is not supported by the operator).
+        """
+        attr = schema_or_complex.attrs.get(self.attr_rep)
+        if attr is None or attr.scim_type not in self.supported_scim_types:
+            return None
+
+        multi_valued = attr.multi_valued
+        operator_ = self.operator
+        is_type_supported = self.is_type_supported
+
+        def test(attr_value: Any) -> bool:
+            if multi_valued:
+                if isinstance(attr_value, list):
+                    return any([operator_(item) for item in attr_value if is_type_supported(item)])
+                return False
+            return operator_(attr_value)
+
+        return test
+
 
 @final
 class Present(UnaryAttributeOperator):
@@ -288,58 +537,6 @@ class BinaryAttributeOperator(AttributeOperator, abc.ABC):
         Implements operator's logic for matching the provided value.
         """
 
-    def _get_values(self, value: Any, attr: Attribute) -> Optional[list[tuple[Any, Any]]]:
-        if attr.scim_type not in self.supported_scim_types:
-            return None
-
-        op_value = self.value
-        if isinstance(attr, Complex):
-            value_sub_attr = attr.attrs.get("value")
-            if value_sub_attr is None:
-                return None
-
-            if not attr.multi_valued:
-                return None
-
-            attr = value_sub_attr
-            value = [item.get("value") for item in value]
-
-        elif not isinstance(value, list):
-            value = [value]
-
-        if isinstance(op_value, attr.base_types):
-            op_value = attr.deserialize(op_value)
-
-        if not isinstance(attr, AttributeWithCaseExact):
-            return [(item, op_value) for item in value]
-
-        return self._get_values_for_attr_with_case_exact(
-            attr=attr,
-            op_value=op_value,
-            attr_value=value,
-        )
-
-    @staticmethod
-    def _get_values_for_attr_with_case_exact(
-        attr: AttributeWithCaseExact, op_value: Any, attr_value: list[Any]
-    ) -> Optional[list[tuple[Any, Any]]]:
-        if isinstance(attr, String):
-            try:
-                attr_value = [
-                    attr.precis.enforce(item) if isinstance(item, str) else item
-                    for item in attr_value
-                ]
-                if isinstance(op_value, str):
-                    op_value = attr.precis.enforce(op_value)
-            except UnicodeEncodeError:
-                return None
-        if attr.case_exact:
-            return [(item, op_value) for item in attr_value]
-
-        if isinstance(op_value, str):
-            op_value = op_value.lower()
-        return [(item.lower() if isinstance(item, str) else item, op_value) for item in attr_value]
-
     def match(
         self,
         value: Optional[ScimData],
@@ -357,28 +554,126 @@ class BinaryAttributeOperator(AttributeOperator, abc.ABC):
         Returns:
             Flag indicating whether the value matches the operator.
         """
-        attr = schema_or_complex.attrs.get(self.attr_rep)
-        if attr is None:
-            return False
+        return self.compile(schema_or_complex)(value)
 
-        attr_value = None if not value else value.get(self.attr_rep)
+    def compile(self, schema_or_complex: TSchemaOrComplex) -> MatchPredicate:
+        compiled = self.compile_test(schema_or_complex)
+        if compiled is None:
+            return _never_match
 
-        if attr_value in [None, Missing, Invalid]:
-            return False
+        normalize, test, _ = compiled
+        attr_rep = self.attr_rep
 
-        values = self._get_values(attr_value, attr)
+        def match(value: Optional[ScimData]) -> bool:
+            items = normalize(None if not value else value.get(attr_rep))
+            return items is not None and test(items)
 
-        if values is None:
-            return False
+        return match
+
+    def compile_batch(self, schema_or_complex: TSchemaOrComplex) -> BatchSelector:
+        compiled = self.compile_test(schema_or_complex)
+        if compiled is None:
+            return _select_none
+
+        normalize, test, _ = compiled
+        attr_rep = self.attr_rep
+        # normalization depends only on the attribute, so it is shared by all binary operators
+        key = (BinaryAttributeOperator, type(attr_rep), attr_rep)
+
+        def extract(item: ScimData) -> Optional[list[Any]]:
+            return normalize(item.get(attr_rep))
+
+        def select(batch: Batch, indices: list[int]) -> list[int]:
+            column = batch.column(key, indices, extract)
+            return [i for i, items in zip(indices, column) if items is not None and test(items)]
+
+        return select
+
+    def compile_test(self, schema_or_complex: TSchemaOrComplex) -> Optional[BinaryTest]:
+        """
+        Binds the operator to the provided schema or `Complex` attribute and returns
+        the normalization of attribute values and the test of normalized values, used by
+        `compile` and `compile_batch`.
 
-        for attr_value, op_value in values:
+        Args:
+            schema_or_complex: Schema or `Complex` attribute that describes the attribute.
+
+        Returns:
+            The normalization, the test, and the normalized operator's value, or `None` if
+            the operator never matches (e.g. the attribute does not belong to the schema,
+            or its type is not supported by the operator).
+        """
+        attr = schema_or_complex.attrs.get(self.attr_rep)
+        if attr is None or attr.scim_type not in self.supported_scim_types:
+            return None
+
+        is_complex = isinstance(attr, Complex)
+        if isinstance(attr, Complex):
+            value_sub_attr = attr.attrs.get("value")
+            if value_sub_attr is None or not attr.multi_valued:
+                return None
+            attr = value_sub_attr
+
+        op_value = self.value
+        deserialize = None
+        if isinstance(op_value, attr.base_types):
             try:
-                if self.operator(attr_value, op_value):
-                    return True
-            except (AttributeError, TypeError):
-                pass
+                op_value = attr.deserialize(op_value)
+            except Exception:
+                # without the compilation the value is deserialized only when it is compared
+                # to attribute values, so the error is raised at the same point
+                deserialize = functools.partial(attr.deserialize, op_value)
+
+        enforce_precis = None
+        case_exact = True
+        if isinstance(attr, AttributeWithCaseExact):
+            if isinstance(attr, String):
+                enforce_precis = attr.enforce_precis
+                if deserialize is None and isinstance(op_value, str):
+                    try:
+                        op_value = enforce_precis(op_value)
+                    except UnicodeEncodeError:
+                        return None
+            case_exact = attr.case_exact
+            if deserialize is None and not case_exact and isinstance(op_value, str):
+                op_value = op_value.lower()
+
+        operator_ = self.operator
+
+        def normalize(attr_value: Any) -> Optional[list[Any]]:
+            if attr_value in [None, Missing, Invalid]:
+                return None
 
-        return False
+            if is_complex:
+                items = [item.get("value") for item in attr_value]
+            elif not isinstance(attr_value, list):
+                items = [attr_value]
+            else:
+                items = attr_value
+
+            if enforce_precis is not None:
+                try:
+                    items = [
+                        enforce_precis(item) if isinstance(item, str) else item for item in items
+                    ]
+                except UnicodeEncodeError:
+                    return None
+            if not case_exact:
+                items = [item.lower() if isinstance(item, str) else item for item in items]
+            return items
+
+        def test(items: list[Any]) -> bool:
+            if deserialize is not None:
+                deserialize()
+            for item in items:
+                try:
+                    if operator_(item, op_value):
+                        return True
+                except (AttributeError, TypeError):
+                    pass
+            return False
+
+        return BinaryTest(normalize=normalize, test=test, value=op_value)
 
 
 @final
@@ -616,25 +911,31 @@ class ComplexAttributeOperator(Operator, Generic[TLogicalOrAttributeOperator]):
         Returns:
             Flag indicating whether the value matches the operator.
         """
+        return self.compile(schema_or_complex)(value)
+
+    def compile(self, schema_or_complex: TSchemaOrComplex) -> MatchPredicate:
         attr = schema_or_complex.attrs.get(self._attr_rep)
-        if attr is None or not value or not isinstance(attr, Complex):
-            return False
+        if attr is None or not isinstance(attr, Complex):
+            return _never_match
 
-        attr_value = value.get(self._attr_rep)
-        if (
-            attr.multi_valued
-            and not isinstance(attr_value, list)
-            or not attr.multi_valued
-            and isinstance(attr_value, list)
-        ):
+        attr_rep = self._attr_rep
+        multi_valued = attr.multi_valued
+        sub_match = self._sub_operator.compile(attr)
+
+        def match(value: Optional[ScimData]) -> bool:
+            if not value:
+                return False
+
+            attr_value = value.get(attr_rep)
+            if multi_valued != isinstance(attr_value, list):
+                return False
+
+            for item in self._normalize(attr, attr_value):
+                if sub_match(item):
+                    return True
             return False
 
-        normalized = self._normalize(attr, attr_value)
-        for item in normalized:
-            match = self._sub_operator.match(item, attr)
-            if match:
-                return True
-        return False
+        return match
 
     @staticmethod
     def _normalize(attr: Complex, value: Any) -> list[ScimData]:
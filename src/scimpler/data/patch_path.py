@@ -1,7 +1,9 @@
 from copy import copy
 from typing import Any, MutableMapping, Optional
 
+from scimpler._registry import on_change
 from scimpler.data.attrs import Complex
+from scimpler.data.cache import LRUCache
 from scimpler.data.filter import Filter
 from scimpler.data.identifiers import AttrName, AttrRep, AttrRepFactory, BoundedAttrRep
 from scimpler.data.operator import ComplexAttributeOperator
@@ -15,8 +17,17 @@ class PatchPath:
     """
     Target modification path, used in PATCH requests. Supports path syntax, as specified in
     RFC-7644.
+
+    Results of `PatchPath.validate` and `PatchPath.deserialize` are cached in `validate_cache` and
+    `deserialize_cache`, keyed by the path expression. Deserialized paths are shared between
+    callers, so they must not be modified.
     """
 
+    validate_cache: LRUCache[str, ValidationIssues] = LRUCache(
+        maxsize=256, copy=ValidationIssues.copy
+    )
+    deserialize_cache: LRUCache[tuple[type, str], "PatchPath"] = LRUCache(maxsize=256)
+
     def __init__(
         self,
         attr_rep: AttrRep,
@@ -89,6 +100,10 @@ class PatchPath:
         Returns:
             Validation issues.
         """
+        return cls.validate_cache.get_or_set(path_exp, lambda: cls._validate(path_exp))
+
+    @classmethod
+    def _validate(cls, path_exp: str) -> ValidationIssues:
         path_exp, placeholders = encode_strings(path_exp)
         if (
             path_exp.count("[") > 1
@@ -149,7 +164,9 @@ class PatchPath:
             Deserialized `PatchPath`.
         """
         try:
-            return cls._deserialize(path_exp)
+            return cls.deserialize_cache.get_or_set(
+                (cls, path_exp), lambda: cls._deserialize(path_exp)
+            )
         except Exception:
             raise ValueError("invalid path expression")
 
@@ -295,3 +312,7 @@ class PatchPath:
                 sub_attributes=[value_attr],
             ),
         )
+
+
+on_change(PatchPath.validate_cache.clear)
+on_change(PatchPath.deserialize_cache.clear)
@@ -1,12 +1,15 @@
 import warnings
 from copy import copy
+from dataclasses import dataclass
 from typing import Any, Iterable, Mapping, MutableMapping, Optional, Union, cast
 
 from typing_extensions import Self
 
-from scimpler._registry import register_resource_schema, register_schema
+import scimpler.config
+from scimpler._registry import on_change, register_resource_schema, register_schema
 from scimpler.data.attr_value_presence import (
     AttrValuePresenceConfig,
+    DataDirection,
     DataInclusivity,
     validate_presence,
 )
@@ -23,8 +26,16 @@ from scimpler.data.attrs import (
     String,
     UriReference,
 )
-from scimpler.data.identifiers import BoundedAttrRep, SchemaUri
-from scimpler.data.scim_data import Invalid, Missing, ScimData
+from scimpler.data.cache import LRUCache
+from scimpler.data.identifiers import AttrName, AttrRep, BoundedAttrRep, SchemaUri
+from scimpler.data.scim_data import Invalid, Missing, ParsedKey, ScimData, mask_invalid
+from scimpler.data.utils import (
+    DEFAULT_CHUNK_SIZE,
+    ValidationSteps,
+    arun_validation,
+    check_max_errors,
+    run_validation,
+)
 from scimpler.error import ValidationError, ValidationIssues
 from scimpler.warning import ScimpleUserWarning
 
@@ -39,6 +50,15 @@ def _bulk_id_validator(value) -> ValidationIssues:
     return issues
 
 
+def _find_key(data: Mapping, key: str) -> str:
+    # attribute names are case-insensitive, so the existing key is reused, whatever its case
+    key_lower = key.lower()
+    for data_key in data:
+        if isinstance(data_key, str) and data_key.lower() == key_lower:
+            return data_key
+    return key
+
+
 class SchemaMeta(type):
     def __init__(cls, name, bases, dct):
         super().__init__(name, bases, dct)
@@ -50,9 +70,12 @@ class SchemaMeta(type):
 class BaseSchema(metaclass=SchemaMeta):
     """
     Base class for all schemas. Includes `schemas` attribute to attributes defined in subclasses.
+
+    Validation plans compiled with `compile_validator` are cached in `validation_plan_cache`.
     """
 
     schema: Union[str, SchemaUri]
+    validation_plan_cache: LRUCache[tuple, "ValidationPlan"] = LRUCache(maxsize=256)
     base_attrs: list[Attribute] = [
         UriReference(
             name="schemas",
@@ -154,6 +177,7 @@ class BaseSchema(metaclass=SchemaMeta):
         self,
         data: Mapping[str, Any],
         presence_config: Optional[AttrValuePresenceConfig] = None,
+        max_errors: Optional[int] = None,
         **kwargs: Any,
     ) -> ValidationIssues:
         """
@@ -169,29 +193,139 @@ class BaseSchema(metaclass=SchemaMeta):
         returnability, and issuer is checked, depending on the data flow direction.
 
         Extended built-in validation logic is supplied with `_validate` method, implemented
-        in subclasses.
+        in subclasses, or with `_iter_validate` method, if the logic includes validation
+        of collections of items.
+
+        If `max_errors` is specified, the validation stops as soon as at least `max_errors`
+        errors are found, so only the first errors are reported (e.g. `max_errors=1` makes
+        the validation fail fast).
+
+        Args:
+            data: The data to be validated.
+            presence_config: Presence config that enables additional validation of correctness
+                of values presence.
+            max_errors: Number of errors after which the validation stops.
+            **kwargs: Additional parameters passed to `_iter_validate` method.
+
+        Returns:
+            Validation issues.
+
+        Raises:
+            ValueError: If `max_errors` is lower than 1.
+        """
+        check_max_errors(max_errors)
+        return run_validation(
+            self.iter_validate(data, presence_config, max_errors, **kwargs),
+            executor=kwargs.get("executor"),
+            chunk_size=kwargs.get("chunk_size", DEFAULT_CHUNK_SIZE),
+        )
+
+    async def avalidate(
+        self,
+        data: Mapping[str, Any],
+        presence_config: Optional[AttrValuePresenceConfig] = None,
+        max_errors: Optional[int] = None,
+        **kwargs: Any,
+    ) -> ValidationIssues:
+        """
+        Asynchronous counterpart of `validate`, returning the same validation issues. Collections
+        of items, like `Resources` in list response, are validated in chunks, and the control is
+        given back to the event loop between them.
 
         Args:
             data: The data to be validated.
             presence_config: Presence config that enables additional validation of correctness
                 of values presence.
-            **kwargs: Additional parameters passed to `_validate` method.
+            max_errors: Number of errors after which the validation stops.
+            **kwargs: Additional parameters passed to `_iter_validate` method.
 
         Returns:
             Validation issues.
+
+        Raises:
+            ValueError: If `max_errors` is lower than 1.
+        """
+        check_max_errors(max_errors)
+        return await arun_validation(
+            self.iter_validate(data, presence_config, max_errors, **kwargs),
+            executor=kwargs.get("executor"),
+            chunk_size=kwargs.get("chunk_size", DEFAULT_CHUNK_SIZE),
+        )
+
+    def iter_validate(
+        self,
+        data: Mapping[str, Any],
+        presence_config: Optional[AttrValuePresenceConfig] = None,
+        max_errors: Optional[int] = None,
+        **kwargs: Any,
+    ) -> ValidationSteps:
+        """
+        Returns validation steps of `validate`, to be run with `run_validation` or
+        `arun_validation`, or to be included in other validation steps.
         """
         issues = ValidationIssues()
-        data = ScimData(data)
-        issues.merge(self._validate_data(data, presence_config))
+        normalized = ScimData.view(data)
+        issues.merge(self.compile_validator(presence_config).validate(normalized, max_errors))
+        if issues.limit_reached(max_errors):
+            return issues
+        normalized = mask_invalid(normalized, issues)
 
-        if data.get("schemas"):
+        if normalized.get("schemas"):
             issues.merge(
-                self._validate_schemas_field(data),
+                self._validate_schemas_field(normalized),
                 location=["schemas"],
             )
-        issues.merge(self._validate(data, **kwargs))
+            if issues.limit_reached(max_errors):
+                return issues
+            normalized = mask_invalid(normalized, issues)
+        issues.merge(
+            (
+                yield from self._iter_validate(
+                    normalized, max_errors=issues.remaining_errors(max_errors), **kwargs
+                )
+            )
+        )
         return issues
 
+    def compile_validator(
+        self, presence_config: Optional[AttrValuePresenceConfig] = None
+    ) -> "ValidationPlan":
+        """
+        Compiles the validation plan of the schema attributes for the provided `presence_config`.
+        Plans are cached in `validation_plan_cache`, keyed by the schema, and the direction,
+        attribute representations, `include` flag, and attributes with ignored issuer of the
+        presence config, so equivalent presence configs share the same plan.
+
+        Args:
+            presence_config: Presence config the plan is compiled for.
+
+        Returns:
+            The validation plan.
+
+        Examples:
+            >>> from scimpler.schemas import UserSchema
+            >>>
+            >>> schema = UserSchema()
+            >>> plan = schema.compile_validator(
+            >>>     AttrValuePresenceConfig("RESPONSE", attr_reps=["userName"], include=True)
+            >>> )
+            >>> plan is schema.compile_validator(
+            >>>     AttrValuePresenceConfig("RESPONSE", attr_reps=["USERNAME"], include=True)
+            >>> )
+            True
+        """
+        key: tuple = (self,)
+        if presence_config is not None:
+            key += (
+                presence_config.direction,
+                frozenset((type(attr_rep), attr_rep) for attr_rep in presence_config.attr_reps),
+                presence_config.include,
+                frozenset((type(attr_rep), attr_rep) for attr_rep in presence_config.ignore_issuer),
+            )
+        return BaseSchema.validation_plan_cache.get_or_set(
+            key, lambda: ValidationPlan(self, presence_config)
+        )
+
     def clone(self, attr_filter: AttrFilter) -> Self:
         """
         Clones the schema with attributes filtered with the provided `attr_filter`.
@@ -208,16 +342,14 @@ class BaseSchema(metaclass=SchemaMeta):
             if item is Invalid:
                 continue
             try:
-                parsed = SchemaUri(item)
-                provided_schemas[i] = parsed
-                valid_schemas_parsed.append(parsed)
+                valid_schemas_parsed.append(SchemaUri(item))
             except ValueError:
                 issues.add_error(
                     issue=ValidationError.bad_value_syntax(),
                     location=[i],
                     proceed=False,
                 )
-                provided_schemas[i] = Invalid
+                issues.mark_invalid([i])
 
         if len(valid_schemas_parsed) > len(set(valid_schemas_parsed)):
             issues.add_error(
@@ -245,146 +377,250 @@ class BaseSchema(metaclass=SchemaMeta):
             )
         return issues
 
+    def _iter_validate(self, data: ScimData, **kwargs) -> ValidationSteps:
+        yield from ()
+        return self._validate(data, **kwargs)
+
     def _validate(self, data: ScimData, **kwargs) -> ValidationIssues:
         return ValidationIssues()
 
-    def _validate_data(
+    def _is_attr_required_by_schema(
         self,
+        attr_rep: BoundedAttrRep,
         data: ScimData,
+    ) -> bool:
+        return True
+
+    def include_schema_data(self, data: MutableMapping) -> None:
+        """
+        Includes the `schemas` attribute value in the provided `data`.
+        """
+        data["schemas"] = [self.schema]
+
+
+def validate_resource_type_consistency(
+    resource_type: str,
+    expected: str,
+) -> ValidationIssues:
+    issues = ValidationIssues()
+    if resource_type != expected:
+        issues.add_error(
+            issue=ValidationError.must_be_equal_to(expected),
+            proceed=True,
+            location=("meta", "resourceType"),
+        )
+    return issues
+
+
+@dataclass(frozen=True)
+class _SubAttrPlan:
+    __slots__ = ("name", "key", "attr", "ignore_issuer", "inclusivity")
+    name: AttrName
+    key: ParsedKey
+    attr: Attribute
+    ignore_issuer: bool
+    inclusivity: Optional[DataInclusivity]
+
+
+@dataclass(frozen=True)
+class _AttrPlan:
+    __slots__ = (
+        "attr_rep",
+        "key",
+        "attr",
+        "location",
+        "ignore_issuer",
+        "inclusivity",
+        "sub_attrs",
+    )
+    attr_rep: BoundedAttrRep
+    key: ParsedKey
+    attr: Attribute
+    location: tuple[str, ...]
+    ignore_issuer: bool
+    inclusivity: Optional[DataInclusivity]
+    sub_attrs: tuple[_SubAttrPlan, ...]
+
+
+class ValidationPlan:
+    """
+    Validation plan of the schema attributes, compiled for the specific presence configuration.
+    Attributes and sub-attributes of the schema are flattened, and their presence rules
+    (inclusivity and issuer checks) are resolved once, when the plan is compiled, instead of
+    every time the data is validated. Use `BaseSchema.compile_validator` to get cached plans.
+    """
+
+    def __init__(
+        self,
+        schema: BaseSchema,
         presence_config: Optional[AttrValuePresenceConfig] = None,
+    ):
+        """
+        Args:
+            schema: The schema the plan is compiled for.
+            presence_config: Presence config the plan is compiled for. If not provided,
+                the presence of values is not validated.
+        """
+        self._schema = schema
+        self._direction = presence_config.direction if presence_config else None
+        self._attrs = tuple(
+            self._compile_attr(attr_rep, attr, presence_config) for attr_rep, attr in schema.attrs
+        )
+
+    @property
+    def schema(self) -> BaseSchema:
+        """
+        The schema the plan is compiled for.
+        """
+        return self._schema
+
+    def validate(
+        self, data: Mapping[str, Any], max_errors: Optional[int] = None
     ) -> ValidationIssues:
+        """
+        Validates the provided data according to the schema attributes configuration and
+        the compiled presence rules. Unlike `BaseSchema.validate`, it does not validate
+        the content of `schemas` attribute, nor runs additional validation logic of the schema.
+
+        Args:
+            data: The data to be validated.
+            max_errors: Number of errors after which the validation stops.
+
+        Returns:
+            Validation issues.
+        """
+        data = ScimData.view(data)
         issues = ValidationIssues()
-        for attr_rep, attr in self.attrs:
-            value = data.get(attr_rep)
-            issues_ = attr.validate(value)
+        # only `schemas` is read when checking if attribute is required by schema, so the data
+        # is masked again only if `schemas` value is marked as invalid
+        masked_data = data
+        for attr_plan in self._attrs:
+            if issues.limit_reached(max_errors):
+                break
+            value = data.get(attr_plan.key)
+            issues_ = attr_plan.attr.validate(value, issues.remaining_errors(max_errors))
+            if not issues_.can_proceed():
+                issues_.mark_invalid()
             issues.merge(
                 issues=issues_,
-                location=attr_rep.location,
+                location=attr_plan.location,
             )
-            if not issues_.can_proceed():
-                data.set(attr_rep, Invalid)
-            elif presence_config:
+            if [part.lower() for part in attr_plan.location] == ["schemas"] and list(
+                issues_.invalid_locations
+            ):
+                masked_data = ScimData({"schemas": mask_invalid(value, issues_)})
+            if self._direction is not None and issues_.can_proceed():
                 issues.merge(
                     self._validate_presence(
-                        attr=attr,
-                        attr_rep=attr_rep,
-                        value=value,
-                        presence_config=presence_config,
-                        required_by_schema=self._is_attr_required_by_schema(attr_rep, data),
+                        attr_plan=attr_plan,
+                        value=mask_invalid(value, issues_),
+                        required_by_schema=self._schema._is_attr_required_by_schema(
+                            attr_plan.attr_rep, masked_data
+                        ),
                     ),
-                    location=attr_rep.location,
+                    location=attr_plan.location,
                 )
         return issues
 
     def _validate_presence(
         self,
-        attr: Attribute,
-        attr_rep: BoundedAttrRep,
+        attr_plan: _AttrPlan,
         value: Any,
-        presence_config: AttrValuePresenceConfig,
         required_by_schema: bool,
     ) -> ValidationIssues:
-        if isinstance(attr, Complex):
-            return self._validate_presence_complex(
-                attr=attr,
-                attr_rep=attr_rep,
-                value=value,
-                presence_config=presence_config,
-                required_by_schema=required_by_schema,
-            )
+        attr = attr_plan.attr
+        if not isinstance(attr, Complex) and attr.multi_valued and value:
+            issues = ValidationIssues()
+            for item in value:
+                issues.merge(self._validate_value_presence(attr_plan, item, required_by_schema))
+            return issues
 
-        issues = ValidationIssues()
-        if attr.multi_valued and value:
-            for i, item in enumerate(value):
+        issues = self._validate_value_presence(attr_plan, value, required_by_schema)
+        if issues.has_errors():
+            return issues
+
+        for sub_attr_plan in attr_plan.sub_attrs:
+            if attr.multi_valued:
+                for i, item in enumerate(value or []):
+                    if item is Invalid:
+                        continue
+                    issues.merge(
+                        self._validate_value_presence(
+                            sub_attr_plan, item.get(sub_attr_plan.key), required_by_schema
+                        ),
+                        location=[i, sub_attr_plan.name],
+                    )
+            else:
                 issues.merge(
-                    self._validate_attr_value_presence(
-                        attr=attr,
-                        attr_rep=attr_rep,
-                        value=item,
-                        presence_config=presence_config,
-                        required_by_schema=required_by_schema,
+                    self._validate_value_presence(
+                        sub_attr_plan,
+                        value.get(sub_attr_plan.key) if value else Missing,
+                        required_by_schema,
                     ),
+                    location=[sub_attr_plan.name],
                 )
-            return issues
-
-        issues.merge(
-            self._validate_attr_value_presence(
-                attr=attr,
-                attr_rep=attr_rep,
-                value=value,
-                presence_config=presence_config,
-                required_by_schema=required_by_schema,
-            ),
-        )
         return issues
 
-    def _validate_presence_complex(
+    def _validate_value_presence(
         self,
-        attr: Complex,
-        attr_rep: BoundedAttrRep,
+        plan: Union[_AttrPlan, _SubAttrPlan],
         value: Any,
-        presence_config: AttrValuePresenceConfig,
         required_by_schema: bool,
     ) -> ValidationIssues:
-        issues = self._validate_attr_value_presence(
-            attr=attr,
-            attr_rep=attr_rep,
+        return validate_presence(
+            attr=plan.attr,
             value=value,
-            presence_config=presence_config,
+            direction=cast(DataDirection, self._direction),
+            ignore_issuer=plan.ignore_issuer,
+            inclusivity=plan.inclusivity,
             required_by_schema=required_by_schema,
         )
-        if issues.has_errors():
-            return issues
 
-        for sub_attr_name, sub_attr in attr.attrs:
-            bounded_sub_attr_rep = BoundedAttrRep(
-                schema=attr_rep.schema,
-                attr=attr_rep.attr,
-                sub_attr=sub_attr_name,
+    @staticmethod
+    def _compile_attr(
+        attr_rep: BoundedAttrRep,
+        attr: Attribute,
+        presence_config: Optional[AttrValuePresenceConfig],
+    ) -> _AttrPlan:
+        key = ScimData.parse_key(attr_rep)
+        if presence_config is None:
+            return _AttrPlan(
+                attr_rep=attr_rep,
+                key=key,
+                attr=attr,
+                location=attr_rep.location,
+                ignore_issuer=False,
+                inclusivity=None,
+                sub_attrs=(),
             )
-            if attr.multi_valued:
-                if not value:
-                    continue
 
-                for i, item in enumerate(value):
-                    issues.merge(
-                        self._validate_attr_value_presence(
-                            attr=sub_attr,
-                            attr_rep=bounded_sub_attr_rep,
-                            value=item.get(sub_attr_name),
-                            presence_config=presence_config,
-                            required_by_schema=required_by_schema,
+        sub_attrs = []
+        if isinstance(attr, Complex):
+            for sub_attr_name, sub_attr in attr.attrs:
+                sub_attr_rep = BoundedAttrRep(
+                    schema=attr_rep.schema,
+                    attr=attr_rep.attr,
+                    sub_attr=sub_attr_name,
+                )
+                sub_attrs.append(
+                    _SubAttrPlan(
+                        name=sub_attr_name,
+                        key=ScimData.parse_key(AttrRep(attr=sub_attr_name)),
+                        attr=sub_attr,
+                        ignore_issuer=sub_attr_rep in presence_config.ignore_issuer,
+                        inclusivity=ValidationPlan._get_inclusivity(
+                            sub_attr, sub_attr_rep, presence_config
                         ),
-                        location=[i, sub_attr_name],
                     )
-            else:
-                issues.merge(
-                    self._validate_attr_value_presence(
-                        attr=sub_attr,
-                        attr_rep=bounded_sub_attr_rep,
-                        value=value.get(sub_attr_name) if value else Missing,
-                        presence_config=presence_config,
-                        required_by_schema=required_by_schema,
-                    ),
-                    location=[sub_attr_name],
                 )
-        return issues
-
-    @staticmethod
-    def _validate_attr_value_presence(
-        attr: Attribute,
-        attr_rep: BoundedAttrRep,
-        value: Any,
-        presence_config: AttrValuePresenceConfig,
-        required_by_schema: bool,
-    ):
-        return validate_presence(
+        return _AttrPlan(
+            attr_rep=attr_rep,
+            key=key,
             attr=attr,
-            value=value,
-            direction=presence_config.direction,
+            location=attr_rep.location,
             ignore_issuer=attr_rep in presence_config.ignore_issuer,
-            inclusivity=BaseSchema._get_inclusivity(attr, attr_rep, presence_config),
-            required_by_schema=required_by_schema,
+            inclusivity=ValidationPlan._get_inclusivity(attr, attr_rep, presence_config),
+            sub_attrs=tuple(sub_attrs),
         )
 
     @staticmethod
@@ -406,7 +642,7 @@ class BaseSchema(metaclass=SchemaMeta):
             return DataInclusivity.EXCLUDE
 
         if isinstance(attr, Complex):
-            return BaseSchema._get_inclusivity_complex(attr_rep, presence_config)
+            return ValidationPlan._get_inclusivity_complex(attr_rep, presence_config)
 
         if not attr_rep.is_sub_attr:
             return None
@@ -417,7 +653,7 @@ class BaseSchema(metaclass=SchemaMeta):
             # and potential errors should be delegated to it
             return None
 
-        return BaseSchema._get_inclusivity_based_on_siblings(attr_rep, presence_config)
+        return ValidationPlan._get_inclusivity_based_on_siblings(attr_rep, presence_config)
 
     @staticmethod
     def _get_inclusivity_complex(
@@ -468,33 +704,6 @@ class BaseSchema(metaclass=SchemaMeta):
 
         return None
 
-    def _is_attr_required_by_schema(
-        self,
-        attr_rep: BoundedAttrRep,
-        data: ScimData,
-    ) -> bool:
-        return True
-
-    def include_schema_data(self, data: MutableMapping) -> None:
-        """
-        Includes the `schemas` attribute value in the provided `data`.
-        """
-        data["schemas"] = [self.schema]
-
-
-def validate_resource_type_consistency(
-    resource_type: str,
-    expected: str,
-) -> ValidationIssues:
-    issues = ValidationIssues()
-    if resource_type != expected:
-        issues.add_error(
-            issue=ValidationError.must_be_equal_to(expected),
-            proceed=True,
-            location=("meta", "resourceType"),
-        )
-    return issues
-
 
 class BaseResourceSchema(BaseSchema):
     """
@@ -549,10 +758,49 @@ class BaseResourceSchema(BaseSchema):
         Includes `schemas` and `meta.resourceType` attribute values in the provided `data`.
         """
         super().include_schema_data(data)
-        if "meta" in data:
-            data["meta"]["resourceType"] = self.name
+        meta_key = _find_key(data, "meta")
+        if meta_key in data:
+            data[meta_key]["resourceType"] = self.name
         else:
-            data["meta"] = {"resourceType": self.name}
+            data[meta_key] = {"resourceType": self.name}
+
+    def include_version(
+        self,
+        data: MutableMapping,
+        config: Optional[scimpler.config.ServiceProviderConfig] = None,
+    ) -> None:
+        """
+        Includes the `meta.version` attribute value in the provided `data`, if `etag` is enabled
+        in the service provider configuration. The version is a weak entity tag, generated from
+        `ScimData.fingerprint` of the data without `meta.version`, so it changes only when
+        the content of the resource changes.
+
+        Args:
+            data: The resource data to include the version in.
+            config: Service provider configuration. If not provided, defaults to
+                `scimpler.config.service_provider_config`.
+
+        Examples:
+            >>> from scimpler.config import ServiceProviderConfig
+            >>> from scimpler.schemas import UserSchema
+            >>>
+            >>> data = {"id": "1", "userName": "Pagerous"}
+            >>> UserSchema().include_version(
+            >>>     data, ServiceProviderConfig.create(etag={"supported": True})
+            >>> )
+            >>> data["meta"]
+            {"version": 'W/"26dae33017f4bc72af4041751be6ad0c"'}
+        """
+        config = config or scimpler.config.service_provider_config
+        if not config.etag.supported:
+            return
+
+        meta_key = _find_key(data, "meta")
+        if meta_key not in data:
+            data[meta_key] = {}
+        meta = data[meta_key]
+        meta.pop(_find_key(meta, "version"), None)
+        meta["version"] = f'W/"{ScimData.view(data).fingerprint()}"'
 
 
 class ResourceSchema(BaseResourceSchema):
@@ -672,6 +920,7 @@ class ResourceSchema(BaseResourceSchema):
             schema=cast(SchemaUri, extension.schema),
             attrs=extension.attrs,
         )
+        BaseSchema.validation_plan_cache.clear()
 
     def _validate(self, data: ScimData, **kwargs) -> ValidationIssues:
         issues = ValidationIssues()
@@ -691,7 +940,11 @@ class ResourceSchema(BaseResourceSchema):
 
     def _validate_schemas_field(self, data: ScimData) -> ValidationIssues:
         issues = super()._validate_schemas_field(data)
-        provided_schemas = data.get("schemas")
+        provided_schemas = [
+            SchemaUri(item)
+            for i, item in enumerate(data.get("schemas"))
+            if item is not Invalid and not issues.is_invalid([i])
+        ]
         for k, v in data.items():
             possible_schema = SchemaUri(k)
             if possible_schema in self.schemas and possible_schema not in provided_schemas:
@@ -762,3 +1015,6 @@ class SchemaExtension:
         Attributes that belong to the extension.
         """
         return self._attrs
+
+
+on_change(BaseSchema.validation_plan_cache.clear)
@@ -1,9 +1,27 @@
+import hashlib
+import itertools
+import json
+import math
 from collections.abc import Mapping, MutableMapping
 from dataclasses import dataclass
-from typing import Any, Iterable, Optional, Union
-
-from scimpler._registry import schemas
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+    cast,
+)
+
+from scimpler._registry import on_change, schemas
+from scimpler.data.cache import LRUCache
 from scimpler.data.identifiers import AttrRep, AttrRepFactory, BoundedAttrRep, SchemaUri
+from scimpler.error import ValidationIssues
 
 
 class InvalidType:
@@ -42,23 +60,41 @@ class MissingType:
 Missing = MissingType()
 
 
-@dataclass
+@dataclass(frozen=True)
 class _SchemaKey:
+    __slots__ = ("schema",)
     schema: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class _AttrKey:
+    __slots__ = ("attr", "sub_attr")
     attr: str
     sub_attr: Optional[str]
 
 
-@dataclass
+@dataclass(frozen=True)
 class _BoundedAttrKey(_AttrKey):
+    __slots__ = ("schema", "extension")
     schema: str
     extension: bool
 
 
+# parsed form of keys, returned from `ScimData.parse_key`
+ParsedKey = Union[_SchemaKey, _AttrKey]
+
+# every modification of any data gets new, unique version, so concurrent modifications
+# of different data never produce the same version
+_VERSIONS = itertools.count()
+
+
+class _Fingerprint(NamedTuple):
+    version: int
+    value: str
+    nested: list[tuple["ScimData", str]]  # nested data with their fingerprints at the time
+    lists: list[tuple[list, tuple]]  # lists with their items at the time
+
+
 class ScimData(MutableMapping):
     """
     Mapping that implements reading and updating data which is in line with SCIM requirements.
@@ -69,8 +105,14 @@ class ScimData(MutableMapping):
     (it is general rule, but there are exceptions). It would mean the 2-level nesting should be
     enough (or 3, for data from extensions), but `ScimData` has no such limitation. Every nesting
     level has no awareness of its parent key.
+
+    String keys are parsed on every access, so the parsed keys are cached in `normalize_cache`,
+    keyed by the provided string. The cache is cleared every time a new schema is registered.
     """
 
+    __slots__ = ("_source", "_data", "_lower_case_to_original", "_version", "_fingerprint")
+    normalize_cache: LRUCache[str, Union[_SchemaKey, _AttrKey]] = LRUCache(maxsize=1024)
+
     def __init__(
         self, d: Optional[Union[Mapping[str, Any], Mapping[AttrRep, Any], "ScimData"]] = None
     ):
@@ -100,17 +142,80 @@ class ScimData(MutableMapping):
             >>> ).to_dict()
             {"name": {"formatted": "John Doe"}, "externalId": "42"}
         """
+        self._source: Optional[Mapping] = None
         self._data: dict[str, Any] = {}
         self._lower_case_to_original: dict[str, str] = {}
+        # version of the entries, shared by all data that share the entries
+        self._version: list[int] = [next(_VERSIONS)]
+        self._fingerprint: Optional[_Fingerprint] = None
 
         if isinstance(d, ScimData):
             self._data = d._data
             self._lower_case_to_original = d._lower_case_to_original
+            self._version = d._version
         elif isinstance(d, Mapping):
             for key, value in d.items():
                 if not isinstance(key, (str, AttrRep)):
                     continue
-                self.set(key, value)
+                self._set(key, value)
+
+    @classmethod
+    def view(
+        cls, d: Optional[Union[Mapping[str, Any], Mapping[AttrRep, Any], "ScimData"]] = None
+    ) -> "ScimData":
+        """
+        Creates `ScimData` that is a lazy view over the provided data. Unlike the constructor,
+        which walks and copies the whole data immediately, the view keeps the reference to the
+        original mapping and builds its entries on first access. Nested mappings and items of
+        lists are wrapped in views as well, so parts of the data that are never accessed are
+        never copied. The original data is never modified through the view.
+
+        Views are handy when the data is only read (e.g. filtered or validated), and only some
+        of its attributes are accessed. Since the data is read lazily, changes made to
+        the original data before the first access to the view are visible in the view.
+
+        Args:
+            d: Optional data to create the view over. Supports the same types of keys as
+                the constructor.
+
+        Examples:
+            >>> data = {"userName": "Pagerous", "name": {"formatted": "AP"}}
+            >>> view = ScimData.view(data)
+            >>> view.get("name.formatted")
+            "AP"
+            >>> view.set("userName", "bjensen")
+            >>> data["userName"]
+            "Pagerous"
+        """
+        if not isinstance(d, Mapping) or isinstance(d, ScimData):
+            return cls(d)
+        view = cls.__new__(cls)
+        view._source = d
+        view._version = [next(_VERSIONS)]
+        view._fingerprint = None
+        return view
+
+    def __getattr__(self, name: str) -> Any:
+        # entries of views are built on first access to the data, see `ScimData.view`
+        if name in ("_data", "_lower_case_to_original") and self._source is not None:
+            self._materialize()
+            return getattr(self, name)
+        raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+    def _materialize(self) -> None:
+        source, self._source = self._source, None
+        self._data = {}
+        self._lower_case_to_original = {}
+        for key, value in cast(Mapping, source).items():
+            if not isinstance(key, (str, AttrRep)):
+                continue
+            if isinstance(value, Mapping):
+                value = ScimData.view(value)
+            elif not isinstance(value, str) and isinstance(value, Iterable):
+                value = [
+                    ScimData.view(item) if isinstance(item, Mapping) else item for item in value
+                ]
+            self._set(key, value)
 
     def __repr__(self):
         return f"{self.__class__.__name__}({str(self._data)})"
@@ -216,10 +321,20 @@ class ScimData(MutableMapping):
                 }
             }
         """
+        self._set(key, value)
+
+    def _set(self, key: Union[str, AttrRep, _SchemaKey, _AttrKey], value: Any) -> None:
+        self._version[0] = next(_VERSIONS)
         if isinstance(value, Mapping):
-            value = ScimData(value)
+            if not isinstance(value, ScimData):
+                value = ScimData(value)
         elif not isinstance(value, str) and isinstance(value, Iterable):
-            value = [ScimData(item) if isinstance(item, Mapping) else item for item in value]
+            value = [
+                ScimData(item)
+                if isinstance(item, Mapping) and not isinstance(item, ScimData)
+                else item
+                for item in value
+            ]
 
         if not isinstance(key, (_SchemaKey, _AttrKey)):
             key = self._normalize(key)
@@ -244,7 +359,7 @@ class ScimData(MutableMapping):
             extension = key.schema
             self._lower_case_to_original[key.schema.lower()] = extension
             self._data[extension] = ScimData()
-        self._data[extension].set(_AttrKey(attr=key.attr, sub_attr=key.sub_attr), value)
+        self._data[extension]._set(_AttrKey(attr=key.attr, sub_attr=key.sub_attr), value)
 
     def _set_base_attr(self, key: _AttrKey, value: Any) -> None:
         if not key.sub_attr:
@@ -264,7 +379,7 @@ class ScimData(MutableMapping):
         if not isinstance(parent_value, ScimData):
             raise KeyError(f"can not assign ({key.sub_attr}, {value}) to '{key.attr}'")
 
-        self._data[parent_attr_key].set(_AttrKey(attr=key.sub_attr, sub_attr=None), value)
+        self._data[parent_attr_key]._set(_AttrKey(attr=key.sub_attr, sub_attr=None), value)
 
     def get(self, key: Union[str, AttrRep, _SchemaKey, _AttrKey], default: Any = Missing) -> Any:
         """
@@ -383,7 +498,7 @@ class ScimData(MutableMapping):
         Pops the `key` from the data. Works similarly to `get` with the difference that after
         returning the value, it is not available in the data any longer.
         """
-
+        self._version[0] = next(_VERSIONS)
         if not isinstance(key, (_SchemaKey, _AttrKey)):
             key = self._normalize(key)
         if isinstance(key, _SchemaKey):
@@ -423,8 +538,33 @@ class ScimData(MutableMapping):
         self._lower_case_to_original.pop(key.attr.lower())
         return self._data.pop(attr, default)
 
+    @classmethod
+    def parse_key(cls, key: Union[str, AttrRep]) -> ParsedKey:
+        """
+        Parses the `key` the same way `get`, `set`, and `pop` do. Parsed keys are accepted by
+        these methods as well, so keys that are used many times can be parsed once.
+
+        Args:
+            key: The key to parse.
+
+        Returns:
+            The parsed key.
+
+        Examples:
+            >>> key = ScimData.parse_key("name.formatted")
+            >>> ScimData({"name": {"formatted": "AP"}}).get(key)
+            "AP"
+        """
+        return cls._normalize(key)
+
+    @classmethod
+    def _normalize(cls, value: Union[str, AttrRep]) -> Union[_SchemaKey, _AttrKey]:
+        if value.__class__ is str:  # subclasses, like `SchemaUri`, are parsed differently
+            return cls.normalize_cache.get_or_set(value, lambda: cls._parse_key(value))
+        return cls._parse_key(value)
+
     @staticmethod
-    def _normalize(value: Union[str, AttrRep]) -> Union[_SchemaKey, _AttrKey]:
+    def _parse_key(value: Union[str, AttrRep]) -> Union[_SchemaKey, _AttrKey]:
         if isinstance(value, SchemaUri):
             if schemas.get(value, False) is False:
                 raise KeyError(
@@ -480,8 +620,98 @@ class ScimData(MutableMapping):
                 output[str(key)] = value
         return output
 
+    def iter_json(self, default: Optional[Callable[[Any], Any]] = None) -> Iterator[str]:
+        """
+        Encodes the data to JSON, chunk by chunk. The output is the same as the one of
+        `json.dumps(data.to_dict())`, but the data is encoded directly, without converting it to
+        ordinary dictionary first.
+
+        Args:
+            default: Function that returns a serializable version of a value that can not
+                be serialized otherwise (e.g. `datetime`), as in `json.dumps`.
+
+        Returns:
+            Generator of JSON chunks.
+
+        Examples:
+            >>> "".join(ScimData({"userName": "Pagerous", "name": {"formatted": "AP"}}).iter_json())
+            '{"userName": "Pagerous", "name": {"formatted": "AP"}}'
+        """
+        encoder = _ENCODER if default is None else json.JSONEncoder(default=default)
+        return _iter_json(self, encoder)
+
+    def write_json(self, fp: IO[str], default: Optional[Callable[[Any], Any]] = None) -> None:
+        """
+        Writes the data to the provided text file-like object, encoded to JSON. See `iter_json`.
+
+        Args:
+            fp: File-like object to write to.
+            default: Function that returns a serializable version of a value that can not
+                be serialized otherwise (e.g. `datetime`), as in `json.dump`.
+        """
+        fp.writelines(self.iter_json(default))
+
+    def fingerprint(self) -> str:
+        """
+        Returns the content hash of the data. The fingerprint does not depend on the order of
+        keys, nor on their case, so it is the same for all data that are equal. Values are
+        compared the same way as Python compares them, so e.g. `1` and `1.0` or timezone-aware
+        `datetime` objects that represent the same point in time have the same fingerprint.
+        Values of other types than `str`, numbers, `None`, and `datetime` are hashed by
+        their `repr`.
+
+        The fingerprint is cached, and the nested data keep their own fingerprints, so
+        they are not computed again for unchanged data. The cache is outdated when the data,
+        or any data nested in it, is modified, including lists modified in place.
+
+        Returns:
+            Hexadecimal digest of the data.
+
+        Examples:
+            >>> data = ScimData({"userName": "Pagerous", "name": {"formatted": "AP"}})
+            >>> data.fingerprint() == ScimData(
+            >>>     {"NAME": {"formatted": "AP"}, "username": "Pagerous"}
+            >>> ).fingerprint()
+            True
+        """
+        cached = self._cached_fingerprint()
+        if cached is not None:
+            return cached
+
+        version = self._version[0]
+        nested: list[tuple[ScimData, str]] = []
+        lists: list[tuple[list, tuple]] = []
+        hash_ = hashlib.blake2b(digest_size=16)
+        for key in sorted(self._data, key=str.lower):
+            value = self._data[key]
+            hash_.update(
+                f"{_ENCODER.encode(key.lower())}:{_fingerprint_of(value, nested, lists)};".encode()
+            )
+        fingerprint = hash_.hexdigest()
+        self._fingerprint = _Fingerprint(
+            version=version, value=fingerprint, nested=nested, lists=lists
+        )
+        return fingerprint
+
+    def _cached_fingerprint(self) -> Optional[str]:
+        cached = self._fingerprint
+        if cached is None or cached.version != self._version[0]:
+            return None
+        # lists are modified in place, without changing the version, so their items are
+        # compared by identity with the ones fingerprinted
+        for list_, items in cached.lists:
+            if len(list_) != len(items) or any(
+                item is not old_item for item, old_item in zip(list_, items)
+            ):
+                return None
+        # nested data are modified independently, so their fingerprints are checked as well
+        for item, fingerprint in cached.nested:
+            if item._cached_fingerprint() != fingerprint:
+                return None
+        return cached.value
+
     def __eq__(self, other: Any) -> bool:
-        if isinstance(other, Mapping):
+        if isinstance(other, Mapping) and not isinstance(other, ScimData):
             other = ScimData(other)
 
         if not isinstance(other, ScimData):
@@ -495,3 +725,115 @@ class ScimData(MutableMapping):
                 return False
 
         return True
+
+
+_ENCODER = json.JSONEncoder()
+
+
+def _iter_json(value: Any, encoder: json.JSONEncoder) -> Iterator[str]:
+    if isinstance(value, ScimData):
+        separator = "{"
+        for key, item in value._data.items():
+            yield f"{separator}{encoder.encode(str(key))}: "
+            yield from _iter_json(item, encoder)
+            separator = ", "
+        yield "{}" if separator == "{" else "}"
+    elif isinstance(value, list) and any(isinstance(item, ScimData) for item in value):
+        separator = "["
+        for item in value:
+            yield separator
+            yield from _iter_json(item, encoder)
+            separator = ", "
+        yield "]"
+    else:
+        # values that are not 'ScimData' are encoded at once, by the encoder itself
+        yield encoder.encode(value)
+
+
+def mask_invalid(value: Any, issues: ValidationIssues) -> Any:
+    """
+    Returns the `value` with `Invalid` in place of every value marked as invalid in the provided
+    validation `issues`. The `value` itself is not modified. Only `ScimData` and lists on paths
+    to the invalid values are copied, so the value is returned as it is, if there are no invalid
+    values.
+
+    Args:
+        value: The value to mask invalid values in.
+        issues: Validation issues of the value, with locations of invalid values.
+
+    Returns:
+        The value with invalid values masked.
+
+    Examples:
+        >>> issues = ValidationIssues()
+        >>> issues.mark_invalid(["emails", 1, "value"])
+        >>> data = ScimData({"emails": [{"value": "a@example.com"}, {"value": 42}]})
+        >>> mask_invalid(data, issues).to_dict()
+        {"emails": [{"value": "a@example.com"}, {"value": Invalid}]}
+    """
+    locations = list(issues.invalid_locations)
+    if not locations:
+        return value
+    return _mask_invalid(value, locations)
+
+
+def _mask_invalid(value: Any, locations: list[tuple]) -> Any:
+    if any(not location for location in locations):
+        return Invalid
+
+    locations_by_part: dict[Union[str, int], list[tuple]] = {}
+    for location in locations:
+        locations_by_part.setdefault(location[0], []).append(location[1:])
+
+    if isinstance(value, ScimData):
+        masked = ScimData()
+        masked._data = dict(value._data)
+        masked._lower_case_to_original = dict(value._lower_case_to_original)
+        for key, sub_locations in locations_by_part.items():
+            if not isinstance(key, str):
+                continue
+            original_key = masked._lower_case_to_original.get(key.lower())
+            if original_key in masked._data:
+                masked._data[original_key] = _mask_invalid(
+                    masked._data[original_key], sub_locations
+                )
+        return masked
+
+    if isinstance(value, list):
+        masked_items = list(value)
+        for index, sub_locations in locations_by_part.items():
+            if isinstance(index, int) and 0 <= index < len(masked_items):
+                masked_items[index] = _mask_invalid(masked_items[index], sub_locations)
+        return masked_items
+    return value
+
+
+def _fingerprint_of(
+    value: Any, nested: list[tuple[ScimData, str]], lists: list[tuple[list, tuple]]
+) -> str:
+    if isinstance(value, ScimData):
+        fingerprint = value.fingerprint()
+        nested.append((value, fingerprint))
+        return f"{{{fingerprint}}}"
+    if isinstance(value, list):
+        lists.append((value, tuple(value)))
+        return f"[{','.join(_fingerprint_of(item, nested, lists) for item in value)}]"
+    if isinstance(value, str):
+        return _ENCODER.encode(value)
+    if value is None:
+        return "null"
+    # numbers that are equal must have the same fingerprint, e.g. '1', '1.0', and 'True'
+    if isinstance(value, int):
+        return str(int(value))
+    if isinstance(value, (float, Decimal)):
+        if math.isnan(value) or math.isinf(value):
+            return repr(float(value))
+        if value == int(value):
+            return str(int(value))
+        return repr(float(value))
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).isoformat()
+    return repr(value)
+
+
+on_change(ScimData.normalize_cache.clear)
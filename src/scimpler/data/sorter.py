@@ -1,14 +1,29 @@
-import functools
+import abc
+import heapq
+import itertools
+import pickle
+import tempfile
 from collections.abc import MutableMapping
-from typing import Any, Iterable, Optional, Sequence, Union
+from operator import itemgetter
+from typing import IO, Any, Callable, Iterable, Iterator, Optional, Sequence, Union
+
+from typing_extensions import override
 
 from scimpler.data import AttrRepFactory
 from scimpler.data.attrs import Attribute, AttributeWithCaseExact, Complex, String
 from scimpler.data.schemas import BaseResourceSchema
 from scimpler.data.scim_data import AttrRep, Missing, ScimData
 
+# key of items without value, greater than keys of items with value, which are '(0, value)'
+_LAST_KEY = (1,)
+
 
 class AlwaysLastKey:
+    """
+    Sort key greater than any other key. Kept for backward compatibility, sorters use
+    precomputed keys instead.
+    """
+
     def __lt__(self, _):
         return False
 
@@ -17,6 +32,12 @@ class AlwaysLastKey:
 
 
 class StringKey:
+    """
+    Sort key of string values that respects case-sensitivity and PRECIS profile of
+    the attribute on every comparison. Kept for backward compatibility, sorters use
+    precomputed keys instead.
+    """
+
     def __init__(self, value: str, attr: Attribute):
         self._value = value
         self._attr = attr
@@ -33,9 +54,9 @@ class StringKey:
         other_value = other._value
 
         if isinstance(self._attr, String):
-            value = self._attr.precis.enforce(value)
+            value = self._attr.enforce_precis(value)
         if isinstance(other._attr, String):
-            other_value = other._attr.precis.enforce(other_value)
+            other_value = other._attr.enforce_precis(other_value)
 
         if (
             isinstance(self._attr, AttributeWithCaseExact)
@@ -48,36 +69,14 @@ class StringKey:
         return value.lower() < other_value.lower()
 
 
-class Sorter:
+class BaseSorter(abc.ABC):
     """
-    Sorter implementing sorting logic, as specified in RFC-7644.
+    Base class for sorters. Sorters compute a single, directly comparable key for every data
+    item before sorting, so the attribute values are normalized once per data item, not once
+    per comparison.
     """
 
-    def __init__(self, attr_rep: Union[str, AttrRep], asc: bool = True):
-        """
-        Args:
-            attr_rep: The representation of the attribute by which the data should be sorted.
-            asc: If set to `True`, it enables ascending sorting. Descending otherwise.
-        """
-        self._attr_rep = (
-            attr_rep if isinstance(attr_rep, AttrRep) else AttrRepFactory.deserialize(attr_rep)
-        )
-        self._asc = asc
-        self._default_value = AlwaysLastKey()
-
-    @property
-    def attr_rep(self) -> AttrRep:
-        """
-        The representation of the attribute by which the data should be sorted.
-        """
-        return self._attr_rep
-
-    @property
-    def asc(self) -> bool:
-        """
-        If `True`, ascending sorting is enabled. Descending otherwise.
-        """
-        return self._asc
+    _reverse: bool = False
 
     def __call__(
         self,
@@ -135,59 +134,386 @@ class Sorter:
             return normalized
         return self._sort(normalized, schema)
 
+    def find_out_of_order(
+        self,
+        data: Iterable[MutableMapping],
+        schema: Union[BaseResourceSchema, Sequence[BaseResourceSchema]],
+    ) -> Optional[int]:
+        """
+        Checks if the provided data is sorted according to the sorter configuration, without
+        sorting it. Keys of consecutive data items are compared, and the check stops at the first
+        data item that is out of order.
+
+        Args:
+            data: The data to check.
+            schema: Schema or schemas that describe the data, in the same manner as for full
+                sorting.
+
+        Returns:
+            Index of the first data item that should be ordered before its predecessor, or `None`
+            if the data is sorted.
+
+        Examples:
+            >>> from scimpler.schemas import UserSchema
+            >>>
+            >>> sorter = Sorter(attr_rep="userName", asc=True)
+            >>> sorter.find_out_of_order(
+            >>>     [{"userName": "a"}, {"userName": "c"}, {"userName": "b"}], UserSchema()
+            >>> )
+            2
+        """
+        keyed = self._iter_keyed((ScimData.view(item) for item in data), schema)
+        previous_keys, keys = itertools.tee(key for key, _ in keyed)
+        next(keys, None)
+        for i, (previous_key, key) in enumerate(zip(previous_keys, keys), start=1):
+            if previous_key < key if self._reverse else key < previous_key:
+                return i
+        return None
+
+    def page(
+        self,
+        data: Iterable[MutableMapping],
+        schema: Union[BaseResourceSchema, Sequence[BaseResourceSchema]],
+        start_index: int = 1,
+        count: Optional[int] = None,
+    ) -> list[ScimData]:
+        """
+        Returns the requested page of sorted data. The result is the same as slicing the output
+        of full sorting, but only `start_index + count - 1` data items are kept in memory and
+        ordered, so retrieving a small page from large data is much cheaper than sorting all of it.
+
+        Args:
+            data: The data to sort.
+            schema: Schema or schemas that describe the data, in the same manner as for full
+                sorting.
+            start_index: 1-based index of the first data item to return. Values lower than 1
+                are interpreted as 1, as specified in RFC-7644.
+            count: Maximum number of data items to return. Negative values are interpreted as 0.
+                If not provided, all data items starting from `start_index` are returned.
+
+        Returns:
+            The requested page of sorted data.
+
+        Examples:
+            >>> from scimpler.schemas import UserSchema
+            >>>
+            >>> sorter = Sorter(attr_rep="userName", asc=True)
+            >>> sorter.page(
+            >>>     [{"userName": "c"}, {"userName": "a"}, {"userName": "b"}],
+            >>>     UserSchema(),
+            >>>     start_index=2,
+            >>>     count=1,
+            >>> )
+            >>> [{"userName": "b"}]
+        """
+        start = max(start_index, 1) - 1
+        if count is None:
+            return self(data, schema)[start:]
+
+        stop = start + max(count, 0)
+        if stop == start:
+            return []
+        select = heapq.nlargest if self._reverse else heapq.nsmallest
+        keyed = select(
+            stop, self._iter_keyed((ScimData(item) for item in data), schema), key=itemgetter(0)
+        )
+        return [item for _, item in keyed[start:]]
+
+    def stream(
+        self,
+        data: Iterable[MutableMapping],
+        schema: Union[BaseResourceSchema, Sequence[BaseResourceSchema]],
+        run_size: int = 10_000,
+    ) -> Iterator[ScimData]:
+        """
+        Sorts the provided data, which may be larger than the available memory. The data is
+        consumed in runs of `run_size` data items. Every run is sorted in memory and written to
+        the temporary file, and the sorted runs are then merged lazily, so at most `run_size`
+        data items are kept in memory at once. The result is the same as for full sorting.
+
+        Args:
+            data: The data to sort. Can be any iterable, including generators.
+            schema: Schema or schemas that describe the data, in the same manner as for full
+                sorting.
+            run_size: Maximum number of data items that are sorted in memory at once.
+
+        Returns:
+            Generator of sorted data items. Temporary files are removed once the generator is
+            exhausted or closed.
+
+        Raises:
+            ValueError: If `run_size` is lower than 1.
+
+        Examples:
+            >>> from scimpler.schemas import UserSchema
+            >>>
+            >>> sorter = Sorter(attr_rep="userName", asc=True)
+            >>> list(
+            >>>     sorter.stream(
+            >>>         ({"userName": name} for name in ["c", "a", "b"]), UserSchema(), run_size=2
+            >>>     )
+            >>> )
+            >>> [{"userName": "a"}, {"userName": "b"}, {"userName": "c"}]
+        """
+        if run_size < 1:
+            raise ValueError("run_size must be greater than 0")
+        return self._stream(data, schema, run_size)
+
+    def _stream(
+        self,
+        data: Iterable[MutableMapping],
+        schema: Union[BaseResourceSchema, Sequence[BaseResourceSchema]],
+        run_size: int,
+    ) -> Iterator[ScimData]:
+        keyed = self._iter_keyed((ScimData(item) for item in data), schema)
+        runs: list[IO[bytes]] = []
+        try:
+            while True:
+                run = list(itertools.islice(keyed, run_size))
+                if len(run) < run_size and not runs:
+                    # all data fits in memory, so there is nothing to spill
+                    yield from (
+                        item for _, item in sorted(run, key=itemgetter(0), reverse=self._reverse)
+                    )
+                    return
+                if not run:
+                    break
+                runs.append(self._spill(run))
+
+            merged = heapq.merge(
+                *(self._load(file) for file in runs), key=itemgetter(0), reverse=self._reverse
+            )
+            for _, item in merged:
+                yield ScimData(item)
+        finally:
+            for file in runs:
+                file.close()
+
+    def _spill(self, run: list[tuple[tuple, ScimData]]) -> IO[bytes]:
+        file = tempfile.TemporaryFile()
+        try:
+            for key, item in sorted(run, key=itemgetter(0), reverse=self._reverse):
+                pickle.dump((key, item.to_dict()), file, protocol=pickle.HIGHEST_PROTOCOL)
+            file.seek(0)
+        except BaseException:
+            file.close()
+            raise
+        return file
+
+    @staticmethod
+    def _load(file: IO[bytes]) -> Iterator[tuple[tuple, dict[str, Any]]]:
+        while True:
+            try:
+                yield pickle.load(file)
+            except EOFError:
+                return
+
     def _sort(
         self,
         data: list[ScimData],
         schema: Union[BaseResourceSchema, Sequence[BaseResourceSchema]],
     ) -> list[ScimData]:
-        if not any(item.get(self._attr_rep) for item in data):
-            return data
+        keyed = sorted(self._iter_keyed(data, schema), key=itemgetter(0), reverse=self._reverse)
+        return [item for _, item in keyed]
 
-        if not isinstance(schema, BaseResourceSchema) and len(set(schema)) == 1:
-            schema = schema[0]
+    def _iter_keyed(
+        self,
+        data: Iterable[ScimData],
+        schema: Union[BaseResourceSchema, Sequence[BaseResourceSchema]],
+    ) -> Iterator[tuple[tuple, ScimData]]:
         if isinstance(schema, BaseResourceSchema):
-            key = functools.partial(self._attr_key, schema=schema)
-        else:
-            key = self._attr_key_many_schemas(data, schema)
-        return sorted(data, key=key, reverse=not self._asc)
+            get_key = self._get_key_functions([schema])[schema]
+            return ((get_key(item), item) for item in data)
 
-    def _get_key(self, value: Any, attr: Optional[Attribute]):
-        if not value or attr is None:
-            return self._default_value
+        get_keys = self._get_key_functions(schema)
+        return ((get_keys[item_schema](item), item) for item, item_schema in zip(data, schema))
 
-        if not isinstance(value, str):
-            return value
+    @abc.abstractmethod
+    def _get_key_functions(
+        self, schemas: Sequence[BaseResourceSchema]
+    ) -> dict[BaseResourceSchema, Callable[[ScimData], tuple]]:
+        """
+        Returns functions that compute sort keys of data items, for every provided schema.
+        """
 
-        if str not in attr.base_types:
-            return self._default_value
 
-        return StringKey(value, attr)
+class Sorter(BaseSorter):
+    """
+    Sorter implementing sorting logic, as specified in RFC-7644.
+    """
 
-    def _attr_key_many_schemas(self, data: list[ScimData], schemas: Sequence[BaseResourceSchema]):
-        def attr_key(item):
-            schema = schemas[data.index(item)]
-            return self._attr_key(item, schema)
+    def __init__(self, attr_rep: Union[str, AttrRep], asc: bool = True):
+        """
+        Args:
+            attr_rep: The representation of the attribute by which the data should be sorted.
+            asc: If set to `True`, it enables ascending sorting. Descending otherwise.
+        """
+        self._attr_rep = (
+            attr_rep if isinstance(attr_rep, AttrRep) else AttrRepFactory.deserialize(attr_rep)
+        )
+        self._asc = asc
+        self._reverse = not asc
 
-        return attr_key
+    @property
+    def attr_rep(self) -> AttrRep:
+        """
+        The representation of the attribute by which the data should be sorted.
+        """
+        return self._attr_rep
+
+    @property
+    def asc(self) -> bool:
+        """
+        If `True`, ascending sorting is enabled. Descending otherwise.
+        """
+        return self._asc
 
-    def _attr_key(self, item: ScimData, schema: BaseResourceSchema):
+    @override
+    def _sort(
+        self,
+        data: list[ScimData],
+        schema: Union[BaseResourceSchema, Sequence[BaseResourceSchema]],
+    ) -> list[ScimData]:
+        if not any(item.get(self._attr_rep) for item in data):
+            return data
+        return super()._sort(data, schema)
+
+    @override
+    def _get_key_functions(
+        self, schemas: Sequence[BaseResourceSchema]
+    ) -> dict[BaseResourceSchema, Callable[[ScimData], tuple]]:
+        unique_schemas = list(dict.fromkeys(schemas))
+        if len(unique_schemas) == 1:
+            return {unique_schemas[0]: self._get_key_function(unique_schemas[0])}
+
+        # values of the same attribute from different schemas must be comparable with each other,
+        # so string values are compared case-sensitively if any of the attributes is case-exact
+        case_exact = any(
+            isinstance(attr, AttributeWithCaseExact) and attr.case_exact
+            for attr in (self._get_value_attr(schema) for schema in unique_schemas)
+        )
+        return {schema: self._get_key_function(schema, case_exact) for schema in unique_schemas}
+
+    def _get_value_attr(self, schema: BaseResourceSchema) -> Optional[Attribute]:
+        attr = schema.attrs.get(self._attr_rep)
+        if attr is not None and attr.multi_valued and isinstance(attr, Complex):
+            return attr.attrs.get("value")
+        return attr
+
+    def _get_key_function(
+        self, schema: BaseResourceSchema, case_exact: Optional[bool] = None
+    ) -> Callable[[ScimData], tuple]:
         attr = schema.attrs.get(self._attr_rep)
         if attr is None:
-            return self._get_key(None, None)
-
-        value = None
-        item_value = item.get(self._attr_rep)
-        if item_value is not Missing and attr.multi_valued:
-            if isinstance(attr, Complex):
-                attr = attr.attrs.get("value")
-                for i, v in enumerate(item_value):
-                    if i == 0:
-                        value = v.get("value")
-                    elif v.get("primary") is True:
-                        value = v.get("value")
-                        break
-            else:
-                value = item_value[0]
-        else:
-            value = item_value
-        return self._get_key(value, attr)
+            return lambda item: _LAST_KEY
+
+        attr_rep = self._attr_rep
+        multi_valued = attr.multi_valued
+        is_complex = isinstance(attr, Complex)
+        value_attr = self._get_value_attr(schema)
+        if value_attr is None:
+            return lambda item: _LAST_KEY
+
+        supports_str = str in value_attr.base_types
+        enforce_precis = value_attr.enforce_precis if isinstance(value_attr, String) else None
+        if case_exact is None:
+            case_exact = isinstance(value_attr, AttributeWithCaseExact) and value_attr.case_exact
+
+        def get_key(item: ScimData) -> tuple:
+            value = item.get(attr_rep)
+            if value is not Missing and multi_valued:
+                value = self._get_multi_valued_sort_value(value, is_complex)
+            if not value:
+                return _LAST_KEY
+            if not isinstance(value, str):
+                return 0, value
+            if not supports_str:
+                return _LAST_KEY
+            if enforce_precis is not None:
+                value = enforce_precis(value)
+            return 0, value if case_exact else value.lower()
+
+        return get_key
+
+    @staticmethod
+    def _get_multi_valued_sort_value(value: Any, is_complex: bool) -> Any:
+        if not is_complex:
+            return value[0] if value else None
+
+        sort_value = None
+        for i, item in enumerate(value):
+            if i == 0:
+                sort_value = item.get("value")
+            elif item.get("primary") is True:
+                sort_value = item.get("value")
+                break
+        return sort_value
+
+
+class _Descending:
+    __slots__ = ("key",)
+
+    def __init__(self, key: tuple):
+        self.key = key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.key == other.key
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.key < self.key
+
+
+class CompositeSorter(BaseSorter):
+    """
+    Sorter that sorts data by many attributes, each in its own direction. Data items are ordered
+    by the first attribute, then data items with the same value of the first attribute are
+    ordered by the second attribute, and so on. Every attribute is compared the same way as by
+    `Sorter`.
+
+    Adding a unique attribute (e.g. `id`) as the last one makes the order deterministic, which
+    keeps pagination stable across pages.
+    """
+
+    def __init__(self, keys: Sequence[tuple[Union[str, AttrRep], bool]]):
+        """
+        Args:
+            keys: Pairs of the representation of the attribute by which the data should be
+                sorted, and the flag that enables ascending sorting by the attribute if set to
+                `True`. Descending otherwise.
+
+        Raises:
+            ValueError: If no keys are provided.
+        """
+        if not keys:
+            raise ValueError("at least one sort key must be provided")
+        self._sorters = [Sorter(attr_rep, asc) for attr_rep, asc in keys]
+
+    @property
+    def keys(self) -> list[tuple[AttrRep, bool]]:
+        """
+        Pairs of the attribute representation and the ascending sorting flag, in order of
+        precedence.
+        """
+        return [(sorter.attr_rep, sorter.asc) for sorter in self._sorters]
+
+    @override
+    def _get_key_functions(
+        self, schemas: Sequence[BaseResourceSchema]
+    ) -> dict[BaseResourceSchema, Callable[[ScimData], tuple]]:
+        functions = [(sorter._get_key_functions(schemas), sorter.asc) for sorter in self._sorters]
+        return {
+            schema: self._compose([(get_keys[schema], asc) for get_keys, asc in functions])
+            for schema in dict.fromkeys(schemas)
+        }
+
+    @staticmethod
+    def _compose(
+        functions: list[tuple[Callable[[ScimData], tuple], bool]],
+    ) -> Callable[[ScimData], tuple]:
+        def get_key(item: ScimData) -> tuple:
+            return tuple(
+                get_item_key(item) if asc else _Descending(get_item_key(item))
+                for get_item_key, asc in functions
+            )
+
+        return get_key
@@ -1,11 +1,41 @@
+import asyncio
 import re
-from typing import Any, Optional
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from itertools import chain, repeat, zip_longest
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterator,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 from uuid import uuid4
 
+from scimpler.error import ValidationIssues
+
 OP_REGEX = re.compile(r"\s+", flags=re.DOTALL)
 PLACEHOLDER_REGEX = re.compile(r"\|&PLACE_HOLDER_(\w+)&\|")
 STRING_VALUES_REGEX = re.compile(r"'(.*?)'|\"(.*?)\"", flags=re.DOTALL)
 
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 64
+
+
+def check_max_errors(max_errors: Optional[int]) -> None:
+    """
+    Checks if `max_errors` is correct, so the validation can not be stopped before it starts.
+
+    Raises:
+        ValueError: If `max_errors` is lower than 1.
+    """
+    if max_errors is not None and max_errors < 1:
+        raise ValueError("'max_errors' must be greater or equal to 1")
+
 
 def get_placeholder() -> tuple[str, str]:
     id_ = uuid4().hex
@@ -58,3 +88,176 @@ def deserialize_comparison_value(value: str) -> Any:
     if deserialized == deserialized_int:
         return deserialized_int
     return deserialized
+
+
+def validate_items(
+    validate: Callable[..., ValidationIssues],
+    items: Sequence[T],
+    max_errors: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ValidationIssues]:
+    """
+    Validates `items` with `validate(item, max_errors=...)` and yields validation issues of every
+    item, in order. Stops once at least `max_errors` errors are yielded.
+
+    If `executor` is provided, the items are split into chunks of `chunk_size` items, validated
+    concurrently. Both `validate` and `items` must be picklable if the executor is a process pool.
+    Chunks are validated without knowing errors found in the preceding ones, so issues of an item
+    with more errors than left to `max_errors` are validated again, in place, and the output is
+    the same as without the executor.
+    """
+    if max_errors is not None and max_errors <= 0:
+        return
+    futures: list[Future] = []
+    if executor is not None:
+        futures = [
+            executor.submit(_validate_chunk, validate, items[i : i + chunk_size], max_errors)
+            for i in range(0, len(items), chunk_size)
+        ]
+    results = chain((issues for future in futures for issues in future.result()), repeat(None))
+    remaining = max_errors
+    try:
+        for item, issues in zip(items, results):
+            if issues is None or (remaining is not None and issues.error_count > remaining):
+                issues = validate(item, max_errors=remaining)
+            yield issues
+            if remaining is not None:
+                remaining -= issues.error_count
+                if remaining <= 0:
+                    return
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _validate_chunk(
+    validate: Callable[..., ValidationIssues],
+    items: Sequence[Any],
+    max_errors: Optional[int],
+) -> list[ValidationIssues]:
+    output = []
+    n_errors = 0
+    for item in items:
+        issues = validate(item, max_errors=max_errors)
+        output.append(issues)
+        n_errors += issues.error_count
+        if max_errors is not None and n_errors >= max_errors:
+            # the rest of items is not needed, since the limit is reached with preceding ones
+            break
+    return output
+
+
+async def avalidate_items(
+    validate: Callable[..., ValidationIssues],
+    items: Sequence[T],
+    max_errors: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[ValidationIssues]:
+    """
+    Asynchronous counterpart of `validate_items`, yielding the same validation issues. Items are
+    validated in chunks of `chunk_size` items, and the control is given back to the event loop
+    before every chunk. If `executor` is provided, the chunks are validated by the executor,
+    and the event loop only waits for the results.
+    """
+    if max_errors is not None and max_errors <= 0:
+        return
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    futures: list[asyncio.Future] = []
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        futures = [
+            loop.run_in_executor(executor, _validate_chunk, validate, chunk, max_errors)
+            for chunk in chunks
+        ]
+    remaining = max_errors
+    try:
+        for i, chunk in enumerate(chunks):
+            if futures:
+                results = await futures[i]
+            else:
+                results = []
+                await asyncio.sleep(0)
+            for item, issues in zip_longest(chunk, results):
+                if issues is None or (remaining is not None and issues.error_count > remaining):
+                    issues = validate(item, max_errors=remaining)
+                yield issues
+                if remaining is not None:
+                    remaining -= issues.error_count
+                    if remaining <= 0:
+                        return
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+@dataclass(frozen=True)
+class ItemsValidation:
+    """
+    Request for validation of `items` with `validate(item, max_errors=...)`, yielded from
+    validation steps. See `run_validation`.
+    """
+
+    validate: Callable[..., ValidationIssues]
+    items: Sequence[Any]
+    max_errors: Optional[int] = None
+
+
+ValidationSteps = Generator[ItemsValidation, list[ValidationIssues], ValidationIssues]
+
+
+def run_validation(
+    steps: ValidationSteps,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ValidationIssues:
+    """
+    Runs validation steps and returns the final validation issues. Validation steps is
+    a generator that yields `ItemsValidation` for every collection of items (e.g. resources or
+    bulk operations) and receives the issues of validated items, as from `validate_items`.
+    This way the same steps are run synchronously here, and asynchronously in `arun_validation`.
+    """
+    try:
+        request = next(steps)
+        while True:
+            issues = list(
+                validate_items(
+                    validate=request.validate,
+                    items=request.items,
+                    max_errors=request.max_errors,
+                    executor=executor,
+                    chunk_size=chunk_size,
+                )
+            )
+            request = steps.send(issues)
+    except StopIteration as e:
+        return e.value
+
+
+async def arun_validation(
+    steps: ValidationSteps,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> ValidationIssues:
+    """
+    Asynchronous counterpart of `run_validation`, returning the same validation issues.
+    Items are validated with `avalidate_items`, so the event loop is not blocked for the time
+    of validation of all items.
+    """
+    try:
+        request = next(steps)
+        while True:
+            issues = [
+                issues
+                async for issues in avalidate_items(
+                    validate=request.validate,
+                    items=request.items,
+                    max_errors=request.max_errors,
+                    executor=executor,
+                    chunk_size=chunk_size,
+                )
+            ]
+            request = steps.send(issues)
+    except StopIteration as e:
+        return e.value
@@ -1,6 +1,6 @@
-from collections import defaultdict
+from copy import deepcopy
 from enum import Enum
-from typing import Any, Collection, Iterator, Optional, Sequence, TypedDict, Union
+from typing import Any, Collection, Iterator, Optional, Sequence, TypedDict, Union, cast
 
 from typing_extensions import NotRequired
 
@@ -116,6 +116,7 @@ class ValidationError:
     string parameters stay the same.
     """
 
+    __slots__ = ("code", "message", "context", "scim_error")
     message_by_code = {
         1: "bad value syntax",
         2: "bad type, expecting '{expected}'",
@@ -387,6 +388,7 @@ class ValidationWarning:
     string parameters stay the same.
     """
 
+    __slots__ = ("code", "message", "context")
     message_by_code = {
         1: "value should be one of: {expected_values}",
         2: (
@@ -442,15 +444,59 @@ class ValidationIssueDict(TypedDict):
     context: NotRequired[dict]
 
 
+# shared by all validation issues until the first issue is added, so creating and merging issues
+# that end up empty does not allocate any storage; never modified, since empty storage is always
+# replaced before the first write, which also keeps (deep) copies from sharing it
+_NO_ISSUES: dict = {}
+_NO_INVALID: set = set()
+
+
+def _location_key(part: Union[str, int]) -> Union[str, int]:
+    # attribute names in locations are 'str' or case-insensitive 'AttrName', so they are
+    # lowercased, and the same location is found whichever of them is used
+    return part.lower() if isinstance(part, str) else part
+
+
+class _LocationNode:
+    __slots__ = ("children", "errors", "stop", "invalid")
+
+    def __init__(self) -> None:
+        self.children: dict[Union[str, int], _LocationNode] = {}
+        # number of locations with errors in the subtree, including this node
+        self.errors = 0
+        self.stop = False
+        self.invalid = False
+
+
 class ValidationIssues:
     """
     Keeps track of validation errors and warnings.
+
+    Additionally, it keeps locations of values that were found invalid, so checks that follow
+    do not consider them. The validated data is never modified, see
+    `scimpler.data.scim_data.mask_invalid`.
+
+    Storage is allocated when the first issue is added, so validation that finds no issues
+    is cheap. Locations with errors and invalid values are indexed in a trie, so `can_proceed`,
+    `has_errors`, and `is_invalid` depend on the depth of the checked location only.
     """
 
+    __slots__ = (
+        "_errors",
+        "_warnings",
+        "_stop_proceeding",
+        "_invalid",
+        "_index",
+        "_error_count",
+    )
+
     def __init__(self) -> None:
-        self._errors: dict[tuple, list[ValidationError]] = defaultdict(list)
-        self._warnings: dict[tuple, list[ValidationWarning]] = defaultdict(list)
-        self._stop_proceeding: dict[tuple, set[int]] = defaultdict(set)
+        self._errors: dict[tuple, list[ValidationError]] = _NO_ISSUES
+        self._warnings: dict[tuple, list[ValidationWarning]] = _NO_ISSUES
+        self._stop_proceeding: dict[tuple, set[int]] = _NO_ISSUES
+        self._invalid: set[tuple] = _NO_INVALID
+        self._index: Optional[_LocationNode] = None
+        self._error_count = 0
 
     @property
     def errors(self) -> Iterator[tuple[tuple[str, ...], list[ValidationError]]]:
@@ -462,6 +508,42 @@ class ValidationIssues:
         """Validation warnings by locations where they were added."""
         return iter(self._warnings.items())
 
+    @property
+    def invalid_locations(self) -> Iterator[tuple[Union[str, int], ...]]:
+        """Locations of values marked as invalid."""
+        return iter(self._invalid)
+
+    @property
+    def error_count(self) -> int:
+        """Number of validation errors, in all locations."""
+        return self._error_count
+
+    def limit_reached(self, max_errors: Optional[int]) -> bool:
+        """
+        Returns flag indicating whether at least `max_errors` errors have been added. If
+        `max_errors` is not specified, `False` is returned.
+        """
+        return max_errors is not None and self._error_count >= max_errors
+
+    def remaining_errors(self, max_errors: Optional[int]) -> Optional[int]:
+        """
+        Returns the number of errors that can be added before `max_errors` is reached. If
+        `max_errors` is not specified, `None` is returned.
+        """
+        if max_errors is None:
+            return None
+        return max(max_errors - self._error_count, 0)
+
+    def copy(self) -> "ValidationIssues":
+        """
+        Returns a copy of the issues that can be modified independently, including
+        the contained errors and warnings. Issues with nothing to copy are created anew,
+        so copying them costs as little as creating empty issues.
+        """
+        if not (self._errors or self._warnings or self._invalid):
+            return ValidationIssues()
+        return deepcopy(self)
+
     def merge(
         self,
         issues: "ValidationIssues",
@@ -471,16 +553,24 @@ class ValidationIssues:
         Merges provided validation `issues` under specified `location`, if specified, in the
         top-level otherwise.
         """
+        if not (issues._errors or issues._warnings or issues._invalid):
+            return
+
         location = tuple(location or tuple())
         for other_location, errors in issues._errors.items():
-            new_location = location + other_location
-            self._errors[new_location].extend(errors)
-            self._stop_proceeding[new_location].update(
-                issues._stop_proceeding.get(other_location, {})
+            self._add_errors(
+                location=location + other_location,
+                errors=errors,
+                stop_proceeding=issues._stop_proceeding.get(other_location, ()),
+                stop=True,
             )
-        for other_location, warnings in issues._warnings.items():
-            new_location = location + other_location
-            self._warnings[new_location].extend(warnings)
+        if issues._warnings:
+            if not self._warnings:
+                self._warnings = {}
+            for other_location, warnings in issues._warnings.items():
+                self._warnings.setdefault(location + other_location, []).extend(warnings)
+        for other_location in issues._invalid:
+            self._mark_invalid(location + other_location)
 
     def add_error(
         self,
@@ -494,10 +584,69 @@ class ValidationIssues:
         validated against different conditions (`True`), or further validation should be terminated
         (`False`).
         """
-        location = tuple(location or tuple())
-        self._errors[location].append(issue)
-        if not proceed:
-            self._stop_proceeding[location].add(issue.code)
+        self._add_errors(
+            location=tuple(location or tuple()),
+            errors=[issue],
+            stop_proceeding=() if proceed else (issue.code,),
+            stop=not proceed,
+        )
+
+    def _add_errors(
+        self,
+        location: tuple[Union[str, int], ...],
+        errors: list[ValidationError],
+        stop_proceeding: Collection[int],
+        stop: bool,
+    ) -> None:
+        if not self._errors:
+            self._errors = {}
+        location_errors = self._errors.get(location)
+        new = location_errors is None
+        if location_errors is None:
+            location_errors = self._errors[location] = []
+        location_errors.extend(errors)
+        self._error_count += len(errors)
+
+        if stop:
+            if not self._stop_proceeding:
+                self._stop_proceeding = {}
+            self._stop_proceeding.setdefault(location, set()).update(stop_proceeding)
+        if new or stop:
+            self._index_location(location, errors=1 if new else 0, stop=stop or None)
+
+    def _index_location(
+        self,
+        location: tuple[Union[str, int], ...],
+        errors: int,
+        stop: Optional[bool],
+        invalid: bool = False,
+    ) -> None:
+        if self._index is None:
+            self._index = _LocationNode()
+        node = self._index
+        node.errors += errors
+        for part in location:
+            key = _location_key(part)
+            child = node.children.get(key)
+            if child is None:
+                child = node.children[key] = _LocationNode()
+            node = child
+            node.errors += errors
+        if stop is not None:
+            node.stop = stop
+        if invalid:
+            node.invalid = True
+
+    def _reindex(self) -> None:
+        self._index = None
+        self._error_count = 0
+        for location, errors in self._errors.items():
+            self._index_location(location, errors=1, stop=None)
+            self._error_count += len(errors)
+        for location in self._stop_proceeding:
+            self._index_location(location, errors=0, stop=True)
+        for location in self._invalid:
+            self._index_location(location, errors=0, stop=None, invalid=True)
 
     def add_warning(
         self,
@@ -507,8 +656,42 @@ class ValidationIssues:
         """
         Adds a validation warning under specified `location`, if specified, in the top-level.
         """
-        location = tuple(location or tuple())
-        self._warnings[location].append(issue)
+        if not self._warnings:
+            self._warnings = {}
+        self._warnings.setdefault(tuple(location or tuple()), []).append(issue)
+
+    def mark_invalid(self, location: Optional[Sequence[Union[str, int]]] = None) -> None:
+        """
+        Marks the value under specified `location`, if specified, in the top-level otherwise,
+        as invalid.
+        """
+        self._mark_invalid(tuple(location or tuple()))
+
+    def _mark_invalid(self, location: tuple[Union[str, int], ...]) -> None:
+        if not self._invalid:
+            self._invalid = set()
+        if location not in self._invalid:
+            self._invalid.add(location)
+            self._index_location(location, errors=0, stop=None, invalid=True)
+
+    def is_invalid(self, location: Optional[Sequence[Union[str, int]]] = None) -> bool:
+        """
+        Returns flag indicating whether the value under specified `location`, or any of its
+        parents, has been marked as invalid.
+        """
+        if self._index is None or not self._invalid:
+            return False
+        node = self._index
+        if node.invalid:
+            return True
+        for part in location or ():
+            child = node.children.get(_location_key(part))
+            if child is None:
+                return False
+            node = child
+            if node.invalid:
+                return True
+        return False
 
     def get(
         self,
@@ -525,6 +708,12 @@ class ValidationIssues:
         copy._errors = self._get_errors(error_codes, location)
         copy._warnings = self._get_warnings(warning_codes, location)
         copy._stop_proceeding = self._get_stop_proceeding(error_codes, location)
+        copy._invalid = {
+            location_[len(location) :]
+            for location_ in self._invalid
+            if location_[: len(location)] == location
+        }
+        copy._reindex()
         return copy
 
     def _get_errors(
@@ -599,16 +788,22 @@ class ValidationIssues:
     def _remove_errors(
         self, errors: list[ValidationError], location: tuple[Union[str, int], ...]
     ) -> None:
+        location_errors = self._errors[location]
+        stop_proceeding = self._stop_proceeding.get(location, set())
         for error in errors:
-            self._errors[location].remove(error)
-            if error.code in self._stop_proceeding.get(location, set()):
-                self._stop_proceeding[location].remove(error.code)
+            location_errors.remove(error)
+            stop_proceeding.discard(error.code)
+        self._error_count -= len(errors)
 
-        if not self._errors[location]:
+        removed = not location_errors
+        if removed:
             self._errors.pop(location)
 
-        if not self._stop_proceeding.get(location, set()):
+        if not stop_proceeding:
             self._stop_proceeding.pop(location, None)
+        self._index_location(
+            location, errors=-1 if removed else 0, stop=location in self._stop_proceeding
+        )
 
     def _remove_warnings(
         self, warnings: list[ValidationWarning], location: tuple[Union[str, int], ...]
@@ -625,12 +820,18 @@ class ValidationIssues:
         the provided `locations` have no errors, or these errors have not been added with
         `proceed=True`, then `True` is returned.
         """
-        if not locations:
-            locations = (tuple(),)
-        for location in locations:
-            location = tuple(location)
-            for i in range(len(location) + 1):
-                if location[:i] in self._stop_proceeding:
+        if self._index is None or not self._stop_proceeding:
+            return True
+        for location in locations or (tuple(),):
+            node = self._index
+            if node.stop:
+                return False
+            for part in location:
+                child = node.children.get(_location_key(part))
+                if child is None:
+                    break
+                node = child
+                if node.stop:
                     return False
         return True
 
@@ -639,14 +840,16 @@ class ValidationIssues:
         Returns flag indicating whether any errors have been added under specified `locations`. If
         at least one of the `locations` have errors (regardless of type), `True` is returned.
         """
-        if not locations:
-            locations = (tuple(),)
-
-        for location in locations:
-            for issue_location in self._errors:
-                if issue_location[: len(location)] == location:
-                    return True
-
+        if self._index is None or not self._errors:
+            return False
+        for location in locations or (tuple(),):
+            node: Optional[_LocationNode] = self._index
+            for part in location:
+                node = cast(_LocationNode, node).children.get(_location_key(part))
+                if node is None:
+                    break
+            if node is not None and node.errors:
+                return True
         return False
 
     def to_dict(self, message: bool = False, context: bool = False) -> dict:
@@ -0,0 +1,392 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Mapping, NamedTuple, Optional, Union, cast
+
+from scimpler.data import operator as op
+from scimpler.data.attrs import (
+    Attribute,
+    AttributeWithCaseExact,
+    Complex,
+    DateTime,
+    String,
+)
+from scimpler.data.filter import Filter
+from scimpler.data.identifiers import AttrName, AttrRep, BoundedAttrRep
+from scimpler.data.schemas import BaseSchema
+
+_TRUE = "1 = 1"
+_FALSE = "1 = 0"
+_LIKE_PATTERNS = {
+    "co": "%{}%",
+    "sw": "{}%",
+    "ew": "%{}",
+}
+_TEXT_SCIM_TYPES = {"string", "reference", "binary"}
+
+
+class WhereClause(NamedTuple):
+    """
+    Parameterized SQL condition, ready to be passed to DB-API compliant `cursor.execute`.
+    """
+
+    sql: str
+    params: list[Any]
+
+
+@dataclass(frozen=True)
+class MultiValuedTable:
+    """
+    Describes a table that stores values of a multi-valued attribute, one row per value.
+
+    Args:
+        table: Name of the table, optionally with an alias, e.g. `"emails AS e"`.
+        join_condition: Condition that correlates the rows of the table with the filtered
+            resource, e.g. `"e.user_id = users.id"`.
+        columns: Column expressions, keyed by sub-attribute names. Values of multi-valued
+            simple attributes are expected under the `"value"` key.
+    """
+
+    table: str
+    join_condition: str
+    columns: Mapping[str, str] = field(default_factory=dict)
+
+    def get_column(self, sub_attr: str) -> Optional[str]:
+        """
+        Returns column expression for the provided sub-attribute name (case-insensitive).
+        """
+        sub_attr = AttrName(sub_attr)
+        for name, column in self.columns.items():
+            if sub_attr == AttrName(name):
+                return column
+        return None
+
+
+ColumnMapping = Mapping[BoundedAttrRep, Union[str, MultiValuedTable]]
+
+
+@dataclass(frozen=True)
+class _Context:
+    attr: Optional[Complex] = None
+    attr_rep: Optional[BoundedAttrRep] = None
+    table: Optional[MultiValuedTable] = None
+
+
+class FilterTranslator:
+    """
+    Translates `Filter` to a parameterized SQL `WHERE` condition, so the data can be filtered
+    by the database, instead of loading all resources and filtering them in Python.
+
+    Attributes are mapped to SQL expressions with `columns`, keyed by bounded attribute
+    representations. Single-valued attributes and sub-attributes are mapped to column
+    expressions (e.g. `"user_name"` or `"json_extract(data, '$.name.givenName')"`).
+    Multi-valued attributes are mapped to `MultiValuedTable`, and filters on them are translated
+    to `EXISTS` subqueries.
+
+    The semantics follow `Filter` evaluation:
+
+    - attributes that are not defined in the schema, or that do not support the operator,
+        never match,
+    - attributes without schema URI are looked up in the core schema, and then in its
+        extensions, as in `BoundedAttrs.get` (in-memory evaluation looks them up in the core
+        schema data only, so extension attributes must be referenced with their schema URI there),
+    - values of attributes that are not `caseExact` are compared lowercase (`LOWER` function
+        is applied to the column),
+    - PRECIS profiles of string attributes are enforced on the compared value, so the data
+        stored in the database is expected to be PRECIS-enforced as well,
+    - values compared to `dateTime` attributes with `eq`, `ne`, `gt`, `ge`, `lt`, and `le` are
+        converted to UTC and bound as ISO 8601 strings (e.g. `2011-05-13T04:42:34+00:00`), so
+        the columns are expected to be of timestamp type, or to store UTC values in the same
+        format,
+    - `co`, `sw`, and `ew` operators are translated to `LIKE`, so it depends on the database
+        whether `caseExact` attributes are compared case-sensitively (for SQLite, enable
+        `PRAGMA case_sensitive_like`).
+
+    Args:
+        schema: Schema that describes the filtered resources.
+        columns: Mapping of attribute representations to column expressions or tables.
+        placeholder: Parameter placeholder, depends on the database driver's `paramstyle`.
+
+    Examples:
+        >>> from scimpler.schemas import UserSchema
+        >>>
+        >>> user = UserSchema()
+        >>> translator = FilterTranslator(
+        >>>     schema=user,
+        >>>     columns={
+        >>>         user.attrs.userName: "user_name",
+        >>>         user.attrs.emails: MultiValuedTable(
+        >>>             table="emails",
+        >>>             join_condition="emails.user_id = users.id",
+        >>>             columns={"value": "emails.value", "type": "emails.type"},
+        >>>         ),
+        >>>     },
+        >>> )
+        >>> translator.translate(
+        >>>     Filter.deserialize("userName sw 'a' or emails[type eq 'work']")
+        >>> )
+        WhereClause(
+            sql="(user_name IS NOT NULL AND LOWER(user_name) LIKE ? ESCAPE '\\\\') OR "
+            "(EXISTS (SELECT 1 FROM emails WHERE emails.user_id = users.id AND "
+            "(emails.type IS NOT NULL AND LOWER(emails.type) = ?)))",
+            params=['a%', 'work'],
+        )
+    """
+
+    comparison_operators: dict[str, str] = {
+        "eq": "=",
+        "ne": "<>",
+        "gt": ">",
+        "ge": ">=",
+        "lt": "<",
+        "le": "<=",
+    }
+
+    def __init__(
+        self,
+        schema: BaseSchema,
+        columns: ColumnMapping,
+        placeholder: str = "?",
+    ):
+        self._schema = schema
+        self._columns = dict(columns)
+        self._placeholder = placeholder
+
+    def translate(self, filter_: Filter) -> WhereClause:
+        """
+        Translates the provided filter to SQL condition.
+
+        Raises:
+            ValueError: If an attribute used in the filter has no column mapped.
+            TypeError: If the filter contains an operator that can not be translated.
+        """
+        params: list[Any] = []
+        sql = self._translate(filter_.operator, _Context(), params)
+        return WhereClause(sql=sql, params=params)
+
+    def _translate(self, operator: op.Operator, context: _Context, params: list[Any]) -> str:
+        if isinstance(operator, op.Not):
+            return f"NOT ({self._translate(operator.sub_operators[0], context, params)})"
+
+        if isinstance(operator, (op.And, op.Or)):
+            return f" {operator.op.upper()} ".join(
+                f"({self._translate(sub_operator, context, params)})"
+                for sub_operator in operator.sub_operators
+            )
+
+        if isinstance(operator, op.ComplexAttributeOperator):
+            return self._translate_complex(operator, context, params)
+
+        if isinstance(operator, op.AttributeOperator):
+            return self._translate_attribute_operator(operator, context, params)
+
+        raise TypeError(f"unsupported filter type '{type(operator).__name__}'")
+
+    def _translate_complex(
+        self, operator: op.ComplexAttributeOperator, context: _Context, params: list[Any]
+    ) -> str:
+        attr_rep = self._bound(operator.attr_rep)
+        attr = self._schema.attrs.get(attr_rep)
+        if context.attr is not None or not isinstance(attr, Complex):
+            return _FALSE
+
+        if not attr.multi_valued:
+            return self._translate(
+                operator.sub_operator, _Context(attr=attr, attr_rep=attr_rep), params
+            )
+
+        table = self._get_table(attr_rep)
+        condition = self._translate(
+            operator.sub_operator, _Context(attr=attr, attr_rep=attr_rep, table=table), params
+        )
+        return self._exists(table, condition)
+
+    def _translate_attribute_operator(
+        self, operator: op.AttributeOperator, context: _Context, params: list[Any]
+    ) -> str:
+        if context.attr is not None:
+            return self._translate_sub_attribute_operator(operator, context, params)
+
+        attr_rep = self._bound(operator.attr_rep)
+        attr = self._schema.attrs.get(attr_rep)
+        if attr is None or attr.scim_type not in operator.supported_scim_types:
+            return _FALSE
+
+        parent_rep = BoundedAttrRep(schema=attr_rep.schema, attr=attr_rep.attr)
+        parent_attr = self._schema.attrs.get(parent_rep)
+        if parent_attr is not None and parent_attr.multi_valued:
+            return self._translate_multi_valued(operator, attr, parent_rep, attr_rep, params)
+
+        if isinstance(attr, Complex):
+            return self._translate_complex_presence(operator, attr, attr_rep, params)
+        return self._translate_value_operator(operator, attr, self._get_column(attr_rep), params)
+
+    def _translate_sub_attribute_operator(
+        self, operator: op.AttributeOperator, context: _Context, params: list[Any]
+    ) -> str:
+        complex_attr = cast(Complex, context.attr)
+        complex_attr_rep = cast(BoundedAttrRep, context.attr_rep)
+        attr = complex_attr.attrs.get(operator.attr_rep)
+        if attr is None or attr.scim_type not in operator.supported_scim_types:
+            return _FALSE
+
+        attr_rep = operator.attr_rep
+        sub_attr_name = attr_rep.sub_attr if attr_rep.is_sub_attr else attr_rep.attr
+        if context.table is not None:
+            column = self._get_table_column(context.table, complex_attr_rep, sub_attr_name)
+        else:
+            column = self._get_column(
+                BoundedAttrRep(
+                    schema=complex_attr_rep.schema,
+                    attr=complex_attr_rep.attr,
+                    sub_attr=sub_attr_name,
+                )
+            )
+        return self._translate_value_operator(operator, attr, column, params)
+
+    def _translate_multi_valued(
+        self,
+        operator: op.AttributeOperator,
+        attr: Attribute,
+        parent_rep: BoundedAttrRep,
+        attr_rep: BoundedAttrRep,
+        params: list[Any],
+    ) -> str:
+        # multi-valued attribute, its sub-attribute, or 'value' sub-attribute
+        # of multi-valued complex attribute, like in 'emails co "@example.com"'
+        table = self._get_table(parent_rep)
+        value_attr: Optional[Attribute] = attr
+        if isinstance(attr, Complex):
+            if isinstance(operator, op.UnaryAttributeOperator):
+                return self._exists(table, _TRUE)
+            value_attr = attr.attrs.get("value")
+        if value_attr is None:
+            return _FALSE
+
+        sub_attr_name = attr_rep.sub_attr if attr_rep.is_sub_attr else "value"
+        column = self._get_table_column(table, parent_rep, sub_attr_name)
+        condition = self._translate_value_operator(operator, value_attr, column, params)
+        return self._exists(table, condition)
+
+    def _translate_complex_presence(
+        self,
+        operator: op.AttributeOperator,
+        attr: Complex,
+        attr_rep: BoundedAttrRep,
+        params: list[Any],
+    ) -> str:
+        if isinstance(operator, op.BinaryAttributeOperator):
+            return _FALSE
+
+        conditions = []
+        for sub_attr_name, sub_attr in attr.attrs:
+            column = self._columns.get(
+                BoundedAttrRep(schema=attr_rep.schema, attr=attr_rep.attr, sub_attr=sub_attr_name)
+            )
+            if isinstance(column, str):
+                conditions.append(
+                    f"({self._translate_value_operator(operator, sub_attr, column, params)})"
+                )
+        if not conditions:
+            raise ValueError(f"no column mapped for '{attr_rep}' sub-attributes")
+        return " OR ".join(conditions)
+
+    def _translate_value_operator(
+        self, operator: op.AttributeOperator, attr: Attribute, column: str, params: list[Any]
+    ) -> str:
+        if isinstance(operator, op.UnaryAttributeOperator):
+            if operator.op != "pr":
+                raise TypeError(f"unsupported operator {operator.op!r}")
+            if attr.scim_type in _TEXT_SCIM_TYPES:
+                return f"{column} IS NOT NULL AND {column} <> ''"
+            return f"{column} IS NOT NULL"
+
+        assert isinstance(operator, op.BinaryAttributeOperator)
+        if operator.op not in self.comparison_operators and operator.op not in _LIKE_PATTERNS:
+            raise TypeError(f"unsupported operator {operator.op!r}")
+
+        value = operator.value
+        if value is None or not isinstance(value, attr.base_types):
+            # the same as in Python, values of incompatible types are never equal
+            if operator.op == "ne":
+                return f"{column} IS NOT NULL"
+            return _FALSE
+
+        if isinstance(attr, String) and isinstance(value, str):
+            try:
+                value = attr.enforce_precis(value)
+            except UnicodeEncodeError:
+                return _FALSE
+        if isinstance(attr, AttributeWithCaseExact) and not attr.case_exact:
+            value = value.lower()
+            column_exp = f"LOWER({column})"
+        else:
+            column_exp = column
+
+        if operator.op in _LIKE_PATTERNS:
+            params.append(_LIKE_PATTERNS[operator.op].format(self._escape_like(value)))
+            return f"{column} IS NOT NULL AND {column_exp} LIKE {self._placeholder} ESCAPE '\\'"
+
+        if isinstance(attr, DateTime):
+            value = _normalize_datetime(value)
+        params.append(value)
+        return (
+            f"{column} IS NOT NULL AND "
+            f"{column_exp} {self.comparison_operators[operator.op]} {self._placeholder}"
+        )
+
+    @staticmethod
+    def _escape_like(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+    @staticmethod
+    def _exists(table: MultiValuedTable, condition: str) -> str:
+        if condition == _TRUE:
+            return f"EXISTS (SELECT 1 FROM {table.table} WHERE {table.join_condition})"
+        return (
+            f"EXISTS (SELECT 1 FROM {table.table} "
+            f"WHERE {table.join_condition} AND ({condition}))"
+        )
+
+    def _bound(self, attr_rep: AttrRep) -> BoundedAttrRep:
+        if isinstance(attr_rep, BoundedAttrRep):
+            return attr_rep
+        # the first schema that defines the attribute is used, as in 'BoundedAttrs.get'
+        schema = self._schema.schema
+        for schema_ in (self._schema.schema, *self._schema.attrs.extensions):
+            if self._schema.attrs.get(BoundedAttrRep(schema=schema_, attr=attr_rep.attr)):
+                schema = schema_
+                break
+        return BoundedAttrRep(
+            schema=schema,
+            attr=attr_rep.attr,
+            sub_attr=attr_rep.sub_attr if attr_rep.is_sub_attr else None,
+        )
+
+    def _get_column(self, attr_rep: BoundedAttrRep) -> str:
+        column = self._columns.get(attr_rep)
+        if not isinstance(column, str):
+            raise ValueError(f"no column mapped for '{attr_rep}'")
+        return column
+
+    def _get_table(self, attr_rep: BoundedAttrRep) -> MultiValuedTable:
+        table = self._columns.get(attr_rep)
+        if not isinstance(table, MultiValuedTable):
+            raise ValueError(f"no table mapped for multi-valued '{attr_rep}'")
+        return table
+
+    @staticmethod
+    def _get_table_column(table: MultiValuedTable, attr_rep: BoundedAttrRep, sub_attr: str) -> str:
+        column = table.get_column(sub_attr)
+        if column is None:
+            raise ValueError(f"no column mapped for '{sub_attr}' sub-attribute of '{attr_rep}'")
+        return column
+
+
+def _normalize_datetime(value: str) -> str:
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return value
+    if parsed.tzinfo is None:
+        return parsed.isoformat()
+    return parsed.astimezone(timezone.utc).isoformat()
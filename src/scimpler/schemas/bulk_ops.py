@@ -59,7 +59,7 @@ def validate_request_operations(value: list[ScimData]) -> ValidationIssues:
                 proceed=False,
                 location=(i, "data"),
             )
-            item["data"] = Invalid
+            issues.mark_invalid((i, "data"))
     return issues
 
 
@@ -81,7 +81,7 @@ def _validate_operation_path(operation: ScimData) -> ValidationIssues:
                 issue=ValidationError.bad_value_syntax(),
                 proceed=False,
             )
-            operation["path"] = Invalid
+            issues.mark_invalid()
     return issues
 
 
@@ -185,7 +185,10 @@ class BulkRequestSchema(BaseSchema):
         if not all([paths, methods]):
             return issues
 
+        max_errors = kwargs.get("max_errors")
         for i, (path, data_item, method) in enumerate(zip(paths, data, methods)):
+            if issues.limit_reached(max_errors):
+                break
             if not all([path, method]):
                 continue
             if method == "POST":
@@ -198,7 +201,7 @@ class BulkRequestSchema(BaseSchema):
                     proceed=False,
                     location=[path_rep.attr, i, path_rep.sub_attr],
                 )
-                data["Operations"][i]["path"] = Invalid
+                issues.mark_invalid([path_rep.attr, i, path_rep.sub_attr])
         return issues
 
     def _process(self, data: ScimData, method: str) -> ScimData:
@@ -288,7 +291,7 @@ def _validate_operation_response(operation: ScimData) -> ValidationIssues:
             issue=ValidationError.bad_type("complex"),
             proceed=False,
         )
-        operation["response"] = Invalid
+        issues.mark_invalid()
     return issues
 
 
@@ -383,7 +386,10 @@ class BulkResponseSchema(BaseSchema):
         if not all([locations, methods]):
             return issues
 
+        max_errors = kwargs.get("max_errors")
         for i, (method, location) in enumerate(zip(methods, locations)):
+            if issues.limit_reached(max_errors):
+                break
             if not method:
                 continue
             if location:
@@ -396,7 +402,7 @@ class BulkResponseSchema(BaseSchema):
                         proceed=False,
                         location=["Operations", i, "location"],
                     )
-                    data["Operations"][i]["location"] = Invalid
+                    issues.mark_invalid(["Operations", i, "location"])
         return issues
 
     def _deserialize(self, data: ScimData) -> ScimData:
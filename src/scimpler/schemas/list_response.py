@@ -1,13 +1,31 @@
-from typing import Any, Iterable, Mapping, Optional, Union
+from functools import partial
+from typing import IO, Any, Callable, Iterable, Iterator, Mapping, Optional
 
 from scimpler.data.attr_value_presence import AttrValuePresenceConfig
 from scimpler.data.attrs import Attribute, Integer, Unknown
 from scimpler.data.identifiers import SchemaUri
 from scimpler.data.schemas import BaseResourceSchema, BaseSchema
 from scimpler.data.scim_data import Invalid, Missing, ScimData
+from scimpler.data.utils import ItemsValidation, ValidationSteps
 from scimpler.error import ValidationError, ValidationIssues
 
 
+def _validate_resource(
+    item: tuple[Any, Optional[BaseResourceSchema]],
+    presence_config: AttrValuePresenceConfig,
+    max_errors: Optional[int] = None,
+) -> ValidationIssues:
+    resource, schema = item
+    if schema is None:
+        issues = ValidationIssues()
+        issues.add_error(
+            issue=ValidationError.unknown_schema(),
+            proceed=False,
+        )
+        return issues
+    return schema.validate(resource, presence_config, max_errors)
+
+
 def _validate_resources_type(value) -> ValidationIssues:
     issues = ValidationIssues()
     for i, item in enumerate(value):
@@ -17,7 +35,7 @@ def _validate_resources_type(value) -> ValidationIssues:
                 proceed=True,
                 location=[i],
             )
-            value[i] = Invalid
+            issues.mark_invalid([i])
     return issues
 
 
@@ -64,7 +82,7 @@ class ListResponseSchema(BaseSchema):
         """
         return self._contained_schemas
 
-    def _validate(self, data: ScimData, **kwargs) -> ValidationIssues:
+    def _iter_validate(self, data: ScimData, **kwargs) -> ValidationSteps:
         issues = ValidationIssues()
 
         resources_rep = self.attrs.resources
@@ -85,23 +103,14 @@ class ListResponseSchema(BaseSchema):
             resource_presence_config = AttrValuePresenceConfig("RESPONSE")
 
         resource_schemas = self.get_schemas(resources)
-        for i, (resource, schema) in enumerate(zip(resources, resource_schemas)):
-            if resource is Invalid:
-                continue
-
-            resource_location: tuple[Union[str, int], ...] = (*resources_rep.location, i)
-            if schema is None:
-                issues.add_error(
-                    issue=ValidationError.unknown_schema(),
-                    proceed=False,
-                    location=resource_location,
-                )
-                continue
-
-            issues.merge(
-                issues=schema.validate(resource, resource_presence_config),
-                location=resource_location,
-            )
+        indices = [i for i, resource in enumerate(resources) if resource is not Invalid]
+        resources_issues = yield ItemsValidation(
+            validate=partial(_validate_resource, presence_config=resource_presence_config),
+            items=[(resources[i], resource_schemas[i]) for i in indices],
+            max_errors=issues.remaining_errors(kwargs.get("max_errors")),
+        )
+        for i, issues_ in zip(indices, resources_issues):
+            issues.merge(issues=issues_, location=(*resources_rep.location, i))
         return issues
 
     def _deserialize(self, data: ScimData) -> ScimData:
@@ -159,18 +168,14 @@ class ListResponseSchema(BaseSchema):
             >>> )
             [<scimpler.schemas.user.UserSchema at 0x7f1f6c193090>, None]
         """
-        resource_schemas: list[Optional[BaseResourceSchema]] = []
-        n_schemas = len(self._contained_schemas)
-        for resource in resources:
-            if isinstance(resource, Mapping):
-                resource = ScimData(resource)
-            if not isinstance(resource, ScimData):
-                resource_schemas.append(None)
-            elif n_schemas == 1:
-                resource_schemas.append(self._contained_schemas[0])
-            else:
-                resource_schemas.append(self.get_schema(resource))
-        return resource_schemas
+        return [self._get_resource_schema(resource) for resource in resources]
+
+    def _get_resource_schema(self, resource: Any) -> Optional[BaseResourceSchema]:
+        if not isinstance(resource, Mapping):
+            return None
+        if len(self._contained_schemas) == 1:
+            return self._contained_schemas[0]
+        return self.get_schema(resource)
 
     def get_schema(self, resource: Mapping) -> Optional[BaseResourceSchema]:
         """
@@ -180,7 +185,7 @@ class ListResponseSchema(BaseSchema):
         Args:
             resource: Resource data to get the schema for.
         """
-        resource = ScimData(resource)
+        resource = ScimData.view(resource)
         schemas_value = resource.get("schemas")
         if isinstance(schemas_value, list) and len(schemas_value) > 0:
             schemas_value = {SchemaUri(item) for item in schemas_value if isinstance(item, str)}
@@ -189,6 +194,90 @@ class ListResponseSchema(BaseSchema):
                     return schema
         return None
 
+    def iter_json(
+        self,
+        resources: Iterable[Mapping[str, Any]],
+        total_results: int,
+        start_index: Optional[int] = None,
+        items_per_page: Optional[int] = None,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> Iterator[str]:
+        """
+        Serializes the list response and encodes it to JSON, chunk by chunk. Resources are
+        serialized and encoded one by one, so they can be provided lazily (e.g. fetched from
+        the database in batches), and the whole response is never kept in memory. The output
+        is the same as the one of `json.dumps(list_response.serialize(data).to_dict())`.
+
+        Args:
+            resources: Resources to include in the response.
+            total_results: Value of `totalResults` attribute.
+            start_index: Value of `startIndex` attribute, if any.
+            items_per_page: Value of `itemsPerPage` attribute, if any.
+            default: Function that returns a serializable version of a value that can not
+                be serialized otherwise, as in `json.dumps`.
+
+        Returns:
+            Generator of JSON chunks.
+
+        Examples:
+            >>> from scimpler.schemas import UserSchema
+            >>>
+            >>> list_response = ListResponseSchema([UserSchema()])
+            >>> users = ({"id": str(i), "userName": f"user{i}"} for i in range(2))
+            >>> "".join(list_response.iter_json(users, total_results=2))
+            '{"schemas": ["urn:ietf:params:scim:api:messages:2.0:ListResponse"], '
+            '"totalResults": 2, "Resources": [{"id": "0", "userName": "user0"}, '
+            '{"id": "1", "userName": "user1"}]}'
+        """
+        header = ScimData({"schemas": [self.schema], "totalResults": total_results})
+        if start_index is not None:
+            header.set(self.attrs.startindex, start_index)
+        if items_per_page is not None:
+            header.set(self.attrs.itemsperpage, items_per_page)
+        header_json = "".join(self.serialize(header).iter_json(default))
+
+        # 'Resources' are not serialized if there are none, as in 'serialize'
+        separator = f'{header_json[:-1]}, "Resources": ['
+        for resource in resources:
+            yield separator
+            schema = self._get_resource_schema(resource)
+            serialized = ScimData() if schema is None else schema.serialize(resource)
+            yield from serialized.iter_json(default)
+            separator = ", "
+        yield "]}" if separator == ", " else header_json
+
+    def write_json(
+        self,
+        fp: IO[str],
+        resources: Iterable[Mapping[str, Any]],
+        total_results: int,
+        start_index: Optional[int] = None,
+        items_per_page: Optional[int] = None,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        """
+        Writes the list response to the provided text file-like object, encoded to JSON.
+        See `iter_json`.
+
+        Args:
+            fp: File-like object to write to.
+            resources: Resources to include in the response.
+            total_results: Value of `totalResults` attribute.
+            start_index: Value of `startIndex` attribute, if any.
+            items_per_page: Value of `itemsPerPage` attribute, if any.
+            default: Function that returns a serializable version of a value that can not
+                be serialized otherwise, as in `json.dump`.
+        """
+        fp.writelines(
+            self.iter_json(
+                resources=resources,
+                total_results=total_results,
+                start_index=start_index,
+                items_per_page=items_per_page,
+                default=default,
+            )
+        )
+
 
 def validate_items_per_page_consistency(
     resources_: list[Any], items_per_page_: Any
@@ -5,7 +5,13 @@ from scimpler.data.attr_value_presence import validate_presence
 from scimpler.data.attrs import Attribute, AttributeMutability, Complex, String, Unknown
 from scimpler.data.patch_path import PatchPath
 from scimpler.data.schemas import BaseSchema, ResourceSchema
-from scimpler.data.scim_data import Invalid, Missing, MissingType, ScimData
+from scimpler.data.scim_data import (
+    Invalid,
+    Missing,
+    MissingType,
+    ScimData,
+    mask_invalid,
+)
 from scimpler.error import ValidationError, ValidationIssues
 
 
@@ -67,7 +73,7 @@ class PatchOpSchema(BaseSchema):
                     "path",
                     validators=[PatchPath.validate],
                     deserializer=PatchPath.deserialize,
-                    serializer=lambda path: path.serialize(),
+                    serializer=PatchPath.serialize,
                 ),
                 Unknown("value"),
             ],
@@ -96,7 +102,10 @@ class PatchOpSchema(BaseSchema):
         if not all([ops, paths, values]):
             return issues
 
+        max_errors = kwargs.get("max_errors")
         for i, (op, path, value) in enumerate(zip(ops, paths, values)):
+            if issues.limit_reached(max_errors):
+                break
             if Invalid in (op, path, value):
                 continue
 
@@ -104,7 +113,9 @@ class PatchOpSchema(BaseSchema):
                 path = PatchPath.deserialize(path)
             if op in ["add", "replace"]:
                 issues.merge(
-                    issues=self._validate_add_or_replace_operation(path, value),
+                    issues=self._validate_add_or_replace_operation(
+                        path, value, issues.remaining_errors(max_errors)
+                    ),
                     location=(self.attrs.operations.attr, i),
                 )
             else:
@@ -161,7 +172,10 @@ class PatchOpSchema(BaseSchema):
         return issues
 
     def _validate_add_or_replace_operation(
-        self, path: Union[PatchPath, None, MissingType], value: Any
+        self,
+        path: Union[PatchPath, None, MissingType],
+        value: Any,
+        max_errors: Optional[int] = None,
     ) -> ValidationIssues:
         issues = ValidationIssues()
         attr = None
@@ -177,19 +191,24 @@ class PatchOpSchema(BaseSchema):
                 return issues
 
         issues.merge(
-            issues=self._validate_operation_value(attr, path, value),
+            issues=self._validate_operation_value(attr, path, value, max_errors),
             location=[self.attrs.operations__value.sub_attr],
         )
         return issues
 
     def _validate_operation_value(
-        self, attr: Optional[Attribute], path: Union[PatchPath, None, MissingType], value: Any
+        self,
+        attr: Optional[Attribute],
+        path: Union[PatchPath, None, MissingType],
+        value: Any,
+        max_errors: Optional[int] = None,
     ) -> ValidationIssues:
         if isinstance(path, PatchPath):
-            return self._validate_update_attr_value(cast(Attribute, attr), value, path)
+            return self._validate_update_attr_value(cast(Attribute, attr), value, path, max_errors)
 
-        issues = self._resource_schema.validate(value)
+        issues = self._resource_schema.validate(value, max_errors=max_errors)
         issues.pop([27, 28, 29], location=["schemas"])
+        value = mask_invalid(value, issues)
         for attr_rep, attr in self._resource_schema.attrs:
             attr_value = value.get(attr_rep)
             if attr_value is Missing:
@@ -236,7 +255,7 @@ class PatchOpSchema(BaseSchema):
 
     @staticmethod
     def _validate_update_attr_value(
-        attr: Attribute, attr_value: Any, path: PatchPath
+        attr: Attribute, attr_value: Any, path: PatchPath, max_errors: Optional[int] = None
     ) -> ValidationIssues:
         issues = ValidationIssues()
         if attr.mutability == AttributeMutability.READ_ONLY:
@@ -252,10 +271,11 @@ class PatchOpSchema(BaseSchema):
         )
 
         if updating_multivalued_items:
-            issues_ = attr.validate([attr_value]).get(location=[0])
+            issues_ = attr.validate([attr_value], max_errors).get(location=[0])
         else:
-            issues_ = attr.validate(attr_value)
+            issues_ = attr.validate(attr_value, max_errors)
         issues.merge(issues_)
+        attr_value = mask_invalid(attr_value, issues_)
 
         if issues_.can_proceed() and isinstance(attr, Complex):
             issues.merge(
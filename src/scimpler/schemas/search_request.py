@@ -76,13 +76,13 @@ class SearchRequestSchema(BaseSchema):
             name="filter",
             validators=[Filter.validate],
             deserializer=Filter.deserialize,
-            serializer=lambda f: f.serialize(),
+            serializer=Filter.serialize,
         ),
         String(
             name="sortBy",
             validators=[AttrRepFactory.validate],
             deserializer=AttrRepFactory.deserialize,
-            serializer=lambda value: str(value),
+            serializer=str,
         ),
         String(
             name="sortOrder",
@@ -1,6 +1,13 @@
 import abc
+import asyncio
+import sys
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from multiprocessing.context import BaseContext
 from typing import Any, Mapping, Optional, Sequence, Union, cast
 
+import scimpler._registry
 import scimpler.config
 from scimpler.data.attr_value_presence import AttrValuePresenceConfig
 from scimpler.data.attrs import (
@@ -11,9 +18,18 @@ from scimpler.data.attrs import (
     Complex,
 )
 from scimpler.data.filter import Filter
+from scimpler.data.identifiers import SchemaUri
 from scimpler.data.schemas import BaseResourceSchema, BaseSchema, ResourceSchema
-from scimpler.data.scim_data import Invalid, Missing, ScimData
+from scimpler.data.scim_data import Invalid, Missing, ScimData, mask_invalid
 from scimpler.data.sorter import Sorter
+from scimpler.data.utils import (
+    DEFAULT_CHUNK_SIZE,
+    ItemsValidation,
+    ValidationSteps,
+    arun_validation,
+    check_max_errors,
+    run_validation,
+)
 from scimpler.error import ValidationError, ValidationIssues, ValidationWarning
 from scimpler.schemas import (
     BulkRequestSchema,
@@ -38,7 +54,12 @@ class Validator(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def validate_request(self, body: Optional[Mapping[str, Any]] = None) -> ValidationIssues:
+    def validate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+    ) -> ValidationIssues:
         """Validates requests."""
 
     @abc.abstractmethod
@@ -48,10 +69,65 @@ class Validator(abc.ABC):
         status_code: int,
         body: Optional[Mapping[str, Any]] = None,
         headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
         **kwargs,
     ) -> ValidationIssues:
         """Validates responses."""
 
+    async def avalidate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> ValidationIssues:
+        """
+        Asynchronous counterpart of `validate_request`, returning the same validation issues.
+        If `executor` is provided, the validation is run by the executor, so the event loop
+        is not blocked. Otherwise, the control is given back to the event loop once, and then
+        the request is validated at once, blocking the event loop for the time of validation.
+        Only `ResourcesQuery` and `BulkOperations` validate their items in chunks, giving the
+        control back to the event loop between them.
+        """
+        check_max_errors(max_errors)
+        validate = partial(self.validate_request, body, max_errors=max_errors)
+        if executor is None:
+            await asyncio.sleep(0)
+            return validate()
+        return await asyncio.get_running_loop().run_in_executor(executor, validate)
+
+    async def avalidate_response(
+        self,
+        *,
+        status_code: int,
+        body: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
+        **kwargs,
+    ) -> ValidationIssues:
+        """
+        Asynchronous counterpart of `validate_response`, returning the same validation issues.
+        If `executor` is provided in keyword arguments, the validation is run by the executor,
+        so the event loop is not blocked. Otherwise, the control is given back to the event loop
+        once, and then the response is validated at once, blocking the event loop for the time
+        of validation. Only `ResourcesQuery` and `BulkOperations` validate their items in chunks,
+        giving the control back to the event loop between them.
+        """
+        check_max_errors(max_errors)
+        executor = kwargs.pop("executor", None)
+        validate = partial(
+            self.validate_response,
+            status_code=status_code,
+            body=body,
+            headers=headers,
+            max_errors=max_errors,
+            **kwargs,
+        )
+        if executor is None:
+            await asyncio.sleep(0)
+            return validate()
+        return await asyncio.get_running_loop().run_in_executor(executor, validate)
+
 
 class Error(Validator):
     """
@@ -69,7 +145,13 @@ class Error(Validator):
         """
         return self._schema
 
-    def validate_request(self, body: Optional[Mapping[str, Any]] = None) -> ValidationIssues:
+    def validate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+    ) -> ValidationIssues:
+        check_max_errors(max_errors)
         raise NotImplementedError
 
     def validate_response(
@@ -78,6 +160,7 @@ class Error(Validator):
         status_code: int,
         body: Optional[Mapping[str, Any]] = None,
         headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
         **kwargs: Any,
     ) -> ValidationIssues:
         """
@@ -92,18 +175,23 @@ class Error(Validator):
             status_code: Returned HTTP status code.
             body: Returned error body.
             headers: Returned response headers.
+            max_errors: Number of errors after which the validation stops.
             **kwargs: Not used.
 
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
         body_location = ("body",)
         issues = ValidationIssues()
-        normalized = ScimData(body or {})
-        issues.merge(
-            self.response_schema.validate(normalized, AttrValuePresenceConfig("RESPONSE")),
-            location=body_location,
+        normalized = ScimData.view(body or {})
+        issues_ = self.response_schema.validate(
+            normalized, AttrValuePresenceConfig("RESPONSE"), max_errors
         )
+        issues.merge(issues_, location=body_location)
+        if issues.limit_reached(max_errors):
+            return issues
+        normalized = mask_invalid(normalized, issues_)
         status_attr_rep = self.response_schema.attrs.status
         status_location = body_location + status_attr_rep.location
         if (status_in_body := normalized.get(status_attr_rep)) and str(
@@ -177,6 +265,7 @@ def _validate_resource_output_body(
     body: ScimData,
     headers: Mapping[str, Any],
     presence_config: Optional[AttrValuePresenceConfig],
+    max_errors: Optional[int] = None,
 ) -> ValidationIssues:
     issues = ValidationIssues()
     body_location = ("body",)
@@ -184,13 +273,15 @@ def _validate_resource_output_body(
     if presence_config.direction != "RESPONSE":
         raise ValueError("bad direction in attribute presence config for response validation")
 
-    issues.merge(
-        schema.validate(
-            data=body,
-            presence_config=presence_config,
-        ),
-        location=body_location,
+    issues_ = schema.validate(
+        data=body,
+        presence_config=presence_config,
+        max_errors=max_errors,
     )
+    issues.merge(issues_, location=body_location)
+    if issues.limit_reached(max_errors):
+        return issues
+    body = mask_invalid(body, issues_)
 
     if "Location" not in headers and location_header_required:
         issues.add_error(
@@ -275,7 +366,13 @@ class ResourceObjectGet(Validator):
         """
         return self._response_schema
 
-    def validate_request(self, body: Optional[Mapping[str, Any]] = None) -> ValidationIssues:
+    def validate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+    ) -> ValidationIssues:
+        check_max_errors(max_errors)
         return ValidationIssues()
 
     def validate_response(
@@ -284,6 +381,7 @@ class ResourceObjectGet(Validator):
         status_code: int,
         body: Optional[Mapping[str, Any]] = None,
         headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
         **kwargs,
     ) -> ValidationIssues:
         """
@@ -301,6 +399,7 @@ class ResourceObjectGet(Validator):
             status_code: Returned HTTP status code.
             body: Returned body.
             headers: Returned response headers.
+            max_errors: Number of errors after which the validation stops.
 
         Keyword Args:
             presence_config (Optional[AttrValuePresenceConfig]): If not provided, the default one
@@ -309,15 +408,17 @@ class ResourceObjectGet(Validator):
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
         return _validate_resource_output_body(
             schema=self._schema,
             config=self.config,
             location_header_required=False,
             expected_status_code=200,
             status_code=status_code,
-            body=ScimData(body or {}),
+            body=ScimData.view(body or {}),
             headers=headers or {},
             presence_config=kwargs.get("presence_config"),
+            max_errors=max_errors,
         )
 
 
@@ -370,7 +471,12 @@ class ResourceObjectPut(Validator):
         """
         return self._schema
 
-    def validate_request(self, body: Optional[Mapping[str, Any]] = None) -> ValidationIssues:
+    def validate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+    ) -> ValidationIssues:
         """
         Validates the **HTTP PUT** requests sent to **resource object** endpoints.
 
@@ -379,10 +485,12 @@ class ResourceObjectPut(Validator):
 
         Args:
             body: The request body.
+            max_errors: Number of errors after which the validation stops.
 
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
         issues = ValidationIssues()
         issues.merge(
             issues=self._schema.validate(
@@ -393,6 +501,7 @@ class ResourceObjectPut(Validator):
                         attr_rep for attr_rep, attr in self._schema.attrs if attr.required
                     ],
                 ),
+                max_errors=max_errors,
             ),
             location=["body"],
         )
@@ -404,6 +513,7 @@ class ResourceObjectPut(Validator):
         status_code: int,
         body: Optional[Mapping[str, Any]] = None,
         headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
         **kwargs,
     ) -> ValidationIssues:
         """
@@ -421,6 +531,7 @@ class ResourceObjectPut(Validator):
             status_code: Returned HTTP status code.
             body: Returned body.
             headers: Returned response headers.
+            max_errors: Number of errors after which the validation stops.
 
         Keyword Args:
             presence_config (Optional[AttrValuePresenceConfig]): If not provided, the default one
@@ -429,15 +540,17 @@ class ResourceObjectPut(Validator):
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
         return _validate_resource_output_body(
             schema=self._schema,
             config=self.config,
             location_header_required=False,
             expected_status_code=200,
             status_code=status_code,
-            body=ScimData(body or {}),
+            body=ScimData.view(body or {}),
             headers=headers or {},
             presence_config=kwargs.get("presence_config"),
+            max_errors=max_errors,
         )
 
 
@@ -491,7 +604,12 @@ class ResourcesPost(Validator):
         """
         return self._response_schema
 
-    def validate_request(self, body: Optional[Mapping[str, Any]] = None) -> ValidationIssues:
+    def validate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+    ) -> ValidationIssues:
         """
         Validates the **HTTP POST** requests sent to **resource type** endpoints.
 
@@ -503,14 +621,18 @@ class ResourcesPost(Validator):
 
         Args:
             body: The request body.
+            max_errors: Number of errors after which the validation stops.
 
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
         issues = ValidationIssues()
-        normalized = ScimData(body or {})
+        normalized = ScimData.view(body or {})
         issues.merge(
-            issues=self._schema.validate(normalized, AttrValuePresenceConfig("REQUEST")),
+            issues=self._schema.validate(
+                normalized, AttrValuePresenceConfig("REQUEST"), max_errors
+            ),
             location=["body"],
         )
         return issues
@@ -521,6 +643,7 @@ class ResourcesPost(Validator):
         status_code: int,
         body: Optional[Mapping[str, Any]] = None,
         headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
         **kwargs,
     ) -> ValidationIssues:
         """
@@ -540,6 +663,7 @@ class ResourcesPost(Validator):
             status_code: Returned HTTP status code.
             body: Returned body.
             headers: Returned response headers.
+            max_errors: Number of errors after which the validation stops.
 
         Keyword Args:
             presence_config (Optional[AttrValuePresenceConfig]): If not provided, the default one
@@ -548,12 +672,13 @@ class ResourcesPost(Validator):
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
         issues = ValidationIssues()
         if not body:
             issues.add_warning(issue=ValidationWarning.missing(), location=["body"])
             return issues
 
-        normalized = ScimData(body)
+        normalized = ScimData.view(body)
         issues = _validate_resource_output_body(
             schema=self._schema,
             config=self.config,
@@ -563,7 +688,9 @@ class ResourcesPost(Validator):
             body=normalized,
             headers=headers or {},
             presence_config=kwargs.get("presence_config"),
+            max_errors=max_errors,
         )
+        normalized = mask_invalid(normalized, issues.get(location=["body"]))
         if normalized.get(self._schema.attrs.meta__created) != normalized.get(
             self._schema.attrs.meta__lastModified
         ):
@@ -586,10 +713,12 @@ def _validate_resources_sorted(
         if not can_validate_sorting(sorter, resource_presence_config, resource_schema):
             return issues
 
-    if resources != sorter(resources, resource_schemas):
+    index = sorter.find_out_of_order(resources, resource_schemas)
+    if index is not None:
         issues.add_error(
             issue=ValidationError.resources_not_sorted(),
             proceed=True,
+            location=[index],
         )
     return issues
 
@@ -679,17 +808,25 @@ def _validate_resources_filtered(
         if not can_validate_filtering(filter_, resource_presence_config, resource_schema):
             return issues
 
-    for i, (resource, schema) in enumerate(zip(resources, resource_schemas)):
-        if not filter_(resource, schema):
-            issues.add_error(
-                issue=ValidationError.resources_not_filtered(),
-                proceed=True,
-                location=[i],
-            )
+    indices_by_schema: dict[BaseResourceSchema, list[int]] = defaultdict(list)
+    for i, schema in enumerate(resource_schemas):
+        indices_by_schema[schema].append(i)
+
+    not_matching = set()
+    for schema, indices in indices_by_schema.items():
+        matching = filter_.select([resources[i] for i in indices], schema)
+        not_matching.update(set(indices).difference(indices[j] for j in matching))
+
+    for i in sorted(not_matching):
+        issues.add_error(
+            issue=ValidationError.resources_not_filtered(),
+            proceed=True,
+            location=[i],
+        )
     return issues
 
 
-def _validate_resources_get_response(
+def _iter_validate_resources_get_response(
     schema: ListResponseSchema,
     config: scimpler.config.ServiceProviderConfig,
     status_code: int,
@@ -699,7 +836,8 @@ def _validate_resources_get_response(
     filter_: Optional[Filter] = None,
     sorter: Optional[Sorter] = None,
     resource_presence_config: Optional[AttrValuePresenceConfig] = None,
-) -> ValidationIssues:
+    max_errors: Optional[int] = None,
+) -> ValidationSteps:
     issues = ValidationIssues()
     body_location = ("body",)
     resources_location = body_location + schema.attrs.resources.location
@@ -711,12 +849,16 @@ def _validate_resources_get_response(
     if resource_presence_config.direction != "RESPONSE":
         raise ValueError("bad direction in attribute presence config for list resources validation")
 
-    issues_ = schema.validate(
+    issues_ = yield from schema.iter_validate(
         data=body,
         presence_config=AttrValuePresenceConfig("RESPONSE"),
+        max_errors=max_errors,
         resource_presence_config=resource_presence_config,
     )
     issues.merge(issues_, location=body_location)
+    if issues.limit_reached(max_errors):
+        return issues
+    body = mask_invalid(body, issues_)
     issues.merge(
         issues=_validate_status_code(200, status_code),
         location=("status",),
@@ -894,7 +1036,13 @@ class ResourcesQuery(Validator):
         """
         return self._response_schema
 
-    def validate_request(self, body: Optional[Mapping[str, Any]] = None) -> ValidationIssues:
+    def validate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+    ) -> ValidationIssues:
+        check_max_errors(max_errors)
         return ValidationIssues()
 
     def validate_response(
@@ -903,6 +1051,7 @@ class ResourcesQuery(Validator):
         status_code: int,
         body: Optional[Mapping[str, Any]] = None,
         headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
         **kwargs,
     ) -> ValidationIssues:
         """
@@ -928,6 +1077,7 @@ class ResourcesQuery(Validator):
             status_code: Returned HTTP status code.
             body: Returned body.
             headers: Not used.
+            max_errors: Number of errors after which the validation stops.
 
         Keyword Args:
             presence_config (Optional[AttrValuePresenceConfig]): If not provided, the default one
@@ -937,20 +1087,72 @@ class ResourcesQuery(Validator):
             count (Optional[int]): Specifies the desired number of query results per page.
             filter (Optional[Filter]): Filter that was applied on `Resources`.
             sorter (Optional[Sorter]): Sorter that was applied on `Resources`.
+            executor (Optional[Executor]): If provided, `Resources` are split into chunks,
+                validated concurrently by the executor. See `create_executor`.
+            chunk_size (int): Number of resources validated in a single executor task.
+
+        Returns:
+            Validation issues.
+        """
+        check_max_errors(max_errors)
+        return run_validation(
+            self._iter_validate_response(status_code, body, max_errors, **kwargs),
+            executor=kwargs.get("executor"),
+            chunk_size=kwargs.get("chunk_size", DEFAULT_CHUNK_SIZE),
+        )
+
+    async def avalidate_response(
+        self,
+        *,
+        status_code: int,
+        body: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
+        **kwargs,
+    ) -> ValidationIssues:
+        """
+        Asynchronous counterpart of `validate_response`, returning the same validation issues.
+        `Resources` are validated in chunks of `chunk_size` resources, and the control is given
+        back to the event loop between them. If `executor` is provided, the chunks are validated
+        by the executor.
+
+        Args:
+            status_code: Returned HTTP status code.
+            body: Returned body.
+            headers: Not used.
+            max_errors: Number of errors after which the validation stops.
+
+        Keyword Args:
+            The same as in `validate_response`.
 
         Returns:
             Validation issues.
         """
-        return _validate_resources_get_response(
+        check_max_errors(max_errors)
+        return await arun_validation(
+            self._iter_validate_response(status_code, body, max_errors, **kwargs),
+            executor=kwargs.get("executor"),
+            chunk_size=kwargs.get("chunk_size", DEFAULT_CHUNK_SIZE),
+        )
+
+    def _iter_validate_response(
+        self,
+        status_code: int,
+        body: Optional[Mapping[str, Any]],
+        max_errors: Optional[int],
+        **kwargs,
+    ) -> ValidationSteps:
+        return _iter_validate_resources_get_response(
             schema=self._response_validation_schema,
             config=self.config,
             status_code=status_code,
-            body=ScimData(body or {}),
+            body=ScimData.view(body or {}),
             start_index=kwargs.get("start_index", 1),
             count=kwargs.get("count"),
             filter_=kwargs.get("filter"),
             sorter=kwargs.get("sorter"),
             resource_presence_config=kwargs.get("presence_config"),
+            max_errors=max_errors,
         )
 
 
@@ -999,7 +1201,12 @@ class SearchRequestPost(ResourcesQuery):
         """
         return self._response_schema
 
-    def validate_request(self, body: Optional[Mapping[str, Any]] = None) -> ValidationIssues:
+    def validate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+    ) -> ValidationIssues:
         """
         Validates the **HTTP POST** query requests.
 
@@ -1007,14 +1214,16 @@ class SearchRequestPost(ResourcesQuery):
 
         Args:
             body: The request body.
+            max_errors: Number of errors after which the validation stops.
 
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
         issues = ValidationIssues()
         issues.merge(
             self._request_validation_schema.validate(
-                ScimData(body or {}), AttrValuePresenceConfig("REQUEST")
+                ScimData.view(body or {}), AttrValuePresenceConfig("REQUEST"), max_errors
             ),
             location=["body"],
         )
@@ -1077,7 +1286,12 @@ class ResourceObjectPatch(Validator):
         """
         return self._response_schema
 
-    def validate_request(self, body: Optional[Mapping[str, Any]] = None) -> ValidationIssues:
+    def validate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+    ) -> ValidationIssues:
         """
         Validates the **HTTP PATCH** requests sent to **resource object** endpoints.
 
@@ -1086,14 +1300,16 @@ class ResourceObjectPatch(Validator):
 
         Args:
             body: The request body.
+            max_errors: Number of errors after which the validation stops.
 
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
         issues = ValidationIssues()
-        normalized = ScimData(body or {})
+        normalized = ScimData.view(body or {})
         issues.merge(
-            self._schema.validate(normalized, AttrValuePresenceConfig("REQUEST")),
+            self._schema.validate(normalized, AttrValuePresenceConfig("REQUEST"), max_errors),
             location=["body"],
         )
         return issues
@@ -1104,6 +1320,7 @@ class ResourceObjectPatch(Validator):
         status_code: int,
         body: Optional[Mapping[str, Any]] = None,
         headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
         **kwargs,
     ) -> ValidationIssues:
         """
@@ -1122,6 +1339,7 @@ class ResourceObjectPatch(Validator):
             status_code: Returned HTTP status code.
             body: Returned body.
             headers: Returned response headers.
+            max_errors: Number of errors after which the validation stops.
 
         Keyword Args:
             presence_config (Optional[AttrValuePresenceConfig]): If not provided, the default one
@@ -1130,6 +1348,7 @@ class ResourceObjectPatch(Validator):
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
         issues = ValidationIssues()
         presence_config = kwargs.get("presence_config")
         if status_code == 204:
@@ -1146,9 +1365,10 @@ class ResourceObjectPatch(Validator):
             location_header_required=False,
             expected_status_code=200,
             status_code=status_code,
-            body=ScimData(body or {}),
+            body=ScimData.view(body or {}),
             headers=headers or {},
             presence_config=presence_config,
+            max_errors=max_errors,
         )
 
 
@@ -1157,7 +1377,13 @@ class ResourceObjectDelete(Validator):
     Validator for **HTTP DELETE** operations performed against **resource object** endpoints.
     """
 
-    def validate_request(self, body: Optional[Mapping[str, Any]] = None) -> ValidationIssues:
+    def validate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+    ) -> ValidationIssues:
+        check_max_errors(max_errors)
         return ValidationIssues()
 
     def validate_response(
@@ -1166,6 +1392,7 @@ class ResourceObjectDelete(Validator):
         status_code: int,
         body: Optional[Mapping[str, Any]] = None,
         headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
         **kwargs: Any,
     ) -> ValidationIssues:
         """
@@ -1177,11 +1404,13 @@ class ResourceObjectDelete(Validator):
             status_code: Returned HTTP status code.
             body: Not used.
             headers: Not Used.
+            max_errors: Not used.
             **kwargs: Not used.
 
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
         issues = ValidationIssues()
         if status_code != 204:
             issues.add_error(
@@ -1291,7 +1520,14 @@ class BulkOperations(Validator):
         """
         return self._response_schema
 
-    def validate_request(self, body: Optional[Mapping[str, Any]] = None) -> ValidationIssues:
+    def validate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ValidationIssues:
         """
         Validates the **HTTP POST** requests performed against bulk endpoint.
 
@@ -1302,17 +1538,63 @@ class BulkOperations(Validator):
 
         Args:
             body: Request body.
+            max_errors: Number of errors after which the validation stops.
+            executor: If provided, data of `Operations` is split into chunks, validated
+                concurrently by the executor. See `create_executor`.
+            chunk_size: Number of operations validated in a single executor task.
 
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
+        return run_validation(
+            self._iter_validate_request(body, max_errors),
+            executor=executor,
+            chunk_size=chunk_size,
+        )
+
+    async def avalidate_request(
+        self,
+        body: Optional[Mapping[str, Any]] = None,
+        *,
+        max_errors: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ValidationIssues:
+        """
+        Asynchronous counterpart of `validate_request`, returning the same validation issues.
+        Data of `Operations` is validated in chunks of `chunk_size` operations, and the control
+        is given back to the event loop between them.
+
+        Args:
+            body: Request body.
+            max_errors: Number of errors after which the validation stops.
+            executor: If provided, the chunks are validated by the executor.
+            chunk_size: Number of operations validated in a single chunk.
+
+        Returns:
+            Validation issues.
+        """
+        check_max_errors(max_errors)
+        return await arun_validation(
+            self._iter_validate_request(body, max_errors),
+            executor=executor,
+            chunk_size=chunk_size,
+        )
+
+    def _iter_validate_request(
+        self, body: Optional[Mapping[str, Any]], max_errors: Optional[int]
+    ) -> ValidationSteps:
         issues = ValidationIssues()
         body_location = ("body",)
-        normalized = ScimData(body or {})
-        issues.merge(
-            self._request_schema.validate(normalized, AttrValuePresenceConfig("REQUEST")),
-            location=body_location,
+        normalized = ScimData.view(body or {})
+        issues_ = yield from self._request_schema.iter_validate(
+            normalized, AttrValuePresenceConfig("REQUEST"), max_errors
         )
+        issues.merge(issues_, location=body_location)
+        if issues.limit_reached(max_errors):
+            return issues
+        normalized = mask_invalid(normalized, issues_)
         if not normalized.get(self._request_schema.attrs.operations):
             return issues
 
@@ -1331,6 +1613,7 @@ class BulkOperations(Validator):
         paths = normalized.get(self._request_schema.attrs.operations__path)
         data = normalized.get(self._request_schema.attrs.operations__data)
         methods = normalized.get(self._request_schema.attrs.operations__method)
+        indices, operations = [], []
         for i, (path, data_item, method) in enumerate(zip(paths, data, methods)):
             if not all([path, data_item, method]) or method == "DELETE":
                 continue
@@ -1339,9 +1622,17 @@ class BulkOperations(Validator):
             else:
                 resource_type_endpoint = f"/{path.split('/', 2)[1]}"
             validator = cast(Validator, self._validators[method].get(resource_type_endpoint))
-            issues_ = validator.validate_request(body=data_item)
+            indices.append(i)
+            operations.append((validator, data_item))
+
+        operations_issues = yield ItemsValidation(
+            validate=_validate_operation_request,
+            items=operations,
+            max_errors=issues.remaining_errors(max_errors),
+        )
+        for i, issues_ in zip(indices, operations_issues):
             data_item_location = body_location + (data_rep.attr, i, data_rep.sub_attr)
-            issues.merge(issues_.get(location=["body"]), location=data_item_location)
+            issues.merge(issues_, location=data_item_location)
         return issues
 
     def validate_response(
@@ -1350,6 +1641,7 @@ class BulkOperations(Validator):
         status_code: int,
         body: Optional[Mapping[str, Any]] = None,
         headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
         **kwargs,
     ) -> ValidationIssues:
         """
@@ -1368,21 +1660,76 @@ class BulkOperations(Validator):
             status_code: Returned HTTP status code.
             body: Returned body.
             headers: Not used.
+            max_errors: Number of errors after which the validation stops.
 
         Keyword Args:
             fail_on_errors (Optional[int]): An integer specifying the number of errors that the
                 service provider should accept before the operation is terminated.
+            executor (Optional[Executor]): If provided, `Operations` are split into chunks,
+                validated concurrently by the executor. See `create_executor`.
+            chunk_size (int): Number of operations validated in a single executor task.
 
         Returns:
             Validation issues.
         """
+        check_max_errors(max_errors)
+        return run_validation(
+            self._iter_validate_response(status_code, body, max_errors, **kwargs),
+            executor=kwargs.get("executor"),
+            chunk_size=kwargs.get("chunk_size", DEFAULT_CHUNK_SIZE),
+        )
+
+    async def avalidate_response(
+        self,
+        *,
+        status_code: int,
+        body: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+        max_errors: Optional[int] = None,
+        **kwargs,
+    ) -> ValidationIssues:
+        """
+        Asynchronous counterpart of `validate_response`, returning the same validation issues.
+        `Operations` are validated in chunks of `chunk_size` operations, and the control is given
+        back to the event loop between them. If `executor` is provided, the chunks are validated
+        by the executor.
+
+        Args:
+            status_code: Returned HTTP status code.
+            body: Returned body.
+            headers: Not used.
+            max_errors: Number of errors after which the validation stops.
+
+        Keyword Args:
+            The same as in `validate_response`.
+
+        Returns:
+            Validation issues.
+        """
+        check_max_errors(max_errors)
+        return await arun_validation(
+            self._iter_validate_response(status_code, body, max_errors, **kwargs),
+            executor=kwargs.get("executor"),
+            chunk_size=kwargs.get("chunk_size", DEFAULT_CHUNK_SIZE),
+        )
+
+    def _iter_validate_response(
+        self,
+        status_code: int,
+        body: Optional[Mapping[str, Any]],
+        max_errors: Optional[int],
+        **kwargs,
+    ) -> ValidationSteps:
         issues = ValidationIssues()
-        normalized = ScimData(body or {})
+        normalized = ScimData.view(body or {})
         body_location = ("body",)
-        issues.merge(
-            self._response_schema.validate(normalized, AttrValuePresenceConfig("RESPONSE")),
-            location=body_location,
+        issues_ = yield from self._response_schema.iter_validate(
+            normalized, AttrValuePresenceConfig("RESPONSE"), max_errors
         )
+        issues.merge(issues_, location=body_location)
+        if issues.limit_reached(max_errors):
+            return issues
+        normalized = mask_invalid(normalized, issues_)
         issues.merge(
             issues=_validate_status_code(200, status_code),
             location=["status"],
@@ -1392,10 +1739,16 @@ class BulkOperations(Validator):
             return issues
 
         operations_location = body_location + self._response_schema.attrs.operations.location
-        for i, operation in enumerate(operations):
-            issues.merge(
-                issues=self._validate_response_operation(operation, (*operations_location, i)),
-            )
+        operations_issues = yield ItemsValidation(
+            validate=self._validate_response_operation,
+            items=operations,
+            max_errors=issues.remaining_errors(max_errors),
+        )
+        for i, issues_ in enumerate(operations_issues):
+            issues.merge(issues_, location=(*operations_location, i))
+        if issues.limit_reached(max_errors):
+            return issues
+
         n_errors = 0
         for operation in operations:
             status = operation.get("status")
@@ -1418,7 +1771,7 @@ class BulkOperations(Validator):
         return issues
 
     def _validate_response_operation(
-        self, operation: ScimData, operation_location: tuple
+        self, operation: ScimData, max_errors: Optional[int] = None
     ) -> ValidationIssues:
         issues = ValidationIssues()
         status = operation.get("status")
@@ -1430,10 +1783,10 @@ class BulkOperations(Validator):
         if not all([method, status, response]):
             return issues
 
-        response_location: tuple[Union[str, int], ...] = (*operation_location, "response")
-        status_location: tuple[Union[str, int], ...] = (*operation_location, "status")
-        location_location: tuple[Union[str, int], ...] = (*operation_location, "location")
-        version_location: tuple[Union[str, int], ...] = (*operation_location, "version")
+        response_location = ("response",)
+        status_location = ("status",)
+        location_location = ("location",)
+        version_location = ("version",)
 
         resource_validator = None
         if location:
@@ -1447,6 +1800,7 @@ class BulkOperations(Validator):
             issues_ = self._error_validator.validate_response(
                 status_code=status,
                 body=response,
+                max_errors=max_errors,
             )
             issues.merge(
                 issues=issues_.get(location=["body"]),
@@ -1466,6 +1820,7 @@ class BulkOperations(Validator):
             body=response,
             status_code=status,
             headers={"Location": location, "ETag": resource_version},
+            max_errors=max_errors,
         )
         meta_location_mismatch = issues_.pop([8], location=("body", "meta", "location"))
         header_location_mismatch = issues_.pop([8], location=("headers", "Location"))
@@ -1496,6 +1851,62 @@ class BulkOperations(Validator):
         return issues
 
 
+def _validate_operation_request(
+    item: tuple[Validator, ScimData], max_errors: Optional[int] = None
+) -> ValidationIssues:
+    validator, data = item
+    return validator.validate_request(body=data, max_errors=max_errors).get(location=["body"])
+
+
+def _register_schemas(schemas: dict[str, bool], resources: dict[str, str]) -> None:
+    for schema, extension in schemas.items():
+        if schema not in scimpler._registry.schemas:
+            scimpler._registry.register_schema(cast(SchemaUri, schema), extension=extension)
+    for resource, endpoint in resources.items():
+        scimpler._registry.resources.setdefault(resource, endpoint)
+
+
+def create_executor(
+    max_workers: Optional[int] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> Executor:
+    """
+    Creates an executor for concurrent validation of `Resources` in list responses, and
+    `Operations` in bulk requests and responses. Validation is CPU-bound, so thread pool is
+    created for free-threaded Python builds only, and process pool otherwise. In the latter case,
+    schemas, validators, and validated data are pickled when sent to the worker processes.
+
+    Schemas and resource types registered at the time of the executor creation are registered
+    in every worker process as well, so workers started with `spawn` or `forkserver` method
+    know about schema extensions. Schemas created after the executor are not known to its
+    workers, so the executor should be created once all resource schemas are defined.
+
+    Args:
+        max_workers: The maximum number of workers. If not provided, executor's default is used.
+        mp_context: The multiprocessing context used to start the worker processes. If not
+            provided, the default start method is used. Ignored for thread pool.
+
+    Returns:
+        The executor. It should be reused between validations, and shut down by the caller.
+
+    Examples:
+        >>> from scimpler.schemas import UserSchema
+        >>>
+        >>> validator = BulkOperations(resource_schemas=[UserSchema()])
+        >>> with create_executor() as executor:
+        >>>     issues = validator.validate_request(body, executor=executor)
+    """
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    if gil_enabled:
+        return ProcessPoolExecutor(
+            max_workers,
+            mp_context=mp_context,
+            initializer=_register_schemas,
+            initargs=(dict(scimpler._registry.schemas), dict(scimpler._registry.resources)),
+        )
+    return ThreadPoolExecutor(max_workers)
+
+
 _resource_output_filter = AttrFilter(
     filter_=(
         lambda attr: (
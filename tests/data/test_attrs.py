@@ -19,7 +19,7 @@ from scimpler.data.attrs import (
     UriReference,
 )
 from scimpler.data.identifiers import AttrRep, AttrRepFactory, BoundedAttrRep
-from scimpler.data.scim_data import ScimData
+from scimpler.data.scim_data import Invalid, ScimData
 from scimpler.error import ValidationError, ValidationIssues
 
 
@@ -55,6 +55,21 @@ def test_multi_valued_attribute_values_are_validate_separately():
     assert issues.to_dict() == {"1": {"_errors": [{"code": 2}]}}
 
 
+def test_validation_does_not_modify_invalid_values_but_marks_them_as_invalid():
+    attr = Complex(
+        sub_attributes=[String(name="type"), String(name="value")],
+        name="complex_attr",
+        multi_valued=True,
+        validators=[lambda value: ValidationIssues() if value[0] is Invalid else pytest.fail()],
+    )
+    value = ["bad", {"type": "work", "value": 42}]
+
+    issues = attr.validate(value)
+
+    assert value == ["bad", {"type": "work", "value": 42}]
+    assert set(issues.invalid_locations) == {(0,), (1, "value")}
+
+
 def test_complex_attribute_sub_attributes_are_validated_separately():
     attr = Complex(
         sub_attributes=[
@@ -0,0 +1,227 @@
+import pytest
+
+from scimpler._registry import register_schema
+from scimpler.data.attrs import String
+from scimpler.data.cache import CacheInfo, LRUCache
+from scimpler.data.filter import Filter
+from scimpler.data.identifiers import AttrRepFactory, SchemaUri
+from scimpler.data.patch_path import PatchPath
+from scimpler.data.scim_data import ScimData
+from scimpler.data.sorter import Sorter
+
+
+def test_value_is_produced_once_and_then_served_from_cache():
+    cache = LRUCache(maxsize=2)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_set("key", factory) == "value"
+    assert cache.get_or_set("key", factory) == "value"
+    assert len(calls) == 1
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(maxsize=2)
+    cache.get_or_set("a", lambda: 1)
+    cache.get_or_set("b", lambda: 2)
+    cache.get_or_set("a", lambda: 1)
+
+    cache.get_or_set("c", lambda: 3)
+
+    assert cache.get_or_set("a", lambda: -1) == 1
+    assert cache.get_or_set("b", lambda: -2) == -2
+
+
+def test_lowering_maxsize_evicts_entries():
+    cache = LRUCache(maxsize=3)
+    for key in "abc":
+        cache.get_or_set(key, lambda: key)
+
+    cache.maxsize = 1
+
+    assert cache.info().currsize == 1
+    assert cache.get_or_set("c", lambda: None) == "c"
+
+
+def test_nothing_is_cached_if_maxsize_is_zero():
+    cache = LRUCache(maxsize=0)
+
+    cache.get_or_set("a", lambda: 1)
+
+    assert cache.info() == CacheInfo(hits=0, misses=1, maxsize=0, currsize=0)
+
+
+def test_nothing_is_cached_if_factory_raises_exception():
+    cache = LRUCache(maxsize=1)
+
+    def factory():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        cache.get_or_set("a", factory)
+
+    assert cache.info().currsize == 0
+
+
+def test_negative_maxsize_is_rejected():
+    with pytest.raises(ValueError, match="'maxsize' must be greater or equal to 0"):
+        LRUCache(maxsize=-1)
+
+
+def test_copy_routine_is_applied_to_returned_values():
+    cache = LRUCache(maxsize=1, copy=list)
+    value = cache.get_or_set("a", lambda: [1])
+    value.append(2)
+
+    assert cache.get_or_set("a", lambda: None) == [1]
+
+
+def test_clearing_cache_removes_entries_but_preserves_statistics():
+    cache = LRUCache(maxsize=1)
+    cache.get_or_set("a", lambda: 1)
+    cache.get_or_set("a", lambda: 1)
+
+    cache.clear()
+
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=1, currsize=0)
+
+
+@pytest.mark.parametrize(
+    ("hits", "misses", "expected"),
+    ((0, 0, 0.0), (3, 1, 0.75), (0, 2, 0.0)),
+)
+def test_hit_rate_is_computed_from_statistics(hits, misses, expected):
+    info = CacheInfo(hits=hits, misses=misses, maxsize=1, currsize=0)
+
+    assert info.hit_rate == expected
+
+
+def test_precis_enforcement_is_cached_per_profile():
+    cache = String.get_precis_cache("nicknamecasemapped")
+    cache.clear()
+    info = cache.info()
+    first = String("first", precis="NicknameCaseMapped")
+    second = String("second", precis="NicknameCaseMapped")
+
+    assert first.enforce_precis("  Babs  Jensen ") == first.precis.enforce("  Babs  Jensen ")
+    assert second.enforce_precis("  Babs  Jensen ") == "babs jensen"
+    assert cache.info() == CacheInfo(
+        hits=info.hits + 1, misses=info.misses + 1, maxsize=info.maxsize, currsize=1
+    )
+    assert String.get_precis_cache("OpaqueString") is not cache
+
+
+def test_values_not_allowed_by_precis_profile_are_cached():
+    attr = String("attr", precis="UsernameCaseMapped")
+    cache = String.get_precis_cache("UsernameCaseMapped")
+    cache.clear()
+    info = cache.info()
+    errors = []
+
+    for _ in range(2):
+        with pytest.raises(UnicodeEncodeError) as exc_info:
+            attr.enforce_precis("a b")
+        errors.append(exc_info.value)
+
+    assert cache.info() == CacheInfo(
+        hits=info.hits + 1, misses=info.misses + 1, maxsize=info.maxsize, currsize=1
+    )
+    assert errors[0] is not errors[1]
+    assert errors[0].args == errors[1].args
+
+
+def test_sorting_and_filtering_share_precis_cache(user_schema):
+    cache = String.get_precis_cache("UsernameCaseMapped")
+    cache.clear()
+    data = [{"userName": f"user{i}"} for i in range(20, 0, -1)]
+    initial_info = cache.info()
+
+    Sorter("userName")(data, user_schema)
+    sorted_info = cache.info()
+    Filter.deserialize("userName eq 'user1'").select(data, user_schema)
+    info = cache.info()
+
+    assert sorted_info.misses - initial_info.misses == 20
+    assert info.currsize == 20
+    assert info.hits - sorted_info.hits >= 20
+
+
+def test_deserialized_filter_is_shared():
+    filter_exp = "userName eq 'cached'"
+
+    assert Filter.deserialize(filter_exp) is Filter.deserialize(filter_exp)
+
+
+def test_cached_filter_validation_issues_can_be_modified_safely():
+    filter_exp = "userName eq"
+    issues = Filter.validate(filter_exp)
+
+    for _, errors in issues.errors:
+        for error in errors:
+            error.message = "modified"
+
+    assert Filter.validate(filter_exp).to_dict(message=True) == {
+        "_errors": [
+            {
+                "code": 103,
+                "message": "missing operand for operator 'eq' in expression 'userName eq'",
+            }
+        ]
+    }
+
+
+def test_patch_path_validation_issues_have_invalid_path_scim_error_when_filter_is_cached():
+    Filter.validate("emails[type eq 'work' and value co]")
+
+    issues = PatchPath.validate("emails[type eq 'work' and value co]")
+
+    for _, errors in issues.errors:
+        for error in errors:
+            assert error.scim_error == "invalidPath"
+    for _, errors in Filter.validate("emails[type eq 'work' and value co]").errors:
+        for error in errors:
+            assert error.scim_error == "invalidFilter"
+
+
+def test_deserialized_patch_path_is_shared():
+    path_exp = "emails[type eq 'cached'].value"
+
+    assert PatchPath.deserialize(path_exp) is PatchPath.deserialize(path_exp)
+
+
+def test_caches_are_cleared_when_registry_changes():
+    schema = SchemaUri("urn:cache:test:schema")
+    register_schema(schema, extension=False)
+    assert not AttrRepFactory.deserialize("urn:cache:test:schema:attr").extension
+
+    register_schema(schema, extension=True)
+
+    assert AttrRepFactory.deserialize("urn:cache:test:schema:attr").extension
+
+
+def test_scim_data_string_keys_are_parsed_once():
+    ScimData.normalize_cache.clear()
+    info = ScimData.normalize_cache.info()
+    data = ScimData()
+
+    data.set("name.cachedKey", "value")
+    data.get("name.cachedKey")
+    data.get("name.cachedKey")
+
+    assert ScimData.normalize_cache.info().misses - info.misses == 1
+    assert ScimData.normalize_cache.info().hits - info.hits == 2
+    assert data.to_dict() == {"name": {"cachedKey": "value"}}
+
+
+def test_scim_data_key_cache_is_cleared_when_new_extension_is_registered():
+    key = "urn:cache:test:extension:attr"
+    register_schema(SchemaUri("urn:cache:test:extension"), extension=False)
+    assert ScimData({key: 1}).to_dict() == {"attr": 1}
+
+    register_schema(SchemaUri("urn:cache:test:extension"), extension=True)
+
+    assert ScimData({key: 1}).to_dict() == {"urn:cache:test:extension": {"attr": 1}}
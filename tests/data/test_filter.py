@@ -3,9 +3,15 @@ from typing import Any
 
 import pytest
 
+from scimpler.data import operator as op
+from scimpler.data.attrs import Complex, String
 from scimpler.data.filter import Filter
 from scimpler.data.identifiers import AttrRep, AttrRepFactory, BoundedAttrRep
-from scimpler.data.operator import BinaryAttributeOperator, UnaryAttributeOperator
+from scimpler.data.operator import (
+    BinaryAttributeOperator,
+    Operator,
+    UnaryAttributeOperator,
+)
 
 
 @pytest.mark.parametrize(
@@ -2561,3 +2567,348 @@ def test_filter_with_logical_operator_can_be_applied(user_schema):
         {"userName": "Arek", "emails": [{"value": "a@bad.com"}, {"value": "a@example.com"}]},
         user_schema,
     )
+
+
+@pytest.mark.parametrize(
+    "filter_exp",
+    (
+        "userName eq 'Arek'",
+        "userName eq 'AREK'",
+        "userName co 'rE'",
+        "userName pr",
+        "nickName pr",
+        "not (userName sw 'a')",
+        "emails co 'example.com'",
+        "emails[type eq 'work' and value ew '.com']",
+        "emails.value ew 'bad.com'",
+        "name.givenName gt 'A' or title eq 'boss'",
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User:employeeNumber eq '42'",
+        "unknown eq 'value'",
+        "active eq true and userName pr",
+        "meta.lastModified gt '2011-05-13T04:42:34Z'",
+    ),
+)
+def test_compiled_filter_matches_the_same_data_as_filter(user_schema, filter_exp):
+    data = [
+        {"userName": "Arek", "emails": [{"value": "a@bad.com"}, {"value": "a@example.com"}]},
+        {"userName": "arek", "emails": [{"type": "work", "value": "a@example.com"}]},
+        {"userName": "bjensen", "name": {"givenName": "Barbara"}, "active": True},
+        {
+            "userName": "",
+            "title": "boss",
+            "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {"employeeNumber": "42"},
+            "meta": {"lastModified": "2012-05-13T04:42:34Z"},
+        },
+        {},
+    ]
+    filter_ = Filter.deserialize(filter_exp)
+
+    compiled = filter_.compile(user_schema)
+
+    assert [compiled(item) for item in data] == [filter_(item, user_schema) for item in data]
+
+
+def test_compiled_filter_reflects_filter_at_compilation_time(user_schema):
+    # created directly, since deserialized filters are shared and must not be modified
+    filter_ = Filter(
+        op.Or(
+            op.Equal(AttrRep(attr="userName"), "Arek"),
+            op.Equal(AttrRep(attr="userName"), "Pagerous"),
+        )
+    )
+    compiled = filter_.compile(user_schema)
+
+    filter_.operator.sub_operators.pop()
+
+    assert compiled({"userName": "Pagerous"}) is True
+    assert filter_({"userName": "Pagerous"}, user_schema) is False
+
+
+def test_compiled_filter_with_value_failing_deserialization_raises_like_filter():
+    attr = Complex("complex", sub_attributes=[String("number", deserializer=int)])
+    filter_ = Filter.deserialize("number gt 'not a number'")
+
+    compiled = filter_.compile(attr)
+
+    assert compiled({}) is filter_({}, attr) is False
+    with pytest.raises(ValueError):
+        filter_({"number": "42"}, attr)
+    with pytest.raises(ValueError):
+        compiled({"number": "42"})
+
+
+@pytest.mark.parametrize(
+    "filter_exp",
+    (
+        "userName eq 'Arek'",
+        "userName pr",
+        "not (userName sw 'a')",
+        "userName co 'e' and not (userName eq 'bjensen')",
+        "userName eq 'arek' or userName eq 'bjensen' or title eq 'boss'",
+        "(userName sw 'a' or nickName pr) and (emails co 'example' or active eq true)",
+        "not (userName pr or title pr)",
+        "emails[type eq 'work' and value ew '.com'] or emails.value ew 'bad.com'",
+        "name.givenName gt 'A' and unknown pr",
+        "unknown eq 'value' or not (active pr)",
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User:employeeNumber eq '42'",
+        "meta.lastModified gt '2011-05-13T04:42:34Z' and userName eq ''",
+        "unknown pr and userName pr",
+        "not (unknown pr) or userName pr",
+    ),
+)
+def test_selected_data_is_the_same_as_data_matched_by_filter(user_schema, filter_exp):
+    data = [
+        {"userName": "Arek", "emails": [{"value": "a@bad.com"}, {"value": "a@example.com"}]},
+        {"userName": "arek", "emails": [{"type": "work", "value": "a@example.com"}]},
+        {"userName": "bjensen", "name": {"givenName": "Barbara"}, "active": True},
+        {
+            "userName": "",
+            "title": "boss",
+            "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {"employeeNumber": "42"},
+            "meta": {"lastModified": "2012-05-13T04:42:34Z"},
+        },
+        {"userName": "Janek", "nickName": "J", "active": False},
+        {},
+    ]
+    filter_ = Filter.deserialize(filter_exp)
+
+    selected = filter_.select(data, user_schema)
+
+    assert selected == [i for i, item in enumerate(data) if filter_(item, user_schema)]
+
+
+def test_select_accepts_iterator_and_returns_nothing_for_no_data(user_schema):
+    filter_ = Filter.deserialize("userName pr")
+
+    assert filter_.select(iter([{"userName": "Arek"}, {}]), user_schema) == [0]
+    assert filter_.select([], user_schema) == []
+
+
+@pytest.mark.parametrize(
+    "filter_exp",
+    (
+        "userName co 'e' and (userName pr and (title eq 'boss' or active eq true))",
+        "(userName sw 'a' or nickName pr) and (emails co 'example' or active eq true)",
+        "not (not (userName eq 'Arek')) or userName eq 'arek' or userName eq 'arek'",
+        "emails[type eq 'work' and (value ew '.com' and type pr)] or emails.value ew 'bad.com'",
+        "emails[not (not (type eq 'work'))]",
+        "name.givenName gt 'A' and unknown pr and userName pr",
+        "unknown eq 'value' or not (active pr) or (unknown pr or nickName pr)",
+        "userName eq 1 or userName eq true or unknown[value eq 1]",
+        "id eq '1' and title pr and emails[value co 'a' or value co 'a']",
+    ),
+)
+def test_optimized_filter_matches_the_same_data_as_filter(user_schema, filter_exp):
+    data = [
+        {"userName": "Arek", "emails": [{"value": "a@bad.com"}, {"value": "a@example.com"}]},
+        {"userName": "arek", "emails": [{"type": "work", "value": "a@example.com"}]},
+        {"id": "1", "userName": "bjensen", "name": {"givenName": "Barbara"}, "active": True},
+        {"id": "2", "userName": "", "title": "boss"},
+        {"userName": "Janek", "nickName": "J", "active": False},
+        {},
+    ]
+    filter_ = Filter.deserialize(filter_exp)
+
+    for optimized in [filter_.optimize(), filter_.optimize(user_schema)]:
+        assert optimized.select(data, user_schema) == filter_.select(data, user_schema)
+
+
+@pytest.mark.parametrize(
+    ("filter_exp", "expected"),
+    (
+        (
+            "(userName co 'a' and (title pr and id eq '42')) and title pr",
+            "title pr and id eq '42' and userName co 'a'",
+        ),
+        (
+            "(userName co 'a' or (title pr or id eq '42')) or title pr",
+            "title pr or userName co 'a' or id eq '42'",
+        ),
+        ("not (not (userName eq 'a'))", "userName eq 'a'"),
+        ("userName eq 'a' and userName eq 'a'", "userName eq 'a'"),
+        ("userName eq 1 or userName eq true", "userName eq 1 or userName eq True"),
+        ("emails[value co 'a' and type eq 'work']", "emails[(type eq 'work' and value co 'a')]"),
+        ("title pr and unknown eq 'a'", "unknown eq 'a' and title pr"),
+        ("unknown[value eq 'a'] or title eq 'a'", "title eq 'a' or unknown[value eq 'a']"),
+        ("userName co 'a' and not (emails pr)", "not emails pr and userName co 'a'"),
+    ),
+)
+def test_filter_is_optimized(user_schema, filter_exp, expected):
+    filter_ = Filter.deserialize(filter_exp)
+
+    assert filter_.optimize(user_schema).serialize() == expected
+
+
+def test_operands_are_reordered_without_schema():
+    filter_ = Filter.deserialize("userName co 'a' and (emails pr and userName co 'a')")
+
+    assert filter_.optimize().serialize() == "emails pr and userName co 'a'"
+
+
+def test_custom_operators_are_kept_in_optimized_filter(user_schema):
+    class IsArek(Operator):
+        def match(self, value, schema_or_complex) -> bool:
+            return value.get("userName") == "Arek"
+
+    filter_ = Filter(op.And(IsArek(), IsArek(), op.Present(AttrRep(attr="userName"))))
+
+    optimized = filter_.optimize(user_schema)
+
+    assert len(optimized.operator.sub_operators) == 3
+    assert optimized.select([{"userName": "Arek"}, {"userName": "arek"}], user_schema) == [0]
+
+
+@pytest.mark.parametrize(
+    "filter_exp",
+    (
+        "not (userName co 'e' and (userName pr or not (title eq 'boss')))",
+        "not ((userName sw 'a' or nickName pr) and (emails co 'example' or active eq true))",
+        "not (not (userName eq 'Arek')) or userName eq 'arek' or userName eq 'arek'",
+        "not emails[type eq 'work' and not (value ew '.com')] or emails.value ew 'bad.com'",
+        "userName eq 'Arek' and userName eq 'arek2'",
+        "(title eq 'boss' and title eq 'Boss') or userName sw 'j'",
+        "(title eq 'boss' and title eq 'other') or (nickName eq 'J' and nickName eq 'K')",
+        "emails[type eq 'work' and type eq 'home'] or active eq false",
+        "not (emails[type eq 'work' and type eq 'home'] and userName pr)",
+        "id eq '1' and (userName pr and (id eq '2' and title pr))",
+        "emails eq 'a' and emails eq 'b'",
+    ),
+)
+def test_normalized_filter_matches_the_same_data_as_filter(user_schema, filter_exp):
+    data = [
+        {"userName": "Arek", "emails": [{"value": "a@bad.com"}, {"value": "a@example.com"}]},
+        {"userName": "arek", "emails": [{"type": "work", "value": "a@example.com"}]},
+        {"id": "1", "userName": "bjensen", "name": {"givenName": "Barbara"}, "active": True},
+        {"id": "2", "userName": "", "title": "boss"},
+        {"userName": "Janek", "nickName": "J", "active": False},
+        {},
+    ]
+    filter_ = Filter.deserialize(filter_exp)
+
+    for normalized in [filter_.normalize(), filter_.normalize(user_schema)]:
+        assert normalized.select(data, user_schema) == filter_.select(data, user_schema)
+
+
+@pytest.mark.parametrize(
+    ("left", "right"),
+    (
+        ("userName eq 'A' and active eq true", "(active eq true and userName eq 'A')"),
+        ("a pr and (b pr and c pr)", "(c pr and a pr) and b pr and a pr"),
+        ("not (a pr or b pr)", "not b pr and not a pr"),
+        ("not (not (a pr))", "a pr"),
+        ("emails[type pr or value pr]", "emails[value pr or not (not type pr)]"),
+        ("USERNAME eq 'a' or title pr", "title pr or userName eq 'a'"),
+    ),
+)
+def test_equivalent_filters_have_the_same_canonical_form(left, right):
+    left_normalized = Filter.deserialize(left).normalize()
+    right_normalized = Filter.deserialize(right).normalize()
+
+    assert left_normalized == right_normalized
+    assert hash(left_normalized) == hash(right_normalized)
+    assert left_normalized.serialize().lower() == right_normalized.serialize().lower()
+
+
+@pytest.mark.parametrize(
+    ("filter_exp", "expected"),
+    (
+        ("userName eq 'a' and userName eq 'b'", "userName eq 'a' and userName eq 'b'"),
+        ("(userName eq 'a' and userName eq 'b') or title pr", "title pr"),
+        (
+            "title eq 'a' and title eq 'A' and title pr",
+            "title eq 'A' and title eq 'a' and title pr",
+        ),
+        ("title eq 'a' and title eq 'b' and nickName pr", "title eq 'a' and title eq 'b'"),
+        ("emails eq 'a' and emails eq 'b'", "emails eq 'a' and emails eq 'b'"),
+        (
+            "(emails.type eq 'a' and emails.type eq 'b') or title pr",
+            "title pr or (emails.type eq 'a' and emails.type eq 'b')",
+        ),
+        ("(name.givenName eq 'a' and name.givenName eq 'b') or title pr", "title pr"),
+        (
+            "emails[type eq 'a' and type eq 'b'] and title pr",
+            "emails[(type eq 'a' and type eq 'b')]",
+        ),
+        ("not emails[type eq 'a' and type eq 'b'] and title pr", None),
+        ("userName eq 'a\u0007' and userName eq 'b'", None),
+        ("x eq 'a' and x eq 'b' and title pr", "title pr and x eq 'a' and x eq 'b'"),
+        (
+            "(title eq 'a' and title eq 'b') and (title eq 'c' and title pr)",
+            "title eq 'a' and title eq 'b'",
+        ),
+        (
+            "(title eq 'a' and title eq 'b') or (nickName eq 'a' and nickName eq 'b')",
+            "nickName eq 'a' and nickName eq 'b'",
+        ),
+    ),
+)
+def test_contradictions_are_folded_if_schema_is_provided(user_schema, filter_exp, expected):
+    filter_ = Filter.deserialize(filter_exp)
+
+    normalized = filter_.normalize(user_schema)
+
+    if expected is None:
+        assert normalized == filter_.normalize()
+    else:
+        assert normalized.serialize() == expected
+
+
+def test_filters_with_equal_values_of_different_types_are_equal():
+    left = Filter(op.Equal(AttrRep(attr="userName"), 1))
+    right = Filter(op.Equal(AttrRep(attr="userName"), True))
+
+    assert left == right
+    assert hash(left) == hash(right)
+    assert left.normalize() == right.normalize()
+
+
+def test_operands_with_equal_values_of_different_types_are_not_deduplicated():
+    filter_ = Filter(
+        op.Or(op.Equal(AttrRep(attr="userName"), 1), op.Equal(AttrRep(attr="userName"), True))
+    )
+
+    assert len(filter_.normalize().operator.sub_operators) == 2
+
+
+def test_filters_with_custom_operators_are_equal_only_if_operators_are_the_same(user_schema):
+    class IsArek(Operator):
+        def match(self, value, schema_or_complex) -> bool:
+            return value.get("userName") == "Arek"
+
+    operator = IsArek()
+
+    assert Filter(operator) == Filter(operator)
+    assert Filter(op.And(operator, operator)).normalize() == Filter(operator)
+    assert Filter(IsArek()) != Filter(operator)
+    assert Filter(op.And(IsArek(), operator)).normalize().select(
+        [{"userName": "Arek"}], user_schema
+    ) == [0]
+
+
+def test_long_chain_of_logical_operators_is_deserialized():
+    filter_exp = " or ".join(f'id eq "{i}"' for i in range(500))
+
+    issues = Filter.validate(filter_exp)
+    assert issues.to_dict(message=True) == {}
+
+    filter_ = Filter.deserialize(filter_exp)
+    assert filter_.to_dict() == {
+        "op": "or",
+        "sub_ops": [{"op": "eq", "attr": "id", "value": str(i)} for i in range(500)],
+    }
+
+
+@pytest.mark.parametrize(
+    "filter_exp",
+    (
+        "(((userName pr)))",
+        'not ((userName pr or (emails[type eq "work"])))',
+        'userName pr and (((id eq "1") or display co "x"))',
+    ),
+)
+def test_deeply_nested_group_operators_are_deserialized(filter_exp):
+    issues = Filter.validate(filter_exp)
+    assert issues.to_dict(message=True) == {}
+
+    filter_ = Filter.deserialize(filter_exp)
+    assert Filter.deserialize(filter_.serialize()) == filter_
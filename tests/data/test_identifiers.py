@@ -1,6 +1,10 @@
+import copy
+import pickle
+
 import pytest
 
-from scimpler.data.identifiers import AttrRep, BoundedAttrRep
+from scimpler._registry import register_schema
+from scimpler.data.identifiers import AttrName, AttrRep, BoundedAttrRep, SchemaUri
 
 
 def test_bounded_attr_creation_fails_if_bad_attr_name():
@@ -89,3 +93,48 @@ def test_attr_rep_can_be_compared(attr_1, attr_2, expected):
 def test_accessing_sub_attr_if_attr_rep_is_not_sub_attr_fails():
     with pytest.raises(AttributeError, match=r"AttrRep\(attr\) has no sub-attribute"):
         AttrRep(attr="attr").sub_attr  # noqa
+
+
+@pytest.mark.parametrize(
+    "create",
+    (
+        lambda: AttrName("userName"),
+        lambda: SchemaUri("urn:ietf:params:scim:schemas:core:2.0:User"),
+        lambda: BoundedAttrRep(
+            schema="urn:ietf:params:scim:schemas:core:2.0:User", attr="name", sub_attr="givenName"
+        ),
+    ),
+)
+def test_identifiers_are_interned(create):
+    identifier = create()
+
+    assert create() is identifier
+    assert copy.deepcopy(identifier) is identifier
+    assert pickle.loads(pickle.dumps(identifier)) is identifier
+
+
+def test_identifiers_that_differ_in_case_are_not_interned_together():
+    assert AttrName("userName") is not AttrName("USERNAME")
+    assert AttrName(SchemaUri("userName")) == AttrName("userName")
+    assert AttrName("userName") == AttrName("USERNAME")
+    assert str(AttrName("USERNAME")) == "USERNAME"
+
+
+def test_interned_bounded_attr_rep_is_recreated_when_schema_is_registered():
+    schema = SchemaUri("urn:intern:test:schema")
+    register_schema(schema, extension=False)
+    attr_rep = BoundedAttrRep(schema=schema, attr="attr")
+    assert not attr_rep.extension
+
+    register_schema(schema, extension=True)
+
+    assert BoundedAttrRep(schema=schema, attr="attr").extension
+
+
+def test_bad_attr_name_is_not_interned():
+    size = AttrName.intern_cache.info().currsize
+
+    with pytest.raises(ValueError, match="is not valid attr name"):
+        AttrName("bad^name")
+
+    assert AttrName.intern_cache.info().currsize == size
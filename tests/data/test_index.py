@@ -0,0 +1,201 @@
+import pytest
+
+from scimpler.data.filter import Filter
+from scimpler.data.identifiers import AttrRep, BoundedAttrRep
+from scimpler.data.index import ResourceIndex
+from scimpler.data.operator import Equal
+
+USERS = [
+    {
+        "id": "1",
+        "userName": "Arek",
+        "meta": {"lastModified": "2012-05-13T04:42:34Z"},
+        "nickName": "",
+        "title": "boss",
+        "active": True,
+        "name": {"givenName": "Arkadiusz", "familyName": "K"},
+        "emails": [
+            {"type": "work", "value": "arek@example.com", "primary": True},
+            {"type": "home", "value": "a@bad.com"},
+        ],
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {"employeeNumber": "42"},
+    },
+    {
+        "id": "2",
+        "userName": "bjensen",
+        "nickName": "Babs",
+        "active": False,
+        "name": {"givenName": "Barbara"},
+        "emails": [{"type": "home", "value": "babs@example.com"}],
+    },
+    {
+        "id": "3",
+        "userName": "Zoe",
+        "title": "Boss",
+        "emails": [{"type": "work", "value": "zoe@BAD.com"}],
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {"employeeNumber": "7"},
+    },
+    {"id": "4", "userName": "arek2", "emails": [{"value": "x@example.com"}]},
+    {"id": "5"},
+]
+
+
+@pytest.fixture
+def index(user_schema):
+    attrs = user_schema.attrs
+    return ResourceIndex(
+        schema=user_schema,
+        attr_reps=[
+            attrs.id,
+            attrs.userName,
+            attrs.nickName,
+            attrs.active,
+            attrs.name,
+            attrs.name__givenName,
+            attrs.meta__lastModified,
+            attrs.emails,
+            attrs.emails__type,
+            attrs.emails__value,
+            attrs.employeeNumber,
+        ],
+        resources=USERS,
+    )
+
+
+@pytest.mark.parametrize(
+    "filter_exp",
+    (
+        "id eq '3'",
+        "userName eq 'AREK'",
+        "userName ne 'arek'",
+        "userName gt 'b'",
+        "userName ge 'bjensen'",
+        "userName lt 'b'",
+        "userName le 'bjensen'",
+        "userName sw 'ar'",
+        "userName sw ''",
+        "userName sw 1.5",
+        "userName co 'e'",
+        "userName gt 1",
+        "userName eq 'a\u0007'",
+        "userName pr",
+        "nickName pr",
+        "not (nickName pr)",
+        "active eq true",
+        "active eq 1",
+        "active pr",
+        "id gt 2",
+        "name.givenName sw 'B'",
+        "name[givenName eq 'barbara']",
+        "name[givenName pr and not (familyName pr)]",
+        "emails eq 'babs@example.com'",
+        "emails co 'bad'",
+        "emails.type eq 'work'",
+        "emails[type eq 'work' and value ew 'bad.com']",
+        "emails[type eq 'home' or value sw 'x']",
+        "emails[not (type eq 'work')]",
+        "emails[type pr]",
+        "emails[unknown eq 'x']",
+        "emails.type pr",
+        "not (emails.type eq 'work')",
+        "userName sw 'a' and (emails.type eq 'work' or nickName pr)",
+        "userName sw 'a' and title eq 'boss'",
+        "title eq 'boss' or userName eq 'zoe'",
+        "not (title pr)",
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User:employeeNumber ge '42'",
+        "employeeNumber eq '42'",
+        "unknown eq 'x' or userName eq 'zoe'",
+        "userName[value eq 'x']",
+        "emails[type eq 'work'] and not (emails[type eq 'home'])",
+        "name pr",
+        "meta.lastModified gt '2011-05-13T04:42:34Z'",
+    ),
+)
+def test_index_selects_the_same_resources_as_filter(index, user_schema, filter_exp):
+    filter_ = Filter.deserialize(filter_exp)
+
+    assert index.select(filter_) == filter_.select(USERS, user_schema)
+
+
+def test_resources_added_after_creation_are_indexed(user_schema):
+    index = ResourceIndex(schema=user_schema, attr_reps=[user_schema.attrs.userName])
+
+    positions = [index.add(user) for user in USERS]
+
+    assert positions == [0, 1, 2, 3, 4]
+    assert len(index) == 5
+    assert index.select(Filter.deserialize("userName sw 'AR'")) == [0, 3]
+
+
+def test_index_on_multi_valued_attributes(fake_schema):
+    resources = [
+        {"str_mv": ["b", "a"], "c2_mv": [{"int": 1}, {"int": 5}]},
+        {"str_mv": ["c"], "c2_mv": [{"int": 3.5}, {"int": float("nan")}]},
+        {"str_mv": [{"x": 1}], "c2_mv": [{"int": "3"}]},
+        {},
+    ]
+    attrs = fake_schema.attrs
+    index = ResourceIndex(
+        schema=fake_schema,
+        attr_reps=[attrs.str_mv, attrs.c2_mv__int],
+        resources=resources,
+    )
+
+    for filter_exp in [
+        "str_mv eq 'A'",
+        "str_mv ge 'b'",
+        "str_mv pr",
+        "c2_mv.int gt 2",
+        "c2_mv.int le 3.5",
+        "c2_mv[int lt 2]",
+        "c2_mv.int eq 3",
+    ]:
+        filter_ = Filter.deserialize(filter_exp)
+        assert index.select(filter_) == filter_.select(resources, fake_schema), filter_exp
+
+
+@pytest.mark.parametrize(
+    "filter_exp",
+    (
+        "emails[value le 'b']",
+        "emails.value le 'b'",
+        "emails[value eq 'arek']",
+        "emails.value eq 'arek'",
+        "not (emails.value eq 'arek')",
+        "emails[value sw 'a' and not (value eq 'arek')]",
+        "emails pr",
+    ),
+)
+def test_index_selects_the_same_resources_as_filter_if_item_fails_precis(user_schema, filter_exp):
+    resources = [
+        {"emails": [{"value": "Arek"}, {"value": ""}]},
+        {"emails": [{"value": "Arek"}]},
+        {"emails": [{"value": ""}]},
+        {"emails": [{"value": "\u0007"}, {"value": "ala"}]},
+    ]
+    index = ResourceIndex(
+        schema=user_schema, attr_reps=[user_schema.attrs.emails__value], resources=resources
+    )
+    filter_ = Filter.deserialize(filter_exp)
+
+    assert index.select(filter_) == filter_.select(resources, user_schema)
+
+
+def test_filter_with_nan_value_matches_nothing(user_schema):
+    index = ResourceIndex(
+        schema=user_schema, attr_reps=[user_schema.attrs.userName], resources=USERS
+    )
+
+    assert index.select(Filter(Equal(AttrRep(attr="userName"), float("nan")))) == []
+
+
+def test_value_error_is_raised_if_indexed_attribute_does_not_belong_to_schema(user_schema):
+    with pytest.raises(ValueError, match="does not belong to the schema"):
+        ResourceIndex(
+            schema=user_schema,
+            attr_reps=[BoundedAttrRep(schema=user_schema.schema, attr="unknown")],
+        )
+
+
+def test_index_schema_is_exposed(index, user_schema):
+    assert index.schema is user_schema
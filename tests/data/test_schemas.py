@@ -1,9 +1,13 @@
+import asyncio
+import pickle
 from copy import deepcopy
 from typing import Generator
 
 import pytest
 
 from scimpler._registry import register_resource_schema, resources, schemas
+from scimpler.config import ServiceProviderConfig
+from scimpler.data import schemas as schemas_module
 from scimpler.data.attr_value_presence import AttrValuePresenceConfig
 from scimpler.data.attrs import AttrFilter, Boolean, Complex, Integer, String
 from scimpler.data.identifiers import AttrRep, BoundedAttrRep
@@ -14,6 +18,7 @@ from scimpler.data.schemas import (
     validate_resource_type_consistency,
 )
 from scimpler.data.scim_data import ScimData
+from scimpler.schemas import EnterpriseUserSchemaExtension, UserSchema
 from scimpler.warning import ScimpleUserWarning
 
 
@@ -87,6 +92,22 @@ def test_validation_fails_if_bad_types(user_data_client, user_schema):
     assert issues.to_dict() == expected_issues
 
 
+def test_validation_does_not_modify_data_with_bad_values(user_data_client, user_schema):
+    user_data_client["userName"] = 123  # noqa
+    user_data_client["name"]["givenName"] = 123  # noqa
+    user_data_client["schemas"].append("bad^schema")
+    data = ScimData(user_data_client)
+    expected = deepcopy(user_data_client)
+
+    issues = user_schema.validate(data, AttrValuePresenceConfig("REQUEST"))
+
+    assert data.to_dict() == expected
+    assert issues.is_invalid(["userName"])
+    assert issues.is_invalid(["name", "givenName"])
+    assert issues.is_invalid(["schemas", 2])
+    assert not issues.is_invalid(["name", "familyName"])
+
+
 def test_validate_schemas_field__unknown_additional_field_is_validated(
     user_data_client, user_schema
 ):
@@ -764,3 +785,211 @@ def test_registering_different_extensions_but_with_the_same_name_fails():
 
     with pytest.raises(RuntimeError, match="extension 'MyExtension' already in resource"):
         schema.extend(extension_2)
+
+
+def test_version_is_not_included_if_etag_is_not_supported(user_schema):
+    data = {"id": "1", "userName": "bjensen"}
+
+    user_schema.include_version(data, ServiceProviderConfig.create())
+
+    assert data == {"id": "1", "userName": "bjensen"}
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        {"id": "1", "userName": "bjensen"},
+        {"id": "1", "userName": "bjensen", "meta": {"version": 'W/"1"'}},
+        ScimData({"id": "1", "userName": "bjensen", "meta": {"version": 'W/"2"'}}),
+    ),
+)
+def test_version_is_included_if_etag_is_supported(user_schema, data):
+    config = ServiceProviderConfig.create(etag={"supported": True})
+    expected = f'W/"{ScimData({"id": "1", "userName": "bjensen", "meta": {}}).fingerprint()}"'
+
+    user_schema.include_version(data, config)
+
+    assert data["meta"]["version"] == expected
+
+
+def test_version_is_included_in_meta_with_name_in_any_case(user_schema):
+    config = ServiceProviderConfig.create(etag={"supported": True})
+    data = {"id": "1", "userName": "bjensen", "META": {"Version": 'W/"1"'}}
+    expected = f'W/"{ScimData({"id": "1", "userName": "bjensen", "meta": {}}).fingerprint()}"'
+
+    user_schema.include_version(data, config)
+
+    assert data == {"id": "1", "userName": "bjensen", "META": {"version": expected}}
+
+
+def test_resource_type_is_included_in_meta_with_name_in_any_case(user_schema):
+    data = {"id": "1", "Meta": {"version": 'W/"1"'}}
+
+    user_schema.include_schema_data(data)
+
+    assert data["Meta"] == {"version": 'W/"1"', "resourceType": "User"}
+    assert "meta" not in data
+
+
+def test_version_changes_if_resource_changes(user_schema):
+    config = ServiceProviderConfig.create(etag={"supported": True})
+    data = ScimData({"id": "1", "userName": "bjensen"})
+    user_schema.include_version(data, config)
+    version = data["meta"]["version"]
+
+    data.set("nickName", "Babs")
+    user_schema.include_version(data, config)
+
+    assert data["meta"]["version"] != version
+
+
+def test_validation_plan_is_shared_by_equivalent_presence_configs(user_schema):
+    plan = user_schema.compile_validator(
+        AttrValuePresenceConfig("RESPONSE", attr_reps=["userName", "name.formatted"], include=True)
+    )
+
+    assert plan.schema is user_schema
+    assert plan is user_schema.compile_validator(
+        AttrValuePresenceConfig("RESPONSE", attr_reps=["NAME.formatted", "username"], include=True)
+    )
+    assert plan is not user_schema.compile_validator(
+        AttrValuePresenceConfig("RESPONSE", attr_reps=["userName", "name.formatted"], include=False)
+    )
+    assert plan is not user_schema.compile_validator(
+        AttrValuePresenceConfig("REQUEST", attr_reps=["userName", "name.formatted"], include=True)
+    )
+    assert plan is not user_schema.compile_validator(
+        AttrValuePresenceConfig(
+            "RESPONSE",
+            attr_reps=[
+                "urn:ietf:params:scim:schemas:core:2.0:User:userName",
+                "urn:ietf:params:scim:schemas:core:2.0:User:name.formatted",
+            ],
+            include=True,
+        )
+    )
+    assert plan is not user_schema.compile_validator(
+        AttrValuePresenceConfig(
+            "RESPONSE",
+            attr_reps=["userName", "name.formatted"],
+            include=True,
+            ignore_issuer=["id"],
+        )
+    )
+
+
+def test_validation_plan_is_recompiled_after_schema_is_extended():
+    schema = UserSchema()
+    data = {
+        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+        "userName": "bjensen",
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {"employeeNumber": 42},
+    }
+    assert schema.validate(data, AttrValuePresenceConfig("REQUEST")).to_dict() == {}
+
+    schema.extend(EnterpriseUserSchemaExtension())
+
+    assert schema.validate(data, AttrValuePresenceConfig("REQUEST")).to_dict() == {
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {
+            "employeeNumber": {"_errors": [{"code": 2}]}
+        },
+        "schemas": {"_errors": [{"code": 13}]},
+    }
+
+
+def test_validation_plan_does_not_mask_whole_data_when_attribute_is_invalid(
+    user_schema, monkeypatch
+):
+    mask_invalid = schemas_module.mask_invalid
+    masked = []
+
+    def mask_invalid_spy(value, issues):
+        masked.append(value)
+        return mask_invalid(value, issues)
+
+    monkeypatch.setattr(schemas_module, "mask_invalid", mask_invalid_spy)
+    data = ScimData(
+        {
+            "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+            "id": "2819c223-7f76-453a-919d-413861904646",
+            "userName": 123,
+            "nickName": "Babs",
+            "meta": {"resourceType": "User"},
+        }
+    )
+
+    plan = user_schema.compile_validator(AttrValuePresenceConfig("RESPONSE"))
+    issues = plan.validate(data)
+
+    assert issues.to_dict() == {"userName": {"_errors": [{"code": 2}]}}
+    assert not any(isinstance(value, ScimData) and "userName" in value for value in masked)
+
+
+def test_presence_of_sub_attributes_is_not_validated_for_invalid_multivalued_items(user_schema):
+    data = {
+        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+        "userName": "bjensen",
+        "emails": [{"value": "bjensen@example.com"}, 42],
+    }
+
+    issues = user_schema.validate(data, AttrValuePresenceConfig("REQUEST"))
+
+    assert issues.to_dict() == {"emails": {"1": {"_errors": [{"code": 2}]}}}
+
+
+def test_validation_stops_once_max_errors_are_found(user_schema):
+    data = {
+        "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+        "userName": 123,
+        "nickName": 123,
+        "emails": [42, 43, 44],
+    }
+
+    assert user_schema.validate(data, max_errors=1).to_dict() == {
+        "userName": {"_errors": [{"code": 2}]}
+    }
+    assert user_schema.validate(data, max_errors=3).to_dict() == {
+        "userName": {"_errors": [{"code": 2}]},
+        "nickName": {"_errors": [{"code": 2}]},
+        "emails": {"0": {"_errors": [{"code": 2}]}},
+    }
+    assert user_schema.validate(data).error_count == 5
+
+
+@pytest.mark.parametrize("max_errors", (0, -1))
+def test_value_error_is_raised_if_max_errors_is_lower_than_one(user_schema, max_errors):
+    data = {"userName": 123}
+    match = "'max_errors' must be greater or equal to 1"
+
+    with pytest.raises(ValueError, match=match):
+        user_schema.validate(data, max_errors=max_errors)
+    with pytest.raises(ValueError, match=match):
+        asyncio.run(user_schema.avalidate(data, max_errors=max_errors))
+
+
+def test_schema_validates_the_same_after_pickling(user_data_client, user_schema):
+    user_data_client["userName"] = 123
+    user_data_client["emails"][0]["type"] = 456
+
+    unpickled = pickle.loads(pickle.dumps(user_schema))
+
+    assert (
+        unpickled.validate(user_data_client, AttrValuePresenceConfig("REQUEST")).to_dict()
+        == user_schema.validate(user_data_client, AttrValuePresenceConfig("REQUEST")).to_dict()
+    )
+
+
+def test_async_validation_is_same_as_sync(user_data_client, user_schema):
+    user_data_client["userName"] = 123
+    user_data_client["emails"][0]["type"] = 456
+
+    issues = asyncio.run(
+        user_schema.avalidate(user_data_client, AttrValuePresenceConfig("REQUEST"), max_errors=1)
+    )
+
+    assert (
+        issues.to_dict()
+        == user_schema.validate(
+            user_data_client, AttrValuePresenceConfig("REQUEST"), max_errors=1
+        ).to_dict()
+    )
@@ -1,7 +1,21 @@
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
 import pytest
 
+from scimpler.data import scim_data
 from scimpler.data.identifiers import AttrRep, BoundedAttrRep, SchemaUri
-from scimpler.data.scim_data import Invalid, InvalidType, Missing, MissingType, ScimData
+from scimpler.data.scim_data import (
+    Invalid,
+    InvalidType,
+    Missing,
+    MissingType,
+    ScimData,
+    mask_invalid,
+)
+from scimpler.error import ValidationIssues
 
 
 @pytest.mark.parametrize(
@@ -480,3 +494,305 @@ def test_passing_unknown_schema_uri_as_key_fails():
 
     with pytest.raises(KeyError, match="schema '.*' is not recognized or is not an extension"):
         data.set(SchemaUri("unknown:schema"), {"userName": "Pagerous"})
+
+
+def test_view_is_equal_to_eagerly_created_data(user_data_server):
+    user_data_server["urn:ietf:params:scim:schemas:core:2.0:User:nickName"] = "Babs"
+    user_data_server["name.middleName"] = "Jane"
+    user_data_server[AttrRep(attr="title")] = "Tour Guide"
+    user_data_server[42] = "ignored"
+
+    view = ScimData.view(user_data_server)
+
+    assert view == ScimData(user_data_server)
+    assert view.to_dict() == ScimData(user_data_server).to_dict()
+
+
+def test_view_is_built_on_first_access_and_nested_data_is_not_walked():
+    nested = {"givenName": "Barbara"}
+    data = {"userName": "bjensen", "name": nested, "emails": [{"value": "a@b.com"}]}
+    view = ScimData.view(data)
+
+    data["nickName"] = "Babs"
+    assert view.get("nickName") == "Babs"
+
+    nested["familyName"] = "Jensen"
+    assert view.get("name.familyName") == "Jensen"
+
+    data["title"] = "Tour Guide"
+    assert view.get("title") is Missing
+
+
+def test_original_data_is_not_modified_through_view():
+    data = {"userName": "bjensen", "name": {"givenName": "Barbara"}, "emails": [{"value": "x"}]}
+    view = ScimData.view(data)
+
+    view.set("name.familyName", "Jensen")
+    view.get("emails")[0].set("type", "work")
+    view.pop("userName")
+
+    assert data == {
+        "userName": "bjensen",
+        "name": {"givenName": "Barbara"},
+        "emails": [{"value": "x"}],
+    }
+    assert view.to_dict() == {
+        "name": {"givenName": "Barbara", "familyName": "Jensen"},
+        "emails": [{"value": "x", "type": "work"}],
+    }
+
+
+def test_data_created_from_view_shares_entries_with_view():
+    view = ScimData.view({"userName": "bjensen"})
+    data = ScimData(view)
+
+    data.set("nickName", "Babs")
+
+    assert view.get("nickName") == "Babs"
+    assert ScimData.view(view).get("nickName") == "Babs"
+
+
+def test_view_of_nothing_is_empty():
+    assert ScimData.view().to_dict() == {}
+
+
+def test_accessing_unknown_attribute_of_view_fails():
+    with pytest.raises(AttributeError, match="'ScimData' object has no attribute 'unknown'"):
+        print(ScimData.view({"userName": "bjensen"}).unknown)
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        {},
+        {"userName": "bjensen", "nickName": None, "active": True, "weight": 1.5, "age": 42},
+        {"name": {}, "emails": [], "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"]},
+        {
+            "name": {"givenName": "Barbara", "honorificPrefix": 'Ms.\n"Babs"'},
+            "emails": [{"value": "bjensen@example.com", "primary": True}, {}],
+            "x509Certificates": [["nested", {"a": 1}]],
+            "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {
+                "manager": {"value": "26118915-6090-4610-87e4-49d8ca9f808d"}
+            },
+            "zażółć": "gęślą jaźń",
+        },
+    ),
+)
+def test_data_is_encoded_to_json_the_same_way_as_dictionary(data):
+    scim_data = ScimData(data)
+
+    assert "".join(scim_data.iter_json()) == json.dumps(scim_data.to_dict())
+
+
+def test_data_is_written_as_json_using_provided_default():
+    output = io.StringIO()
+    data = ScimData({"meta": {"created": datetime(2024, 1, 2, 3, 4, 5)}})
+
+    data.write_json(output, default=datetime.isoformat)
+
+    assert output.getvalue() == '{"meta": {"created": "2024-01-02T03:04:05"}}'
+
+
+def test_encoding_data_with_not_serializable_value_fails():
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        "".join(ScimData({"created": datetime(2024, 1, 2)}).iter_json())
+
+
+@pytest.mark.parametrize(
+    ("data", "other"),
+    (
+        ({}, {}),
+        (
+            {"userName": "bjensen", "name": {"givenName": "Barbara", "familyName": "Jensen"}},
+            {"NAME": {"familyname": "Jensen", "GivenName": "Barbara"}, "username": "bjensen"},
+        ),
+        (
+            {"active": True, "weight": 1, "height": 1.5, "age": 42},
+            {"active": 1.0, "weight": Decimal("1"), "height": Decimal("1.5"), "age": 42.0},
+        ),
+        (
+            {"created": datetime(2024, 1, 2, 3, tzinfo=timezone.utc)},
+            {"created": datetime(2024, 1, 2, 5, tzinfo=timezone(timedelta(hours=2)))},
+        ),
+        (
+            {
+                "emails": [{"value": "a@example.com", "primary": True}, {"value": "b"}],
+                "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {
+                    "employeeNumber": "42"
+                },
+            },
+            {
+                "URN:IETF:PARAMS:SCIM:SCHEMAS:EXTENSION:ENTERPRISE:2.0:USER": {
+                    "employeeNumber": "42"
+                },
+                "emails": [{"primary": True, "value": "a@example.com"}, {"value": "b"}],
+            },
+        ),
+    ),
+)
+def test_equal_data_have_the_same_fingerprint(data, other):
+    data, other = ScimData(data), ScimData(other)
+
+    assert data == other
+    assert data.fingerprint() == other.fingerprint()
+
+
+@pytest.mark.parametrize(
+    ("data", "other"),
+    (
+        ({"userName": "bjensen"}, {"userName": "BJensen"}),
+        ({"userName": "bjensen"}, {"nickName": "bjensen"}),
+        ({"weight": 1}, {"weight": 1.5}),
+        ({"weight": 1}, {"weight": "1"}),
+        ({"nickName": None}, {"nickName": "null"}),
+        (
+            {"emails": [{"value": "a"}, {"value": "b"}]},
+            {"emails": [{"value": "b"}, {"value": "a"}]},
+        ),
+        ({"name": {"givenName": "Barbara"}}, {"name": {"givenName": "Barbara"}, "x": {}}),
+        ({"x": [1, [2]]}, {"x": [[1], 2]}),
+        ({"weight": float("inf")}, {"weight": float("-inf")}),
+        ({"created": datetime(2024, 1, 2)}, {"created": datetime(2024, 1, 2, tzinfo=timezone.utc)}),
+    ),
+)
+def test_different_data_have_different_fingerprints(data, other):
+    data, other = ScimData(data), ScimData(other)
+
+    assert data != other
+    assert data.fingerprint() != other.fingerprint()
+
+
+def test_fingerprint_changes_when_nested_data_is_modified():
+    data = ScimData({"userName": "bjensen", "name": {"givenName": "Barbara"}})
+    fingerprint = data.fingerprint()
+    name = data["name"]
+
+    name.set("givenName", "Babs")
+
+    assert data.fingerprint() != fingerprint
+    name.set("givenName", "Barbara")
+    assert data.fingerprint() == fingerprint
+    name.pop("givenName")
+    assert data.fingerprint() != fingerprint
+
+
+def test_fingerprint_changes_when_nested_data_is_modified_and_fingerprinted_first():
+    data = ScimData({"userName": "bjensen", "name": {"givenName": "Barbara"}})
+    fingerprint = data.fingerprint()
+    name = data["name"]
+
+    name.set("givenName", "Babs")
+    name.fingerprint()
+
+    assert data.fingerprint() != fingerprint
+
+
+def test_fingerprint_is_not_computed_again_if_other_data_is_modified(monkeypatch):
+    data = ScimData({"userName": "bjensen", "name": {"givenName": "Barbara"}})
+    fingerprint = data.fingerprint()
+    other = ScimData({"userName": "Babs"})
+
+    other.set("nickName", "Babs")
+    other.pop("userName")
+    monkeypatch.setattr(scim_data, "_fingerprint_of", lambda *args: pytest.fail("computed"))
+
+    assert data.fingerprint() == fingerprint
+
+
+def test_fingerprint_changes_when_data_sharing_entries_is_modified():
+    data = ScimData({"userName": "bjensen"})
+    fingerprint = data.fingerprint()
+
+    ScimData(data).set("nickName", "Babs")
+
+    assert data.fingerprint() != fingerprint
+    assert data.fingerprint() == ScimData({"userName": "bjensen", "nickName": "Babs"}).fingerprint()
+
+
+def test_fingerprint_of_view_is_the_same_as_fingerprint_of_data():
+    data = {"userName": "bjensen", "emails": [{"value": "a"}], "name": {"givenName": "Barbara"}}
+
+    assert ScimData.view(data).fingerprint() == ScimData(data).fingerprint()
+
+
+def test_fingerprint_changes_when_list_is_modified_in_place():
+    data = ScimData({"emails": [{"value": "a"}], "nickName": "Babs"})
+    fingerprint = data.fingerprint()
+
+    data.get("emails").append(ScimData({"value": "b"}))
+    assert data.fingerprint() != fingerprint
+
+    data.get("emails")[1] = ScimData({"value": "c"})
+    assert (
+        data.fingerprint()
+        == ScimData({"emails": [{"value": "a"}, {"value": "c"}], "nickName": "Babs"}).fingerprint()
+    )
+
+
+def test_fingerprinted_data_are_equal_after_list_is_modified_in_place():
+    data = ScimData({"userName": "x", "emails": [{"value": "a"}]})
+    other = ScimData({"userName": "x", "emails": [{"value": "a"}, {"value": "b"}]})
+    data.fingerprint(), other.fingerprint()
+
+    data.get("emails").append(ScimData({"value": "b"}))
+
+    assert data.to_dict() == other.to_dict()
+    assert data == other
+
+
+def test_invalid_values_are_masked_without_modifying_data():
+    issues = ValidationIssues()
+    issues.mark_invalid(["emails", 1, "value"])
+    issues.mark_invalid(["NAME"])
+    issues.mark_invalid(["emails", 5])
+    issues.mark_invalid(["userName", "unknown"])
+    issues.mark_invalid(["unknown"])
+    issues.mark_invalid([0])
+    data = ScimData(
+        {
+            "userName": "bjensen",
+            "name": {"givenName": "Barbara"},
+            "emails": [{"value": "a@example.com"}, {"value": 42}],
+        }
+    )
+    expected = {
+        "userName": "bjensen",
+        "name": Invalid,
+        "emails": [{"value": "a@example.com"}, {"value": Invalid}],
+    }
+
+    masked = mask_invalid(data, issues)
+
+    assert masked.to_dict() == expected
+    assert masked["emails"][0] is data["emails"][0]
+    assert data.to_dict() == {
+        "userName": "bjensen",
+        "name": {"givenName": "Barbara"},
+        "emails": [{"value": "a@example.com"}, {"value": 42}],
+    }
+
+
+def test_data_is_not_copied_if_there_are_no_invalid_values():
+    data = ScimData({"userName": "bjensen"})
+
+    assert mask_invalid(data, ValidationIssues()) is data
+
+
+@pytest.mark.parametrize(
+    "key",
+    (
+        "name.givenName",
+        AttrRep(attr="NAME", sub_attr="givenname"),
+        BoundedAttrRep(
+            schema="urn:ietf:params:scim:schemas:core:2.0:User", attr="name", sub_attr="givenName"
+        ),
+    ),
+)
+def test_parsed_key_can_be_used_to_access_data(key):
+    data = ScimData({"name": {"givenName": "Barbara"}})
+    parsed_key = ScimData.parse_key(key)
+
+    assert data.get(parsed_key) == "Barbara"
+    data.set(parsed_key, "Babs")
+    assert data.pop(parsed_key) == "Babs"
+    assert data.to_dict() == {"name": {}}
@@ -3,7 +3,7 @@ import pytest
 from scimpler.data.attrs import ScimReference, String
 from scimpler.data.identifiers import AttrRep
 from scimpler.data.scim_data import ScimData
-from scimpler.data.sorter import AlwaysLastKey, Sorter, StringKey
+from scimpler.data.sorter import AlwaysLastKey, CompositeSorter, Sorter, StringKey
 
 
 def test_items_are_sorted_according_to_attr_value(user_schema):
@@ -230,6 +230,54 @@ def test_fails_if_different_value_types(fake_schema, user_schema):
         sorter(values, schemas)
 
 
+def test_items_with_reference_values_are_sorted(user_schema):
+    sorter = Sorter(AttrRep(attr="profileUrl"), asc=True)
+    data = [
+        {"profileUrl": "https://example.com/Users/2"},
+        {},
+        {"profileUrl": "https://example.com/Users/1"},
+    ]
+    expected = [data[2], data[0], data[1]]
+
+    actual = sorter(data, user_schema)
+
+    assert actual == expected
+
+
+def test_duplicated_items_with_different_schemas_are_sorted_according_to_own_schema(
+    user_schema, group_schema
+):
+    sorter = Sorter(AttrRep(attr="displayName"), asc=True)
+    user = ScimData({"displayName": "B"})
+    group = ScimData({"displayName": "A"})
+    data = [user, group, user, group]
+    schemas = [user_schema, group_schema, user_schema, group_schema]
+    expected = [group, group, user, user]
+
+    actual = sorter(data, schemas)
+
+    assert actual == expected
+
+
+def test_many_items_with_many_schemas_are_sorted_stably(user_schema, group_schema):
+    sorter = Sorter(AttrRep(attr="displayName"), asc=False)
+    data = [
+        {"displayName": f"name_{i % 10}", "id": str(i)} if i % 7 else {"id": str(i)}
+        for i in range(1000)
+    ]
+    schemas = [user_schema if i % 2 else group_schema for i in range(1000)]
+    expected = sorted(
+        (item for item in data if "displayName" in item),
+        key=lambda item: item["displayName"],
+        reverse=True,
+    )
+    expected = [item for item in data if "displayName" not in item] + expected
+
+    actual = sorter(data, schemas)
+
+    assert actual == expected
+
+
 def test_comparing_string_key_to_always_last_key_returns_true():
     key = StringKey("test", String(name="attr"))
     always_last = AlwaysLastKey()
@@ -277,3 +325,163 @@ def test_data_item_is_ordered_last_if_ascending_if_attr_does_not_exist(fake_sche
     actual = sorter(data, [fake_schema, user_schema])
 
     assert actual == expected
+
+
+@pytest.mark.parametrize("asc", (True, False))
+@pytest.mark.parametrize(
+    ("start_index", "count"),
+    ((1, 5), (3, 4), (10, 100), (0, 3), (-5, 2), (95, 10), (101, 5), (1, 0), (4, -1), (7, None)),
+)
+def test_page_is_the_same_as_slice_of_sorted_data(user_schema, asc, start_index, count):
+    sorter = Sorter(AttrRep(attr="userName"), asc=asc)
+    data = [
+        {"userName": f"User{i % 13}", "id": str(i)} if i % 5 else {"id": str(i)} for i in range(100)
+    ]
+    start = max(start_index, 1) - 1
+    stop = None if count is None else start + max(count, 0)
+
+    actual = sorter.page(data, user_schema, start_index=start_index, count=count)
+
+    assert actual == sorter(data, user_schema)[start:stop]
+
+
+def test_page_of_data_with_many_schemas_is_the_same_as_slice_of_sorted_data(
+    user_schema, group_schema
+):
+    sorter = Sorter(AttrRep(attr="displayName"), asc=True)
+    data = [{"displayName": f"name_{i % 4}", "id": str(i)} for i in range(20)]
+    schemas = [user_schema if i % 3 else group_schema for i in range(20)]
+
+    actual = sorter.page(data, schemas, start_index=6, count=5)
+
+    assert actual == sorter(data, schemas)[5:10]
+
+
+@pytest.mark.parametrize("asc", (True, False))
+@pytest.mark.parametrize("run_size", (1, 7, 50, 100, 1000))
+def test_streamed_data_is_sorted_the_same_as_in_memory(user_schema, asc, run_size):
+    sorter = Sorter(AttrRep(attr="emails"), asc=asc)
+    data = [
+        {"id": str(i), "emails": [{"value": f"x{i % 3}"}, {"value": f"U{i % 11}", "primary": True}]}
+        if i % 6
+        else {"id": str(i)}
+        for i in range(100)
+    ]
+
+    actual = list(sorter.stream(iter(data), user_schema, run_size=run_size))
+
+    assert actual == sorter(data, user_schema)
+
+
+def test_streamed_data_with_many_schemas_is_sorted_the_same_as_in_memory(user_schema, group_schema):
+    sorter = Sorter(AttrRep(attr="displayName"), asc=True)
+    data = [{"displayName": f"Name_{i % 4}", "id": str(i)} for i in range(30)]
+    schemas = [user_schema if i % 3 else group_schema for i in range(30)]
+
+    actual = list(sorter.stream(data, schemas, run_size=4))
+
+    assert actual == sorter(data, schemas)
+
+
+def test_streaming_empty_data_returns_nothing(user_schema):
+    assert list(Sorter("userName").stream([], user_schema)) == []
+
+
+def test_value_error_is_raised_if_run_size_is_not_positive(user_schema):
+    with pytest.raises(ValueError, match="run_size must be greater than 0"):
+        Sorter("userName").stream([], user_schema, run_size=0)
+
+
+def test_streaming_fails_if_different_value_types(fake_schema, user_schema):
+    sorter = Sorter(AttrRep(attr="title"), asc=True)
+    data = [{"title": "b"}, {"title": "a"}, {"title": 1}, {"title": "c"}]
+    schemas = [user_schema, user_schema, fake_schema, user_schema]
+
+    with pytest.raises(TypeError):
+        list(sorter.stream(data, schemas, run_size=2))
+
+
+COMPOSITE_DATA = [
+    {
+        "id": str(i),
+        **({"title": f"Title{i % 3}"} if i % 4 else {}),
+        **({"userName": f"user{i % 5}"} if i % 7 else {}),
+        "emails": [{"value": f"E{i % 2}"}],
+    }
+    for i in range(60)
+]
+
+
+@pytest.mark.parametrize(
+    "keys",
+    (
+        [("title", True), ("userName", True)],
+        [("title", False), ("userName", True), ("id", False)],
+        [("userName", False), ("emails", True), ("id", True)],
+        [("unknown", True), ("title", False)],
+    ),
+)
+def test_composite_sorter_gives_the_same_order_as_consecutive_stable_sorts(user_schema, keys):
+    expected = COMPOSITE_DATA
+    for attr_rep, asc in reversed(keys):
+        expected = Sorter(attr_rep, asc)(expected, user_schema)
+
+    actual = CompositeSorter(keys)(COMPOSITE_DATA, user_schema)
+
+    assert actual == expected
+
+
+def test_composite_sorter_supports_pagination_and_streaming(user_schema, group_schema):
+    sorter = CompositeSorter([("displayName", False), ("id", True)])
+    data = [{"displayName": f"Name{i % 3}", "id": f"{i:02}"} for i in range(20)]
+    schemas = [user_schema if i % 2 else group_schema for i in range(20)]
+    expected = sorter(data, schemas)
+
+    assert [item["id"] for item in expected[:4]] == ["02", "05", "08", "11"]
+    assert sorter.page(data, schemas, start_index=5, count=3) == expected[4:7]
+    assert list(sorter.stream(data, schemas, run_size=3)) == expected
+
+
+def test_composite_sorter_exposes_keys():
+    sorter = CompositeSorter([("userName", True), (AttrRep(attr="id"), False)])
+
+    assert sorter.keys == [(AttrRep(attr="userName"), True), (AttrRep(attr="id"), False)]
+
+
+def test_value_error_is_raised_if_no_sort_keys_are_provided():
+    with pytest.raises(ValueError, match="at least one sort key must be provided"):
+        CompositeSorter([])
+
+
+@pytest.mark.parametrize(
+    ("data", "asc", "expected"),
+    (
+        ([], True, None),
+        ([{"userName": "a"}], True, None),
+        ([{"userName": "a"}, {"userName": "B"}, {}, {}], True, None),
+        ([{"userName": "a"}, {}, {"userName": "b"}], True, 2),
+        ([{"userName": "b"}, {"userName": "A"}, {"userName": "c"}], True, 1),
+        ([{}, {"userName": "B"}, {"userName": "b"}, {"userName": "a"}], False, None),
+        ([{"userName": "b"}, {}], False, 1),
+        ([{"userName": "c"}, {"userName": "b"}, {"userName": "d"}], False, 2),
+    ),
+)
+def test_first_out_of_order_item_is_found(user_schema, data, asc, expected):
+    sorter = Sorter(AttrRep(attr="userName"), asc=asc)
+
+    assert sorter.find_out_of_order(data, user_schema) == expected
+    assert (expected is None) == (sorter(data, user_schema) == data)
+
+
+def test_out_of_order_item_is_found_by_composite_sorter(user_schema, group_schema):
+    sorter = CompositeSorter([("displayName", True), ("id", False)])
+    data = [
+        {"displayName": "a", "id": "2"},
+        {"displayName": "a", "id": "1"},
+        {"displayName": "B", "id": "3"},
+        {"displayName": "b", "id": "4"},
+    ]
+    schemas = [user_schema, group_schema, user_schema, group_schema]
+
+    assert sorter.find_out_of_order(data, schemas) == 3
+    assert sorter.find_out_of_order(sorter(data, schemas), schemas) is None
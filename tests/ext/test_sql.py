@@ -0,0 +1,361 @@
+import sqlite3
+
+import pytest
+
+from scimpler.data.filter import Filter
+from scimpler.data.identifiers import BoundedAttrRep
+from scimpler.data.operator import (
+    BinaryAttributeOperator,
+    Operator,
+    UnaryAttributeOperator,
+)
+from scimpler.ext.sql import FilterTranslator, MultiValuedTable, WhereClause
+
+USERS = [
+    {
+        "id": "1",
+        "externalId": "AB-1",
+        "userName": "bjensen",
+        "nickName": "",
+        "title": "Tour Guide",
+        "active": True,
+        "name": {"givenName": "Barbara", "familyName": "Jensen"},
+        "emails": [
+            {"value": "bjensen@example.com", "type": "work", "primary": True},
+            {"value": "babs@jensen.org", "type": "home"},
+        ],
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {"employeeNumber": "42"},
+    },
+    {
+        "id": "2",
+        "externalId": "ab-2",
+        "userName": "John_Smith",
+        "nickName": "Johnny",
+        "active": False,
+        "name": {"givenName": ""},
+        "emails": [{"value": "john@example.org", "type": "work"}],
+    },
+    {
+        "id": "3",
+        "userName": "100%Alice",
+        "name": {"givenName": "Alice", "familyName": "Wonder"},
+    },
+    {
+        "id": "4",
+        "userName": "charlie",
+        "active": True,
+        "emails": [{"value": "charlie@EXAMPLE.com", "type": "home", "primary": False}],
+        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {"employeeNumber": "7"},
+    },
+]
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("PRAGMA case_sensitive_like = ON")
+    connection.execute(
+        "CREATE TABLE users (id TEXT, external_id TEXT, user_name TEXT, nick_name TEXT, "
+        "title TEXT, active BOOLEAN, given_name TEXT, family_name TEXT, employee_number TEXT)"
+    )
+    connection.execute(
+        "CREATE TABLE emails (user_id TEXT, value TEXT, type TEXT, is_primary BOOLEAN)"
+    )
+    for user in USERS:
+        name = user.get("name", {})
+        enterprise = user.get("urn:ietf:params:scim:schemas:extension:enterprise:2.0:User", {})
+        connection.execute(
+            "INSERT INTO users VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                user["id"],
+                user.get("externalId"),
+                user["userName"],
+                user.get("nickName"),
+                user.get("title"),
+                user.get("active"),
+                name.get("givenName"),
+                name.get("familyName"),
+                enterprise.get("employeeNumber"),
+            ),
+        )
+        for email in user.get("emails", []):
+            connection.execute(
+                "INSERT INTO emails VALUES (?, ?, ?, ?)",
+                (user["id"], email["value"], email["type"], email.get("primary")),
+            )
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def translator(user_schema):
+    attrs = user_schema.attrs
+    return FilterTranslator(
+        schema=user_schema,
+        columns={
+            attrs.id: "users.id",
+            attrs.externalId: "external_id",
+            attrs.userName: "user_name",
+            attrs.nickName: "nick_name",
+            attrs.title: "title",
+            attrs.active: "active",
+            attrs.name__givenName: "given_name",
+            attrs.name__familyName: "family_name",
+            attrs.employeeNumber: "employee_number",
+            attrs.emails: MultiValuedTable(
+                table="emails",
+                join_condition="emails.user_id = users.id",
+                columns={"value": "emails.value", "type": "emails.type", "primary": "is_primary"},
+            ),
+        },
+    )
+
+
+def _select(connection, clause: WhereClause) -> list[str]:
+    cursor = connection.execute(
+        f"SELECT users.id FROM users WHERE {clause.sql} ORDER BY users.id", clause.params
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+@pytest.mark.parametrize(
+    "filter_exp",
+    (
+        'userName eq "bjensen"',
+        'userName eq "BJensen"',
+        'userName ne "bjensen"',
+        'userName co "JEN"',
+        'userName sw "b"',
+        'userName ew "SMITH"',
+        'userName co "_"',
+        'userName co "%"',
+        'userName sw "john_"',
+        "userName pr",
+        "not (userName pr)",
+        "nickName pr",
+        "not (nickName pr)",
+        "title pr",
+        'title eq "tour guide"',
+        "active eq true",
+        "active eq false",
+        "not (active eq true)",
+        'name.givenName gt "B"',
+        'name.familyName le "Wonder"',
+        "name pr",
+        'name[givenName eq "barbara" or familyName sw "w"]',
+        'externalId sw "ab"',
+        'externalId sw "AB"',
+        'externalId eq "ab-2"',
+        'emails[type eq "work" and value co "@example.com"]',
+        'emails[not (type eq "work")]',
+        'not emails[type eq "work"]',
+        "emails[primary eq true]",
+        'emails co "example.org"',
+        'emails.value ew ".COM"',
+        'emails.type eq "home" and userName sw "c"',
+        "emails pr",
+        "not (emails pr)",
+        'urn:ietf:params:scim:schemas:extension:enterprise:2.0:User:employeeNumber eq "42"',
+        'urn:ietf:params:scim:schemas:extension:enterprise:2.0:User:employeeNumber eq "7" '
+        "or emails.primary eq true",
+        'unknown eq "value"',
+        'userName eq "bjensen" and unknown pr',
+        "userName eq null",
+        "userName ne null",
+        "userName eq 1",
+        "userName ne 1",
+        "userName gt 1",
+        'active eq "true"',
+        "active pr",
+        'userName eq "a\u0007b"',
+        'name eq "Barbara"',
+        'userName[value eq "bjensen"]',
+        'emails[unknown eq "x"]',
+        'emails[primary co "x"]',
+    ),
+)
+def test_translated_filter_selects_the_same_resources_as_filter(
+    connection, translator, user_schema, filter_exp
+):
+    filter_ = Filter.deserialize(filter_exp)
+    expected = [user["id"] for user in USERS if filter_(user, user_schema)]
+
+    clause = translator.translate(filter_)
+
+    assert _select(connection, clause) == expected
+
+
+def test_attribute_without_schema_uri_is_resolved_against_extensions(connection, translator):
+    clause = translator.translate(Filter.deserialize('employeeNumber eq "7"'))
+
+    assert clause.sql == "employee_number IS NOT NULL AND LOWER(employee_number) = ?"
+    assert _select(connection, clause) == ["4"]
+
+
+@pytest.mark.parametrize(
+    ("filter_exp", "expected_param"),
+    (
+        ('meta.lastModified gt "2011-05-13T06:42:34+02:00"', "2011-05-13T04:42:34+00:00"),
+        ('meta.lastModified eq "2011-05-13T04:42:34Z"', "2011-05-13T04:42:34+00:00"),
+        ('meta.lastModified le "2011-05-13T04:42:34.5-01:00"', "2011-05-13T05:42:34.500000+00:00"),
+        ('meta.lastModified lt "2011-05-13T04:42:34"', "2011-05-13T04:42:34"),
+        ('meta.lastModified ge "yesterday"', "yesterday"),
+    ),
+)
+def test_datetime_values_are_normalized_to_utc(user_schema, filter_exp, expected_param):
+    translator = FilterTranslator(
+        schema=user_schema, columns={user_schema.attrs.meta__lastModified: "last_modified"}
+    )
+
+    clause = translator.translate(Filter.deserialize(filter_exp))
+
+    assert clause.params == [expected_param]
+
+
+def test_filter_is_translated_to_parameterized_sql(translator):
+    clause = translator.translate(
+        Filter.deserialize('title sw "a\'; DROP TABLE users" or emails[type eq "work"]')
+    )
+
+    assert clause == WhereClause(
+        sql=(
+            "(title IS NOT NULL AND LOWER(title) LIKE ? ESCAPE '\\') OR "
+            "(EXISTS (SELECT 1 FROM emails WHERE emails.user_id = users.id AND "
+            "(emails.type IS NOT NULL AND LOWER(emails.type) = ?)))"
+        ),
+        params=["a'; drop table users%", "work"],
+    )
+
+
+def test_custom_placeholder_is_used(user_schema):
+    translator = FilterTranslator(
+        schema=user_schema, columns={user_schema.attrs.userName: "user_name"}, placeholder="%s"
+    )
+
+    clause = translator.translate(Filter.deserialize('userName eq "bjensen"'))
+
+    assert clause.sql == "user_name IS NOT NULL AND LOWER(user_name) = %s"
+
+
+@pytest.mark.parametrize(
+    ("filter_exp", "expected_message"),
+    (
+        ('displayName eq "Babs"', "no column mapped for .*displayName"),
+        ('ims[type eq "work"]', "no table mapped for multi-valued .*ims"),
+        (
+            'emails[display eq "work"]',
+            "no column mapped for 'display' sub-attribute of '.*emails'",
+        ),
+        ("x509Certificates pr", "no table mapped for multi-valued .*x509Certificates"),
+        (
+            "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User:manager pr",
+            "no column mapped for '.*manager' sub-attributes",
+        ),
+    ),
+)
+def test_value_error_is_raised_if_attribute_is_not_mapped(translator, filter_exp, expected_message):
+    with pytest.raises(ValueError, match=expected_message):
+        translator.translate(Filter.deserialize(filter_exp))
+
+
+def test_type_error_is_raised_for_operator_without_sql_equivalent(user_schema):
+    class Matches(BinaryAttributeOperator):
+        op = "matches"
+        supported_scim_types = {"string"}
+        supported_types = {str}
+
+        @staticmethod
+        def operator(attr_value, op_value) -> bool:
+            return False
+
+    translator = FilterTranslator(
+        schema=user_schema, columns={user_schema.attrs.userName: "user_name"}
+    )
+
+    with pytest.raises(TypeError, match="unsupported operator 'matches'"):
+        translator.translate(Filter(Matches(BoundedAttrRep(user_schema.schema, "userName"), "a")))
+
+
+def test_type_error_is_raised_for_unary_operator_without_sql_equivalent(user_schema):
+    class IsEmpty(UnaryAttributeOperator):
+        op = "isEmpty"
+        supported_scim_types = {"string"}
+        supported_types = {str}
+
+        @staticmethod
+        def operator(value) -> bool:
+            return value == ""
+
+    translator = FilterTranslator(
+        schema=user_schema, columns={user_schema.attrs.userName: "user_name"}
+    )
+
+    with pytest.raises(TypeError, match="unsupported operator 'isEmpty'"):
+        translator.translate(Filter(IsEmpty(BoundedAttrRep(user_schema.schema, "userName"))))
+
+
+def test_type_error_is_raised_for_unknown_filter_type(translator):
+    class Custom(Operator):
+        def match(self, value, schema_or_complex) -> bool:
+            return False
+
+    with pytest.raises(TypeError, match="unsupported filter type 'Custom'"):
+        translator.translate(Filter(Custom()))
+
+
+@pytest.mark.parametrize(
+    "filter_exp",
+    (
+        'str_mv eq "B"',
+        'str_mv co "a"',
+        "str_mv pr",
+        "not (str_mv pr)",
+        "c2_mv eq 1",
+        "c2_mv[int gt 1 and bool eq true]",
+        "c2_mv.int ge 2",
+        "c2_mv pr",
+    ),
+)
+def test_filter_on_multi_valued_attributes_is_translated_to_subqueries(fake_schema, filter_exp):
+    resources = [
+        {"id": "1", "str_mv": ["a", "b"], "c2_mv": [{"int": 1, "bool": True}]},
+        {"id": "2", "str_mv": [""], "c2_mv": [{"int": 2, "bool": True}, {"int": 3}]},
+        {"id": "3"},
+    ]
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE resources (id TEXT)")
+    connection.execute("CREATE TABLE str_mv (resource_id TEXT, value TEXT)")
+    connection.execute("CREATE TABLE c2_mv (resource_id TEXT, int INTEGER, bool BOOLEAN)")
+    for resource in resources:
+        connection.execute("INSERT INTO resources VALUES (?)", (resource["id"],))
+        for value in resource.get("str_mv", []):
+            connection.execute("INSERT INTO str_mv VALUES (?, ?)", (resource["id"], value))
+        for item in resource.get("c2_mv", []):
+            connection.execute(
+                "INSERT INTO c2_mv VALUES (?, ?, ?)",
+                (resource["id"], item["int"], item.get("bool")),
+            )
+    translator = FilterTranslator(
+        schema=fake_schema,
+        columns={
+            fake_schema.attrs.str_mv: MultiValuedTable(
+                table="str_mv",
+                join_condition="str_mv.resource_id = resources.id",
+                columns={"value": "str_mv.value"},
+            ),
+            fake_schema.attrs.c2_mv: MultiValuedTable(
+                table="c2_mv",
+                join_condition="c2_mv.resource_id = resources.id",
+                columns={"INT": "c2_mv.int", "bool": "c2_mv.bool"},
+            ),
+        },
+    )
+    filter_ = Filter.deserialize(filter_exp)
+    expected = [resource["id"] for resource in resources if filter_(resource, fake_schema)]
+
+    clause = translator.translate(filter_)
+
+    cursor = connection.execute(
+        f"SELECT id FROM resources WHERE {clause.sql} ORDER BY id", clause.params
+    )
+    assert [row[0] for row in cursor.fetchall()] == expected
@@ -1,3 +1,6 @@
+import io
+import json
+
 import pytest
 
 from scimpler.data.attr_value_presence import AttrValuePresenceConfig
@@ -330,3 +333,47 @@ def test_validate_resources_attribute_presence__fails_if_requested_attribute_not
     )
 
     assert issues.to_dict() == expected
+
+
+@pytest.mark.parametrize(
+    ("resources", "page"),
+    (
+        ([], {}),
+        ([], {"startIndex": 1, "itemsPerPage": 0}),
+        (["bad_type", {"schemas": ["unknown:schema"]}], {"startIndex": 2}),
+    ),
+)
+def test_list_response_is_encoded_to_json_the_same_way_as_serialized_one(
+    list_user_data, group_data_server, user_schema, group_schema, resources, page
+):
+    schema = list_response.ListResponseSchema(resource_schemas=[user_schema, group_schema])
+    resources = list_user_data["Resources"] + [group_data_server] + resources
+    data = {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:ListResponse"],
+        "totalResults": 42,
+        **page,
+        "Resources": resources,
+    }
+
+    encoded = "".join(
+        schema.iter_json(
+            resources=iter(resources),
+            total_results=42,
+            start_index=page.get("startIndex"),
+            items_per_page=page.get("itemsPerPage"),
+        )
+    )
+
+    assert encoded == json.dumps(schema.serialize(data).to_dict())
+
+
+def test_list_response_without_resources_is_encoded_to_json(user_schema):
+    schema = list_response.ListResponseSchema(resource_schemas=[user_schema])
+    output = io.StringIO()
+
+    schema.write_json(output, resources=[], total_results=0)
+
+    assert json.loads(output.getvalue()) == {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:ListResponse"],
+        "totalResults": 0,
+    }
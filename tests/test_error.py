@@ -1,5 +1,8 @@
+from copy import deepcopy
+
 import pytest
 
+from scimpler.data.identifiers import AttrName
 from scimpler.error import ValidationError, ValidationIssues, ValidationWarning
 
 
@@ -96,6 +99,144 @@ def test_errors_can_be_popped_by_location_and_codes():
     assert issues.to_dict() == {"c": {"d": {"_warnings": [{"code": 2}]}}}
 
 
+def test_invalid_locations_are_merged_and_accessed_by_location():
+    issues = ValidationIssues()
+    issues_ = ValidationIssues()
+    issues_.mark_invalid()
+    issues_.mark_invalid([0, "b"])
+
+    issues.merge(issues_, location=["a"])
+
+    assert set(issues.invalid_locations) == {("a",), ("a", 0, "b")}
+    assert set(issues.get(location=["a", 0]).invalid_locations) == {("b",)}
+    assert issues.is_invalid(["a", 1, "c"])
+    assert not issues.is_invalid(["c"])
+    assert not issues.is_invalid()
+
+
+def test_invalid_locations_are_found_in_copied_and_retrieved_issues():
+    issues = ValidationIssues()
+    issues.mark_invalid(["a", 1])
+
+    assert issues.copy().is_invalid(["a", 1, "b"])
+    assert issues.get(location=["a"]).is_invalid([1])
+    assert not issues.get(location=["a"]).is_invalid([0])
+
+
+def test_invalid_location_with_attr_name_is_found_by_str():
+    issues = ValidationIssues()
+    issues.mark_invalid([AttrName("userName")])
+    issues.mark_invalid([AttrName("name"), AttrName("givenName")])
+
+    assert issues.is_invalid(["userName"])
+    assert issues.is_invalid(["name", "givenName"])
+    assert not issues.is_invalid(["name", "familyName"])
+
+
+def test_invalid_locations_are_not_popped_together_with_errors():
+    issues = ValidationIssues()
+    issues.add_error(issue=ValidationError.bad_type("string"), proceed=False, location=["a"])
+    issues.mark_invalid(["a"])
+
+    issues.pop(error_codes=[2], location=["a"])
+
+    assert issues.to_dict() == {}
+    assert issues.is_invalid(["a"])
+
+
+def test_merging_errors_stops_proceeding_and_marks_parent_locations():
+    issues = ValidationIssues()
+    issues_ = ValidationIssues()
+    issues_.add_error(issue=ValidationError.bad_value_content(), proceed=True, location=["b"])
+
+    issues.merge(issues_, location=["a", 0])
+
+    assert issues.has_errors(["a"])
+    assert issues.has_errors(["a", 0, "b"])
+    assert not issues.has_errors(["a", 1])
+    assert not issues.has_errors(["a", 0, "b", "c"])
+    assert not issues.can_proceed(["a", 0, "b", "c"])
+    assert issues.can_proceed(["a"], ["a", 1])
+
+
+def test_location_has_no_errors_once_they_are_popped():
+    issues = ValidationIssues()
+    issues.add_error(issue=ValidationError.bad_value_content(), proceed=False, location=["a", "b"])
+    issues.add_error(issue=ValidationError.bad_value_syntax(), proceed=True, location=["a", "c"])
+
+    issues.pop(location=["a", "b"], error_codes=[4])
+
+    assert issues.has_errors(["a"])
+    assert not issues.has_errors(["a", "b"])
+    assert issues.can_proceed(["a", "b"], ["a", "c"])
+
+
+def test_empty_issues_do_not_share_storage():
+    issues, other = ValidationIssues(), ValidationIssues()
+
+    issues.merge(ValidationIssues(), location=["a"])
+    issues.add_warning(issue=ValidationWarning.missing(), location=["a"])
+
+    assert other.to_dict() == {}
+    assert not other.has_errors()
+    assert other.can_proceed()
+
+
+def test_deep_copied_empty_issues_do_not_share_storage():
+    issues = deepcopy(ValidationIssues())
+
+    issues.add_error(issue=ValidationError.bad_value_content(), proceed=False, location=["a"])
+    issues.add_warning(issue=ValidationWarning.missing(), location=["b"])
+
+    assert issues.to_dict() == {"a": {"_errors": [{"code": 4}]}, "b": {"_warnings": [{"code": 4}]}}
+    assert not issues.can_proceed(["a"])
+    assert ValidationIssues().to_dict() == {}
+
+
+def test_errors_are_counted_in_all_locations():
+    issues = ValidationIssues()
+    issues_ = ValidationIssues()
+    issues_.add_error(issue=ValidationError.bad_value_content(), proceed=True, location=["b"])
+    issues_.add_error(issue=ValidationError.bad_value_syntax(), proceed=True, location=["b"])
+    issues.add_error(issue=ValidationError.bad_type("string"), proceed=False, location=["a"])
+    issues.add_warning(issue=ValidationWarning.missing(), location=["a"])
+
+    issues.merge(issues_, location=["a"])
+
+    assert issues.error_count == 3
+    assert issues.get(location=["a", "b"]).error_count == 2
+    assert issues.limit_reached(3)
+    assert not issues.limit_reached(4)
+    assert not issues.limit_reached(None)
+
+    issues.pop(error_codes=[4], location=["a", "b"])
+
+    assert issues.error_count == 2
+
+
+def test_copied_issues_can_be_modified_independently(issues):
+    expected = issues.to_dict()
+
+    copied = issues.copy()
+    for _, errors in copied.errors:
+        for error in errors:
+            error.scim_error = None
+    copied.add_error(issue=ValidationError.missing(), proceed=True, location=["c"])
+
+    assert issues.to_dict() == expected
+    assert copied.to_dict() != expected
+
+
+def test_copy_of_empty_issues_is_new_instance():
+    issues = ValidationIssues()
+
+    copied = issues.copy()
+    copied.add_error(issue=ValidationError.missing(), proceed=True)
+
+    assert copied is not issues
+    assert issues.to_dict() == {}
+
+
 def test_issues_can_be_converted_to_dict(issues):
     expected = {
         "_errors": [{"code": 31, "message": "value or operation not supported", "context": {}}],
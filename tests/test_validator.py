@@ -1,5 +1,8 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
+from multiprocessing import get_context
 
 import pytest
 
@@ -13,7 +16,11 @@ from scimpler.data.operator import Present
 from scimpler.data.patch_path import PatchPath
 from scimpler.data.scim_data import Missing
 from scimpler.data.sorter import Sorter
-from scimpler.schemas import service_provider_config
+from scimpler.schemas import (
+    EnterpriseUserSchemaExtension,
+    UserSchema,
+    service_provider_config,
+)
 from scimpler.schemas.resource_type import ResourceTypeSchema
 from scimpler.schemas.schema import SchemaDefinitionSchema
 from scimpler.validator import (
@@ -28,6 +35,7 @@ from scimpler.validator import (
     SearchRequestPost,
     can_validate_filtering,
     can_validate_sorting,
+    create_executor,
 )
 from tests.conftest import CONFIG
 
@@ -460,7 +468,7 @@ def test_validate_resources_filtered__fields_from_schema_extensions_are_checked_
 
 def test_validate_resources_sorted__not_sorted(list_user_data, user_schema):
     sorter = Sorter(AttrRep(attr="name", sub_attr="familyName"), asc=False)
-    expected = {"body": {"Resources": {"_errors": [{"code": 22}]}}}
+    expected = {"body": {"Resources": {"1": {"_errors": [{"code": 22}]}}}}
 
     validator = ResourcesQuery(CONFIG, resource_schema=user_schema)
     issues = validator.validate_response(
@@ -499,7 +507,7 @@ def test_validate_resources_sorted__not_sorted_by_extended_attr(list_user_data,
         ),
         asc=False,
     )
-    expected = {"body": {"Resources": {"_errors": [{"code": 22}]}}}
+    expected = {"body": {"Resources": {"1": {"_errors": [{"code": 22}]}}}}
 
     validator = ResourcesQuery(CONFIG, resource_schema=user_schema)
     issues = validator.validate_response(
@@ -2411,3 +2419,390 @@ def test_request_data_validation_in_bulk_request_is_skipped(
     issues = validator.validate_request(body=data)
 
     assert issues.to_dict() == expected_issues
+
+
+def test_list_response_validation_stops_once_max_errors_are_found(user_schema):
+    validator = ResourcesQuery(CONFIG, resource_schema=user_schema)
+    data = {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:ListResponse"],
+        "totalResults": 3,
+        "Resources": [
+            {
+                "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+                "id": str(i),
+                "userName": 123,
+            }
+            for i in range(3)
+        ],
+    }
+
+    issues = validator.validate_response(status_code=200, body=data, max_errors=2)
+
+    assert issues.to_dict() == {
+        "body": {
+            "Resources": {
+                "0": {"userName": {"_errors": [{"code": 2}]}},
+                "1": {"userName": {"_errors": [{"code": 2}]}},
+            }
+        }
+    }
+
+
+def test_patch_request_validation_stops_once_max_errors_are_found(user_schema):
+    validator = ResourceObjectPatch(CONFIG, resource_schema=user_schema)
+    data = {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:PatchOp"],
+        "Operations": [
+            {"op": "add", "path": "userName", "value": 123},
+            {"op": "add", "path": "nickName", "value": 123},
+        ],
+    }
+
+    issues = validator.validate_request(data, max_errors=1)
+
+    assert issues.to_dict() == {
+        "body": {"Operations": {"0": {"value": {"_errors": [{"code": 2}]}}}}
+    }
+
+
+def test_bulk_request_validation_stops_once_max_errors_are_found(user_schema):
+    validator = BulkOperations(CONFIG, resource_schemas=[user_schema])
+    data = {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:BulkRequest"],
+        "Operations": [
+            {
+                "method": "POST",
+                "path": "/Users",
+                "bulkId": str(i),
+                "data": {
+                    "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+                    "userName": 123,
+                },
+            }
+            for i in range(3)
+        ],
+    }
+
+    issues = validator.validate_request(data, max_errors=1)
+
+    assert issues.to_dict() == {
+        "body": {"Operations": {"0": {"data": {"userName": {"_errors": [{"code": 2}]}}}}}
+    }
+
+
+def test_bulk_request_operations_are_not_traversed_once_max_errors_are_found(user_schema):
+    validator = BulkOperations(CONFIG, resource_schemas=[user_schema])
+    data = {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:BulkRequest"],
+        "Operations": [{"method": "CREATE", "path": "/Users"}] * 1000,
+    }
+
+    issues = validator.validate_request(data, max_errors=1)
+
+    assert issues.to_dict() == {
+        "body": {"Operations": {"0": {"method": {"_errors": [{"code": 9}]}}}}
+    }
+
+
+@pytest.mark.parametrize("max_errors", (0, -1))
+@pytest.mark.parametrize(
+    "create_validator",
+    (
+        lambda schema: Error(),
+        lambda schema: ResourceObjectGet(CONFIG, resource_schema=schema),
+        lambda schema: ResourceObjectPut(CONFIG, resource_schema=schema),
+        lambda schema: ResourcesPost(CONFIG, resource_schema=schema),
+        lambda schema: ResourcesQuery(CONFIG, resource_schema=schema),
+        lambda schema: SearchRequestPost(CONFIG, resource_schema=[schema]),
+        lambda schema: ResourceObjectPatch(CONFIG, resource_schema=schema),
+        lambda schema: ResourceObjectDelete(CONFIG),
+        lambda schema: BulkOperations(CONFIG, resource_schemas=[schema]),
+    ),
+)
+def test_value_error_is_raised_if_max_errors_is_lower_than_one(
+    user_schema, create_validator, max_errors
+):
+    validator = create_validator(user_schema)
+    match = "'max_errors' must be greater or equal to 1"
+
+    with pytest.raises(ValueError, match=match):
+        validator.validate_request({}, max_errors=max_errors)
+    with pytest.raises(ValueError, match=match):
+        validator.validate_response(status_code=200, body={}, max_errors=max_errors)
+    with pytest.raises(ValueError, match=match):
+        asyncio.run(validator.avalidate_request({}, max_errors=max_errors))
+    with pytest.raises(ValueError, match=match):
+        asyncio.run(validator.avalidate_response(status_code=200, body={}, max_errors=max_errors))
+
+
+def _list_response_data(n_resources):
+    return {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:ListResponse"],
+        "totalResults": n_resources,
+        "Resources": [
+            {
+                "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+                "id": str(i),
+                "userName": 123 if i % 7 == 0 else f"user{i}",
+            }
+            for i in range(n_resources)
+        ]
+        + [42, {"schemas": ["totally:unknown:schema"]}],
+    }
+
+
+def _bulk_request_data(n_operations):
+    return {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:BulkRequest"],
+        "Operations": [
+            {
+                "method": "POST",
+                "path": "/Users",
+                "bulkId": str(i),
+                "data": {
+                    "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+                    "userName": 123 if i % 5 == 0 else f"user{i}",
+                },
+            }
+            for i in range(n_operations)
+        ],
+    }
+
+
+def _bulk_response_data(n_operations):
+    return {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:BulkResponse"],
+        "Operations": [
+            {
+                "method": "POST",
+                "bulkId": str(i),
+                "location": f"https://example.com/v2/Users/{i}",
+                "version": 'W/"1"',
+                "status": "201",
+                "response": {
+                    "schemas": ["urn:ietf:params:scim:schemas:core:2.0:User"],
+                    "id": str(i),
+                    "userName": 123,
+                    "meta": {
+                        "resourceType": "User",
+                        "location": f"https://example.com/v2/Users/{i}",
+                        "version": 'W/"1"',
+                        "created": "2011-05-13T04:42:34Z",
+                        "lastModified": "2011-05-13T04:42:34Z",
+                    },
+                },
+            }
+            for i in range(n_operations)
+        ],
+    }
+
+
+@pytest.mark.parametrize("max_errors", (None, 1, 5, 17))
+def test_list_response_validation_with_executor_is_same_as_sequential(
+    user_schema, group_schema, max_errors
+):
+    validator = ResourcesQuery(CONFIG, resource_schema=[user_schema, group_schema])
+    data = _list_response_data(100)
+    expected = validator.validate_response(status_code=200, body=data, max_errors=max_errors)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        issues = validator.validate_response(
+            status_code=200, body=data, max_errors=max_errors, executor=executor, chunk_size=8
+        )
+
+    assert issues.to_dict() == expected.to_dict()
+
+
+@pytest.mark.parametrize("max_errors", (None, 1, 5, 17))
+def test_bulk_request_validation_with_executor_is_same_as_sequential(user_schema, max_errors):
+    validator = BulkOperations(CONFIG, resource_schemas=[user_schema])
+    data = _bulk_request_data(100)
+    expected = validator.validate_request(data, max_errors=max_errors)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        issues = validator.validate_request(
+            data, max_errors=max_errors, executor=executor, chunk_size=7
+        )
+
+    assert issues.to_dict() == expected.to_dict()
+
+
+@pytest.mark.parametrize("max_errors", (None, 1, 5, 17))
+def test_bulk_response_validation_with_executor_is_same_as_sequential(user_schema, max_errors):
+    validator = BulkOperations(CONFIG, resource_schemas=[user_schema])
+    data = _bulk_response_data(50)
+    expected = validator.validate_response(status_code=200, body=data, max_errors=max_errors)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        issues = validator.validate_response(
+            status_code=200, body=data, max_errors=max_errors, executor=executor, chunk_size=9
+        )
+
+    assert issues.to_dict() == expected.to_dict()
+
+
+def test_validation_with_process_pool_executor_is_same_as_sequential(user_schema, group_schema):
+    query_validator = ResourcesQuery(CONFIG, resource_schema=[user_schema, group_schema])
+    bulk_validator = BulkOperations(CONFIG, resource_schemas=[user_schema])
+    list_data = _list_response_data(30)
+    bulk_data = _bulk_request_data(30)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        list_issues = query_validator.validate_response(
+            status_code=200, body=list_data, executor=executor, chunk_size=8
+        )
+        bulk_issues = bulk_validator.validate_request(bulk_data, executor=executor, chunk_size=8)
+
+    assert (
+        list_issues.to_dict()
+        == query_validator.validate_response(status_code=200, body=list_data).to_dict()
+    )
+    assert bulk_issues.to_dict() == bulk_validator.validate_request(bulk_data).to_dict()
+
+
+def test_created_executor_can_be_used_for_validation(user_schema):
+    validator = BulkOperations(CONFIG, resource_schemas=[user_schema])
+    data = _bulk_request_data(10)
+
+    with create_executor(max_workers=2) as executor:
+        issues = validator.validate_request(data, executor=executor)
+
+    assert issues.to_dict() == validator.validate_request(data).to_dict()
+
+
+def test_created_executor_registers_schema_extensions_in_spawned_workers():
+    schema = UserSchema()
+    schema.extend(EnterpriseUserSchemaExtension())
+    validator = ResourcesQuery(CONFIG, resource_schema=schema)
+    data = {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:ListResponse"],
+        "totalResults": 4,
+        "Resources": [
+            {
+                "schemas": [
+                    "urn:ietf:params:scim:schemas:core:2.0:User",
+                    "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User",
+                ],
+                "id": str(i),
+                "userName": 123 if i % 2 == 0 else f"user{i}",
+                "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User": {
+                    "employeeNumber": i,
+                },
+            }
+            for i in range(4)
+        ],
+    }
+
+    with create_executor(max_workers=2, mp_context=get_context("spawn")) as executor:
+        issues = validator.validate_response(
+            status_code=200, body=data, executor=executor, chunk_size=1
+        )
+
+    assert issues.to_dict() == validator.validate_response(status_code=200, body=data).to_dict()
+
+
+@pytest.fixture(params=[None, ThreadPoolExecutor])
+def executor(request):
+    if request.param is None:
+        yield None
+        return
+    with request.param(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize("max_errors", (None, 1, 5, 17))
+def test_async_list_response_validation_is_same_as_sync(
+    user_schema, group_schema, executor, max_errors
+):
+    validator = ResourcesQuery(CONFIG, resource_schema=[user_schema, group_schema])
+    data = _list_response_data(100)
+    expected = validator.validate_response(status_code=200, body=data, max_errors=max_errors)
+
+    issues = asyncio.run(
+        validator.avalidate_response(
+            status_code=200, body=data, max_errors=max_errors, executor=executor, chunk_size=8
+        )
+    )
+
+    assert issues.to_dict() == expected.to_dict()
+
+
+@pytest.mark.parametrize("max_errors", (None, 1, 5, 17))
+def test_async_bulk_request_validation_is_same_as_sync(user_schema, executor, max_errors):
+    validator = BulkOperations(CONFIG, resource_schemas=[user_schema])
+    data = _bulk_request_data(100)
+    expected = validator.validate_request(data, max_errors=max_errors)
+
+    issues = asyncio.run(
+        validator.avalidate_request(data, max_errors=max_errors, executor=executor, chunk_size=7)
+    )
+
+    assert issues.to_dict() == expected.to_dict()
+
+
+@pytest.mark.parametrize("max_errors", (None, 1, 5, 17))
+def test_async_bulk_response_validation_is_same_as_sync(user_schema, executor, max_errors):
+    validator = BulkOperations(CONFIG, resource_schemas=[user_schema])
+    data = _bulk_response_data(50)
+    expected = validator.validate_response(status_code=200, body=data, max_errors=max_errors)
+
+    issues = asyncio.run(
+        validator.avalidate_response(
+            status_code=200, body=data, max_errors=max_errors, executor=executor, chunk_size=9
+        )
+    )
+
+    assert issues.to_dict() == expected.to_dict()
+
+
+def test_async_patch_request_validation_is_same_as_sync(user_schema, executor):
+    validator = ResourceObjectPatch(CONFIG, resource_schema=user_schema)
+    data = {
+        "schemas": ["urn:ietf:params:scim:api:messages:2.0:PatchOp"],
+        "Operations": [
+            {"op": "add", "path": "userName", "value": 123},
+            {"op": "add", "path": "nickName", "value": 123},
+        ],
+    }
+
+    issues = asyncio.run(validator.avalidate_request(data, executor=executor))
+
+    assert issues.to_dict() == validator.validate_request(data).to_dict()
+
+
+def test_async_list_response_validation_gives_control_back_to_event_loop(user_schema):
+    validator = ResourcesQuery(CONFIG, resource_schema=user_schema)
+    data = _list_response_data(100)
+    n_ticks = 0
+
+    async def tick():
+        nonlocal n_ticks
+        while True:
+            n_ticks += 1
+            await asyncio.sleep(0)
+
+    async def validate():
+        ticker = asyncio.create_task(tick())
+        await validator.avalidate_response(status_code=200, body=data, chunk_size=10)
+        ticker.cancel()
+
+    asyncio.run(validate())
+
+    assert n_ticks >= 10
+
+
+def test_async_resource_validation_gives_control_back_to_event_loop(user_schema):
+    validator = ResourceObjectPut(CONFIG, resource_schema=user_schema)
+    ticked = False
+
+    async def tick():
+        nonlocal ticked
+        ticked = True
+
+    async def validate():
+        ticker = asyncio.create_task(tick())
+        await validator.avalidate_request({"userName": "bjensen"})
+        assert ticked
+        await ticker
+
+    asyncio.run(validate())